@@ -573,14 +573,34 @@ def init_command(project_directory, minimal: bool, template: str):
 @click.option(
     "--no-access-log", is_flag=True, help="Disable the Uvicorn access log.",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.INT,
+    default=1,
+    help="Number of worker processes, each loading the feature repo separately [default: 1]",
+)
+@click.option(
+    "--threads",
+    type=click.INT,
+    default=None,
+    help="Maximum number of requests handled concurrently by each worker",
+)
 @click.pass_context
-def serve_command(ctx: click.Context, host: str, port: int, no_access_log: bool):
+def serve_command(
+    ctx: click.Context,
+    host: str,
+    port: int,
+    no_access_log: bool,
+    workers: int,
+    threads: Optional[int],
+):
     """Start a feature server locally on a given port."""
     repo = ctx.obj["CHDIR"]
     cli_check_repo(repo)
     store = FeatureStore(repo_path=str(repo))
 
-    store.serve(host, port, no_access_log)
+    store.serve(host, port, no_access_log, workers=workers, threads=threads)
 
 
 @cli.command("serve_transformations")
@@ -591,14 +611,21 @@ def serve_command(ctx: click.Context, host: str, port: int, no_access_log: bool)
     default=DEFAULT_FEATURE_TRANSFORMATION_SERVER_PORT,
     help="Specify a port for the server",
 )
+@click.option(
+    "--workers",
+    "-w",
+    type=click.INT,
+    default=0,
+    help="Number of processes used to run transformations. By default, transformations run in the server process.",
+)
 @click.pass_context
-def serve_transformations_command(ctx: click.Context, port: int):
+def serve_transformations_command(ctx: click.Context, port: int, workers: int):
     """[Experimental] Start a the feature consumption server locally on a given port."""
     repo = ctx.obj["CHDIR"]
     cli_check_repo(repo)
     store = FeatureStore(repo_path=str(repo))
 
-    store.serve_transformations(port)
+    store.serve_transformations(port, workers)
 
 
 @cli.group(name="alpha")
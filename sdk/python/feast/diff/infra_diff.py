@@ -21,6 +21,12 @@ InfraObjectProto = TypeVar(
     "InfraObjectProto", DatastoreTableProto, DynamoDBTableProto, SqliteTableProto
 )
 
+# Properties of infra objects which are updated in place, e.g. by migrating their data,
+# instead of by tearing down the current infra object.
+IN_PLACE_UPDATE_PROPERTIES = {
+    SqliteTableProto.DESCRIPTOR.full_name: {"table_layout"},
+}
+
 
 @dataclass
 class InfraObjectDiff(Generic[InfraObjectProto]):
@@ -31,6 +37,16 @@ class InfraObjectDiff(Generic[InfraObjectProto]):
     infra_object_property_diffs: List[PropertyDiff]
     transition_type: TransitionType
 
+    def is_in_place_update(self) -> bool:
+        """Returns whether only properties which are updated in place have changed."""
+        in_place_update_properties = IN_PLACE_UPDATE_PROPERTIES.get(
+            self.current_infra_object.DESCRIPTOR.full_name, set()
+        )
+        return all(
+            property_diff.property_name in in_place_update_properties
+            for property_diff in self.infra_object_property_diffs
+        )
+
 
 @dataclass
 class InfraDiff:
@@ -42,15 +58,15 @@ class InfraDiff:
     def update(self):
         """Apply the infrastructure changes specified in this object."""
         for infra_object_diff in self.infra_object_diffs:
-            if infra_object_diff.transition_type in [
-                TransitionType.DELETE,
-                TransitionType.UPDATE,
-            ]:
+            if infra_object_diff.transition_type == TransitionType.DELETE or (
+                infra_object_diff.transition_type == TransitionType.UPDATE
+                and not infra_object_diff.is_in_place_update()
+            ):
                 infra_object = InfraObject.from_proto(
                     infra_object_diff.current_infra_object
                 )
                 infra_object.teardown()
-            elif infra_object_diff.transition_type in [
+            if infra_object_diff.transition_type in [
                 TransitionType.CREATE,
                 TransitionType.UPDATE,
             ]:
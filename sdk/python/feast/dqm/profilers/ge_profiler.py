@@ -1,15 +1,20 @@
+import functools
 import json
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import dill
 import great_expectations as ge
 import numpy as np
 import pandas as pd
-from great_expectations.core import ExpectationSuite
+from great_expectations.core import (
+    ExpectationConfiguration,
+    ExpectationSuite,
+    ExpectationValidationResult,
+)
 from great_expectations.dataset import PandasDataset
-from great_expectations.profile.base import ProfilerTypeMapping
 
 from feast.dqm.profilers.profiler import (
+    BatchValidator,
     Profile,
     Profiler,
     ValidationError,
@@ -22,23 +27,68 @@ from feast.protos.feast.core.ValidationProfile_pb2 import (
     GEValidationProfiler as GEValidationProfilerProto,
 )
 
+# Samples are drawn with a fixed seed, so that profiling the same dataset twice gives the same results.
+SAMPLE_RANDOM_STATE = 42
+
+
+def _is_datetime(column: pd.Series) -> bool:
+    if pd.api.types.is_datetime64_any_dtype(column.dtype):
+        return True
+    return column.dtype == object and pd.api.types.infer_dtype(column, skipna=True) in (
+        "datetime",
+        "datetime64",
+    )
+
 
-def _prepare_dataset(dataset: PandasDataset) -> PandasDataset:
-    dataset_copy = dataset.copy(deep=True)
+def _format_datetimes(column: pd.Series) -> pd.Series:
+    if not pd.api.types.is_datetime64_any_dtype(column.dtype):
+        column = pd.to_datetime(column)
+    if column.dt.tz is not None:
+        # Keep the wall time, like strftime does.
+        column = column.dt.tz_localize(None)
+    formatted = np.datetime_as_string(
+        column.to_numpy().astype("datetime64[s]"), unit="s"
+    )
+    return pd.Series(formatted, index=column.index).where(column.notna())
 
-    for column in dataset.columns:
-        if dataset.expect_column_values_to_be_in_type_list(
-            column, type_list=sorted(list(ProfilerTypeMapping.DATETIME_TYPE_NAMES))
-        ).success:
+
+def _prepare_dataset(df: pd.DataFrame) -> PandasDataset:
+    # Converted columns are replaced rather than modified in place,
+    # so a shallow copy is enough to leave the original dataframe untouched.
+    dataset = PandasDataset(df.copy(deep=False))
+
+    for column in df.columns:
+        if _is_datetime(df[column]):
             # GE cannot parse Timestamp or other pandas datetime time
-            dataset_copy[column] = dataset[column].dt.strftime("%Y-%m-%dT%H:%M:%S")
+            dataset[column] = _format_datetimes(df[column])
 
-        if dataset[column].dtype == np.float32:
+        elif df[column].dtype == np.float32:
             # GE converts expectation arguments into native Python float
             # This could cause error on comparison => so better to convert to double prematurely
-            dataset_copy[column] = dataset[column].astype(np.float64)
+            dataset[column] = df[column].astype(np.float64)
+
+    return dataset
+
 
-    return dataset_copy
+def _sample(
+    df: pd.DataFrame, sample_size: Optional[int], stratify_by: Optional[List[str]],
+) -> pd.DataFrame:
+    """
+    Returns a random sample of about sample_size rows. If stratify_by is set, every combination
+    of values of these columns keeps its share of the rows, and at least one row.
+    """
+    if not sample_size or len(df) <= sample_size:
+        return df
+    if not stratify_by:
+        return df.sample(n=sample_size, random_state=SAMPLE_RANDOM_STATE)
+
+    shuffled = df.sample(frac=1, random_state=SAMPLE_RANDOM_STATE)
+    # Rows with missing values in the stratify_by columns form a stratum of their own.
+    strata = shuffled.groupby(stratify_by, sort=False).ngroup().fillna(-1).to_numpy()
+    groups = pd.Series(strata).groupby(strata)
+    # Shuffled rows are kept in order until each stratum has its share.
+    keep = groups.cumcount() < np.ceil(groups.transform("size") * sample_size / len(df))
+    return shuffled[keep.to_numpy()]
 
 
 class GEProfile(Profile):
@@ -48,37 +98,64 @@ class GEProfile(Profile):
     """
 
     expectation_suite: ExpectationSuite
+    sample_size: Optional[int]
+    stratify_by: Optional[List[str]]
 
-    def __init__(self, expectation_suite: ExpectationSuite):
+    def __init__(
+        self,
+        expectation_suite: ExpectationSuite,
+        sample_size: Optional[int] = None,
+        stratify_by: Optional[List[str]] = None,
+    ):
+        """
+        Args:
+            expectation_suite: The expectations which are validated.
+            sample_size (optional): If set, only a random sample of about this many rows is validated.
+            stratify_by (optional): Columns by which the sample is stratified.
+        """
         self.expectation_suite = expectation_suite
+        self.sample_size = sample_size
+        self.stratify_by = stratify_by
 
     def validate(self, df: pd.DataFrame) -> "GEValidationReport":
         """
         Validate provided dataframe against GE expectation suite.
-        1. Pandas dataframe is converted into PandasDataset (GE type)
-        2. Some fixes applied to the data to avoid crashes inside GE (see _prepare_dataset)
-        3. Each expectation from ExpectationSuite instance tested against resulting dataset
+        1. A sample is drawn from the dataframe if a sample size is configured
+        2. Pandas dataframe is converted into PandasDataset (GE type)
+        3. Some fixes applied to the data to avoid crashes inside GE (see _prepare_dataset)
+        4. Each expectation from ExpectationSuite instance tested against resulting dataset
 
         Return GEValidationReport, which parses great expectation's schema into list of generic ValidationErrors.
         """
-        dataset = PandasDataset(df)
+        sample = _sample(df, self.sample_size, self.stratify_by)
 
-        dataset = _prepare_dataset(dataset)
+        dataset = _prepare_dataset(sample)
 
         results = ge.validate(
             dataset, expectation_suite=self.expectation_suite, result_format="COMPLETE"
         )
-        return GEValidationReport(results)
+        return GEValidationReport(
+            results, sample_size=len(sample), dataset_size=len(df)
+        )
+
+    def batch_validator(self) -> "GEBatchValidator":
+        return GEBatchValidator(self)
 
     def to_proto(self):
         return GEValidationProfileProto(
-            expectation_suite=json.dumps(self.expectation_suite.to_json_dict()).encode()
+            expectation_suite=json.dumps(
+                self.expectation_suite.to_json_dict()
+            ).encode(),
+            sample_size=self.sample_size or 0,
+            stratify_by=self.stratify_by or [],
         )
 
     @classmethod
     def from_proto(cls, proto: GEValidationProfileProto) -> "GEProfile":
         return GEProfile(
-            expectation_suite=ExpectationSuite(**json.loads(proto.expectation_suite))
+            expectation_suite=ExpectationSuite(**json.loads(proto.expectation_suite)),
+            sample_size=proto.sample_size or None,
+            stratify_by=list(proto.stratify_by) or None,
         )
 
     def __repr__(self):
@@ -96,40 +173,329 @@ class GEProfiler(Profiler):
     """
 
     def __init__(
-        self, user_defined_profiler: Callable[[pd.DataFrame], ExpectationSuite]
+        self,
+        user_defined_profiler: Callable[[pd.DataFrame], ExpectationSuite],
+        sample_size: Optional[int] = None,
+        stratify_by: Optional[List[str]] = None,
     ):
+        """
+        Args:
+            user_defined_profiler: Function which builds the ExpectationSuite from a dataset.
+            sample_size (optional): If set, only a random sample of about this many rows is profiled,
+                and validated by the resulting profile.
+            stratify_by (optional): Columns by which the sample is stratified, so that every combination
+                of their values keeps its share of the rows.
+        """
         self.user_defined_profiler = user_defined_profiler
+        self.sample_size = sample_size
+        self.stratify_by = stratify_by
 
     def analyze_dataset(self, df: pd.DataFrame) -> Profile:
         """
         Generate GEProfile with ExpectationSuite (set of expectations)
         from a given pandas dataframe by applying user defined profiler.
 
+        If a sample size is configured, only a sample of the dataframe is analyzed.
         Some fixes are also applied to the dataset (see _prepare_dataset function) to make it compatible with GE.
 
         Return GEProfile
         """
-        dataset = PandasDataset(df)
-
-        dataset = _prepare_dataset(dataset)
+        dataset = _prepare_dataset(_sample(df, self.sample_size, self.stratify_by))
 
-        return GEProfile(expectation_suite=self.user_defined_profiler(dataset))
+        return GEProfile(
+            expectation_suite=self.user_defined_profiler(dataset),
+            sample_size=self.sample_size,
+            stratify_by=self.stratify_by,
+        )
 
     def to_proto(self):
         return GEValidationProfilerProto(
             profiler=GEValidationProfilerProto.UserDefinedProfiler(
                 body=dill.dumps(self.user_defined_profiler, recurse=True)
-            )
+            ),
+            sample_size=self.sample_size or 0,
+            stratify_by=self.stratify_by or [],
         )
 
     @classmethod
     def from_proto(cls, proto: GEValidationProfilerProto) -> "GEProfiler":
-        return GEProfiler(user_defined_profiler=dill.loads(proto.profiler.body))
+        return GEProfiler(
+            user_defined_profiler=dill.loads(proto.profiler.body),
+            sample_size=proto.sample_size or None,
+            stratify_by=list(proto.stratify_by) or None,
+        )
+
+
+# Expectations which are evaluated on every batch, with the results combined across batches.
+# Column map expectations check every value on its own, so their counts of unexpected values add up.
+_COLUMN_MAP_EXPECTATION_PREFIXES = (
+    "expect_column_values_to_",
+    "expect_column_value_lengths_to_",
+    "expect_column_pair_values_",
+    "expect_multicolumn_",
+    "expect_select_column_values_",
+)
+# Column map expectations which compare values across rows, and therefore also across batches.
+_CROSS_ROW_EXPECTATIONS = {
+    "expect_column_values_to_be_unique",
+    "expect_column_values_to_be_increasing",
+    "expect_column_values_to_be_decreasing",
+    "expect_compound_columns_to_be_unique",
+}
+# Expectations on the schema, which hold for the dataset if they hold for every batch.
+_SCHEMA_EXPECTATIONS = {
+    "expect_column_to_exist",
+    "expect_table_columns_to_match_ordered_list",
+    "expect_table_columns_to_match_set",
+    "expect_table_column_count_to_equal",
+    "expect_table_column_count_to_be_between",
+    "expect_column_values_to_be_of_type",
+    "expect_column_values_to_be_in_type_list",
+}
+# Aggregate expectations, by how their observed values are combined.
+_AGGREGATE_EXPECTATIONS: Dict[str, Callable[[List[Any]], Any]] = {
+    "expect_column_max_to_be_between": max,
+    "expect_column_min_to_be_between": min,
+    "expect_column_sum_to_be_between": sum,
+    "expect_table_row_count_to_be_between": sum,
+    "expect_table_row_count_to_equal": sum,
+}
+_MEAN_EXPECTATION = "expect_column_mean_to_be_between"
+# Same as the default of GE's SUMMARY result format.
+_PARTIAL_UNEXPECTED_COUNT = 20
+
+
+def _is_batch_mergeable(expectation_type: str) -> bool:
+    if expectation_type in _CROSS_ROW_EXPECTATIONS:
+        return False
+    return (
+        expectation_type in _SCHEMA_EXPECTATIONS
+        or expectation_type in _AGGREGATE_EXPECTATIONS
+        or expectation_type == _MEAN_EXPECTATION
+        or expectation_type.startswith(_COLUMN_MAP_EXPECTATION_PREFIXES)
+    )
+
+
+def _is_between(value: Any, kwargs: Dict[str, Any]) -> bool:
+    if value is None:
+        return False
+    min_value = kwargs.get("min_value")
+    max_value = kwargs.get("max_value")
+    if min_value is not None and (
+        value <= min_value if kwargs.get("strict_min") else value < min_value
+    ):
+        return False
+    if max_value is not None and (
+        value >= max_value if kwargs.get("strict_max") else value > max_value
+    ):
+        return False
+    return True
+
+
+def _non_missing_count(result: Dict[str, Any]) -> int:
+    return (result.get("element_count") or 0) - (result.get("missing_count") or 0)
+
+
+def _merge_results(
+    config: ExpectationConfiguration,
+    previous: ExpectationValidationResult,
+    current: ExpectationValidationResult,
+) -> ExpectationValidationResult:
+    """
+    Combines the results of an expectation for two parts of a dataset into the result for both.
+    """
+    for result in (previous, current):
+        if result.exception_info and result.exception_info.get("raised_exception"):
+            return result
+
+    expectation_type = config.expectation_type
+    if expectation_type in _SCHEMA_EXPECTATIONS:
+        return previous if not previous.success else current
+
+    kwargs = config.kwargs
+    merged: Dict[str, Any] = {}
+    for count in ("element_count", "missing_count", "unexpected_count"):
+        if count in previous.result:
+            # Aggregate expectations report the missing count as None.
+            counts = (previous.result[count], current.result.get(count))
+            merged[count] = None if None in counts else sum(counts)
+    if merged.get("missing_count") is not None and merged["element_count"]:
+        merged["missing_percent"] = (
+            merged["missing_count"] / merged["element_count"] * 100
+        )
+
+    if expectation_type == _MEAN_EXPECTATION:
+        weighted_means = [
+            (r.result["observed_value"], _non_missing_count(r.result))
+            for r in (previous, current)
+            if r.result.get("observed_value") is not None
+        ]
+        total_count = sum(count for _, count in weighted_means)
+        merged["observed_value"] = (
+            sum(mean * count for mean, count in weighted_means) / total_count
+            if total_count
+            else None
+        )
+        success = _is_between(merged["observed_value"], kwargs)
+    elif expectation_type in _AGGREGATE_EXPECTATIONS:
+        observed_values = [
+            r.result["observed_value"]
+            for r in (previous, current)
+            if r.result.get("observed_value") is not None
+        ]
+        merged["observed_value"] = (
+            _AGGREGATE_EXPECTATIONS[expectation_type](observed_values)
+            if observed_values
+            else None
+        )
+        if expectation_type == "expect_table_row_count_to_equal":
+            success = merged["observed_value"] == kwargs.get("value")
+        else:
+            success = _is_between(merged["observed_value"], kwargs)
+    else:
+        # Nulls only count as checked values for the expectations on nulls themselves, which
+        # do not report a missing count.
+        checked_count = merged["element_count"] - (merged.get("missing_count") or 0)
+        unexpected_count = merged["unexpected_count"]
+        merged["unexpected_percent"] = (
+            unexpected_count / checked_count * 100 if checked_count else None
+        )
+        merged["partial_unexpected_list"] = (
+            previous.result.get("partial_unexpected_list", [])
+            + current.result.get("partial_unexpected_list", [])
+        )[:_PARTIAL_UNEXPECTED_COUNT]
+        success = not checked_count or (
+            checked_count - unexpected_count
+        ) / checked_count >= kwargs.get("mostly", 1)
+
+    return ExpectationValidationResult(
+        success=bool(success), expectation_config=config, result=merged
+    )
+
+
+class GEBatchValidator(BatchValidator):
+    """
+    GEBatchValidator validates a dataset against a GEProfile batch by batch.
+
+    Expectations whose results can be combined (on the values of single rows, on the schema, and
+    on the min, max, sum, mean or number of rows) are evaluated on every batch as it is passed.
+    Other expectations are evaluated at the end, on the columns they need from all rows, or from
+    a uniform random sample of the rows if the profile has a sample size.
+    """
+
+    def __init__(self, profile: GEProfile):
+        self._profile = profile
+        self._expectations = profile.expectation_suite.expectations
+        self._results: Dict[int, ExpectationValidationResult] = {}
+        self._dataset_size = 0
+
+        self._deferred = [
+            index
+            for index, config in enumerate(self._expectations)
+            if not _is_batch_mergeable(config.expectation_type)
+        ]
+        self._sample_columns: Optional[List[str]] = []
+        for index in self._deferred:
+            kwargs = self._expectations[index].kwargs
+            columns = [
+                kwargs[k] for k in ("column", "column_A", "column_B") if k in kwargs
+            ]
+            columns += list(kwargs.get("column_list", []))
+            if not columns:
+                # Table expectations need all columns.
+                self._sample_columns = None
+                break
+            self._sample_columns += [
+                c for c in columns if c not in self._sample_columns
+            ]
+        self._sample: Optional[pd.DataFrame] = None
+        self._sample_keys = np.empty(0)
+        self._random = np.random.RandomState(SAMPLE_RANDOM_STATE)
+
+    def update(self, batch: pd.DataFrame):
+        self._dataset_size += len(batch)
+
+        if len(self._deferred) < len(self._expectations):
+            dataset = _prepare_dataset(batch)
+            for index, config in enumerate(self._expectations):
+                if index in self._deferred:
+                    continue
+                result = getattr(dataset, config.expectation_type)(
+                    **config.kwargs, result_format="SUMMARY", catch_exceptions=True
+                )
+                if index in self._results:
+                    result = _merge_results(config, self._results[index], result)
+                self._results[index] = result
+
+        if self._deferred:
+            self._add_to_sample(batch)
+
+    def _add_to_sample(self, batch: pd.DataFrame):
+        if self._sample_columns is not None:
+            batch = batch[[c for c in self._sample_columns if c in batch.columns]]
+        sample = (
+            batch
+            if self._sample is None
+            else pd.concat([self._sample, batch], ignore_index=True)
+        )
+        if not self._profile.sample_size:
+            self._sample = sample
+            return
+
+        # Every row gets a random key and the rows with the lowest keys are kept, which
+        # gives a uniform sample of the rows seen so far.
+        keys = np.concatenate(
+            [self._sample_keys, self._random.random_sample(len(batch))]
+        )
+        if len(keys) > self._profile.sample_size:
+            kept = np.sort(
+                np.argpartition(keys, self._profile.sample_size)[
+                    : self._profile.sample_size
+                ]
+            )
+            sample = sample.iloc[kept].reset_index(drop=True)
+            keys = keys[kept]
+        self._sample = sample
+        self._sample_keys = keys
+
+    def report(self) -> "GEValidationReport":
+        if not self._dataset_size and self._sample is None:
+            return self._profile.validate(pd.DataFrame())
+
+        results = dict(self._results)
+        sample_size = self._dataset_size
+        if self._deferred:
+            # Every batch is added to the sample when some expectations are deferred.
+            assert self._sample is not None
+            sample_size = len(self._sample)
+            dataset = _prepare_dataset(self._sample)
+            for index in self._deferred:
+                config = self._expectations[index]
+                results[index] = getattr(dataset, config.expectation_type)(
+                    **config.kwargs, result_format="COMPLETE", catch_exceptions=True
+                )
+
+        ordered_results = [results[index] for index in range(len(self._expectations))]
+        return GEValidationReport(
+            {
+                "success": all(result.success for result in ordered_results),
+                "results": ordered_results,
+            },
+            sample_size=sample_size,
+            dataset_size=self._dataset_size,
+        )
 
 
 class GEValidationReport(ValidationReport):
-    def __init__(self, validation_result: Dict[Any, Any]):
+    def __init__(
+        self,
+        validation_result: Dict[Any, Any],
+        sample_size: Optional[int] = None,
+        dataset_size: Optional[int] = None,
+    ):
         self._validation_result = validation_result
+        self.sample_size = sample_size
+        self.dataset_size = dataset_size
 
     @property
     def is_success(self) -> bool:
@@ -140,7 +506,7 @@ class GEValidationReport(ValidationReport):
         return [
             ValidationError(
                 check_name=res.expectation_config.expectation_type,
-                column_name=res.expectation_config.kwargs["column"],
+                column_name=res.expectation_config.kwargs.get("column"),
                 check_config=res.expectation_config.kwargs,
                 missing_count=res["result"].get("missing_count"),
                 missing_percent=res["result"].get("missing_percent"),
@@ -155,8 +521,30 @@ class GEValidationReport(ValidationReport):
             for res in self._validation_result["results"]
             if not res["success"]
         ]
-        return json.dumps(failed_expectations, indent=2)
+        return json.dumps(
+            {
+                "sample_size": self.sample_size,
+                "dataset_size": self.dataset_size,
+                "failed_expectations": failed_expectations,
+            },
+            indent=2,
+        )
 
 
-def ge_profiler(func):
-    return GEProfiler(user_defined_profiler=func)
+def ge_profiler(
+    func=None,
+    *,
+    sample_size: Optional[int] = None,
+    stratify_by: Optional[List[str]] = None,
+):
+    """
+    Decorator which turns a user defined profiler into a GEProfiler. It can be used with sampling
+    options as well, e.g. `@ge_profiler(sample_size=100_000)`.
+    """
+    if func is None:
+        return functools.partial(
+            ge_profiler, sample_size=sample_size, stratify_by=stratify_by
+        )
+    return GEProfiler(
+        user_defined_profiler=func, sample_size=sample_size, stratify_by=stratify_by
+    )
@@ -14,6 +14,14 @@ class Profile:
         """
         ...
 
+    def batch_validator(self) -> "BatchValidator":
+        """
+        Return BatchValidator, which validates a dataset that is passed in batches against current profile.
+
+        Profiles which can only validate complete datasets collect all batches first.
+        """
+        return _CollectingBatchValidator(self)
+
     @abc.abstractmethod
     def to_proto(self):
         ...
@@ -24,6 +32,36 @@ class Profile:
         ...
 
 
+class BatchValidator:
+    @abc.abstractmethod
+    def update(self, batch: pd.DataFrame):
+        """
+        Run rules / expectations against the next batch of the dataset.
+        """
+        ...
+
+    @abc.abstractmethod
+    def report(self) -> "ValidationReport":
+        """
+        Return ValidationReport for all batches passed so far.
+        """
+        ...
+
+
+class _CollectingBatchValidator(BatchValidator):
+    def __init__(self, profile: Profile):
+        self._profile = profile
+        self._batches: List[pd.DataFrame] = []
+
+    def update(self, batch: pd.DataFrame):
+        self._batches.append(batch)
+
+    def report(self) -> "ValidationReport":
+        if not self._batches:
+            return self._profile.validate(pd.DataFrame())
+        return self._profile.validate(pd.concat(self._batches, ignore_index=True))
+
+
 class Profiler:
     @abc.abstractmethod
     def analyze_dataset(self, dataset: pd.DataFrame) -> Profile:
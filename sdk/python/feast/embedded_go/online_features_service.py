@@ -10,7 +10,8 @@ from feast.errors import (
     RequestDataNotFoundInEntityRowsException,
 )
 from feast.feature_service import FeatureService
-from feast.online_response import OnlineResponse
+from feast.on_demand_feature_view import PYTHON_MODE
+from feast.online_response import ArrowOnlineResponse
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
 from feast.protos.feast.types import Value_pb2
 from feast.repo_config import RepoConfig
@@ -18,55 +19,18 @@ from feast.value_type import ValueType
 
 from .lib.embedded import DataTable, NewOnlineFeatureService, OnlineFeatureServiceConfig
 from .lib.go import Slice_string
+from .type_map import (
+    ARROW_LIST_TYPE_TO_PROTO_FIELD,
+    ARROW_LIST_TYPE_TO_PROTO_LIST_CLASS,
+    ARROW_TYPE_TO_PROTO_FIELD,
+    PROTO_TYPE_TO_ARROW_TYPE,
+    proto_to_arrow,
+)
 
 if TYPE_CHECKING:
     from feast.feature_store import FeatureStore
 
 
-ARROW_TYPE_TO_PROTO_FIELD = {
-    pa.int32(): "int32_val",
-    pa.int64(): "int64_val",
-    pa.float32(): "float_val",
-    pa.float64(): "double_val",
-    pa.bool_(): "bool_val",
-    pa.string(): "string_val",
-    pa.binary(): "bytes_val",
-    pa.time64("ns"): "unix_timestamp_val",
-}
-
-ARROW_LIST_TYPE_TO_PROTO_FIELD = {
-    pa.int32(): "int32_list_val",
-    pa.int64(): "int64_list_val",
-    pa.float32(): "float_list_val",
-    pa.float64(): "double_list_val",
-    pa.bool_(): "bool_list_val",
-    pa.string(): "string_list_val",
-    pa.binary(): "bytes_list_val",
-    pa.time64("ns"): "unix_timestamp_list_val",
-}
-
-ARROW_LIST_TYPE_TO_PROTO_LIST_CLASS = {
-    pa.int32(): Value_pb2.Int32List,
-    pa.int64(): Value_pb2.Int64List,
-    pa.float32(): Value_pb2.FloatList,
-    pa.float64(): Value_pb2.DoubleList,
-    pa.bool_(): Value_pb2.BoolList,
-    pa.string(): Value_pb2.StringList,
-    pa.binary(): Value_pb2.BytesList,
-    pa.time64("ns"): Value_pb2.Int64List,
-}
-
-# used for entity types only
-PROTO_TYPE_TO_ARROW_TYPE = {
-    ValueType.INT32: pa.int32(),
-    ValueType.INT64: pa.int64(),
-    ValueType.FLOAT: pa.float32(),
-    ValueType.DOUBLE: pa.float64(),
-    ValueType.STRING: pa.string(),
-    ValueType.BYTES: pa.binary(),
-}
-
-
 class EmbeddedOnlineFeatureServer:
     def __init__(
         self, repo_path: str, repo_config: RepoConfig, feature_store: "FeatureStore"
@@ -88,7 +52,7 @@ class EmbeddedOnlineFeatureServer:
         entities: Dict[str, Union[List[Any], Value_pb2.RepeatedValue]],
         request_data: Dict[str, Union[List[Any], Value_pb2.RepeatedValue]],
         full_feature_names: bool = False,
-    ):
+    ) -> ArrowOnlineResponse:
 
         if feature_service:
             join_keys_types = self._service.GetEntityTypesMapByFeatureService(
@@ -171,13 +135,13 @@ class EmbeddedOnlineFeatureServer:
         record_batch = pa.RecordBatch._import_from_c(
             features_ptr_array, features_ptr_schema
         )
-        resp = record_batch_to_online_response(record_batch)
-        return OnlineResponse(resp)
+        # The features are only converted into protos if the caller needs them.
+        return ArrowOnlineResponse(record_batch, record_batch_to_online_response)
 
 
 def _to_arrow(value, type_hint: Optional[ValueType]) -> pa.Array:
     if isinstance(value, Value_pb2.RepeatedValue):
-        _proto_to_arrow(value)
+        return proto_to_arrow(value.val, type_hint)
 
     if type_hint in PROTO_TYPE_TO_ARROW_TYPE:
         return pa.array(value, PROTO_TYPE_TO_ARROW_TYPE[type_hint])
@@ -185,13 +149,6 @@ def _to_arrow(value, type_hint: Optional[ValueType]) -> pa.Array:
     return pa.array(value)
 
 
-def _proto_to_arrow(value: Value_pb2.RepeatedValue) -> pa.Array:
-    """
-    ToDo: support entity rows already packed in protos
-    """
-    raise NotImplementedError
-
-
 def transformation_callback(
     fs: "FeatureStore",
     on_demand_feature_view_name: str,
@@ -205,10 +162,16 @@ def transformation_callback(
 
     input_record = pa.RecordBatch._import_from_c(input_arr_ptr, input_schema_ptr)
 
-    output = odfv.get_transformed_features_df(
-        input_record.to_pandas(), full_feature_names=full_feature_names
-    )
-    output_record = pa.RecordBatch.from_pandas(output)
+    if odfv.mode == PYTHON_MODE:
+        output_dict = odfv.get_transformed_features_dict(
+            input_record.to_pydict(), full_feature_names=full_feature_names
+        )
+        output_record = pa.RecordBatch.from_pydict(output_dict)
+    else:
+        output = odfv.get_transformed_features_df(
+            input_record.to_pandas(), full_feature_names=full_feature_names
+        )
+        output_record = pa.RecordBatch.from_pandas(output)
 
     output_record.schema._export_to_c(output_schema_ptr)
     output_record._export_to_c(output_arr_ptr)
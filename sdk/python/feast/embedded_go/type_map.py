@@ -0,0 +1,113 @@
+from typing import Optional, Sequence
+
+import pyarrow as pa
+
+from feast.protos.feast.types import Value_pb2
+from feast.value_type import ValueType
+
+ARROW_TYPE_TO_PROTO_FIELD = {
+    pa.int32(): "int32_val",
+    pa.int64(): "int64_val",
+    pa.float32(): "float_val",
+    pa.float64(): "double_val",
+    pa.bool_(): "bool_val",
+    pa.string(): "string_val",
+    pa.binary(): "bytes_val",
+    pa.time64("ns"): "unix_timestamp_val",
+}
+
+ARROW_LIST_TYPE_TO_PROTO_FIELD = {
+    pa.int32(): "int32_list_val",
+    pa.int64(): "int64_list_val",
+    pa.float32(): "float_list_val",
+    pa.float64(): "double_list_val",
+    pa.bool_(): "bool_list_val",
+    pa.string(): "string_list_val",
+    pa.binary(): "bytes_list_val",
+    pa.time64("ns"): "unix_timestamp_list_val",
+}
+
+ARROW_LIST_TYPE_TO_PROTO_LIST_CLASS = {
+    pa.int32(): Value_pb2.Int32List,
+    pa.int64(): Value_pb2.Int64List,
+    pa.float32(): Value_pb2.FloatList,
+    pa.float64(): Value_pb2.DoubleList,
+    pa.bool_(): Value_pb2.BoolList,
+    pa.string(): Value_pb2.StringList,
+    pa.binary(): Value_pb2.BytesList,
+    pa.time64("ns"): Value_pb2.Int64List,
+}
+
+PROTO_FIELD_TO_ARROW_TYPE = {
+    proto_field: arrow_type
+    for arrow_type, proto_field in ARROW_TYPE_TO_PROTO_FIELD.items()
+}
+
+PROTO_FIELD_TO_ARROW_LIST_TYPE = {
+    proto_field: pa.list_(arrow_type)
+    for arrow_type, proto_field in ARROW_LIST_TYPE_TO_PROTO_FIELD.items()
+}
+
+# used for entity types only
+PROTO_TYPE_TO_ARROW_TYPE = {
+    ValueType.INT32: pa.int32(),
+    ValueType.INT64: pa.int64(),
+    ValueType.FLOAT: pa.float32(),
+    ValueType.DOUBLE: pa.float64(),
+    ValueType.STRING: pa.string(),
+    ValueType.BYTES: pa.binary(),
+}
+
+
+def proto_to_arrow(
+    values: Sequence[Value_pb2.Value], type_hint: Optional[ValueType] = None
+) -> pa.Array:
+    """
+    Converts Value protos, e.g. of a RepeatedValue, into an arrow array of the type that the Go feature
+    server expects for them. Empty and null values are converted into nulls. If the type hint is a
+    scalar type, the array is cast to it, since for example JSON requests always contain 64 bit
+    integers.
+    """
+    # Empty values and explicit nulls, e.g. JSON nulls, are both converted into nulls.
+    proto_fields = {v.WhichOneof("val") or "null_val" for v in values}
+    has_nulls = "null_val" in proto_fields
+    proto_fields.discard("null_val")
+    if len(proto_fields) > 1:
+        raise TypeError(
+            f"Values of a single column must have a single type, got {sorted(proto_fields)}"
+        )
+
+    if not proto_fields:
+        if type_hint in PROTO_TYPE_TO_ARROW_TYPE:
+            return pa.nulls(len(values), PROTO_TYPE_TO_ARROW_TYPE[type_hint])
+        return pa.nulls(len(values))
+
+    (proto_field,) = proto_fields
+    if proto_field in PROTO_FIELD_TO_ARROW_LIST_TYPE:
+        arrow_type = PROTO_FIELD_TO_ARROW_LIST_TYPE[proto_field]
+        python_values = [
+            list(getattr(v, proto_field).val)
+            if not has_nulls or v.HasField(proto_field)
+            else None
+            for v in values
+        ]
+    else:
+        arrow_type = PROTO_FIELD_TO_ARROW_TYPE[proto_field]
+        python_values = [
+            getattr(v, proto_field)
+            if not has_nulls or v.HasField(proto_field)
+            else None
+            for v in values
+        ]
+
+    # Unix timestamps are passed as the number of seconds in a time64 column.
+    if arrow_type == pa.time64("ns"):
+        array = pa.array(python_values, pa.int64()).cast(arrow_type)
+    elif arrow_type == pa.list_(pa.time64("ns")):
+        array = pa.array(python_values, pa.list_(pa.int64())).cast(arrow_type)
+    else:
+        array = pa.array(python_values, arrow_type)
+
+    if type_hint in PROTO_TYPE_TO_ARROW_TYPE:
+        return array.cast(PROTO_TYPE_TO_ARROW_TYPE[type_hint])
+    return array
@@ -265,6 +265,13 @@ class RedshiftTableNameTooLong(Exception):
         )
 
 
+class DynamoDBUnprocessedItems(Exception):
+    def __init__(self, table_name: str, num_items: int):
+        super().__init__(
+            f"DynamoDB did not process {num_items} items written to table {table_name} after retrying."
+        )
+
+
 class SnowflakeCredentialsError(Exception):
     def __init__(self):
         super().__init__("Snowflake Connector failed due to incorrect credentials")
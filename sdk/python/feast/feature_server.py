@@ -1,56 +1,166 @@
+import os
 import traceback
+from typing import Any, Optional
 
+import pyarrow as pa
 import uvicorn
-from fastapi import FastAPI, HTTPException, Request
+from anyio import to_thread
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.logger import logger
-from fastapi.params import Depends
 from google.protobuf.json_format import MessageToDict, Parse
 
 import feast
 from feast import proto_json
-from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesRequest
+from feast.embedded_go.type_map import proto_to_arrow
+from feast.online_response import STATUS_SUFFIX, ArrowOnlineResponse, OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+)
 
+# Media types that can be used for requests and responses in addition to JSON, which
+# remains the default. Encoding and decoding large JSON payloads is CPU-intensive.
+PROTOBUF_MEDIA_TYPE = "application/x-protobuf"
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
 
-def get_app(store: "feast.FeatureStore"):
+# Environment variables used to configure the workers started by `feast serve --workers`.
+# Each worker process builds its own FeatureStore from the repo path after it starts.
+FEATURE_SERVER_REPO_PATH_ENV = "FEAST_FEATURE_SERVER_REPO_PATH"
+FEATURE_SERVER_THREADS_ENV = "FEAST_FEATURE_SERVER_THREADS"
+
+
+def parse_request(body: bytes, content_type: str) -> GetOnlineFeaturesRequest:
+    """Parses a request body encoded as JSON or, if specified, as binary protobuf."""
+    request_proto = GetOnlineFeaturesRequest()
+    if PROTOBUF_MEDIA_TYPE in content_type:
+        request_proto.ParseFromString(body)
+    else:
+        Parse(body, request_proto)
+    return request_proto
+
+
+def serialize_response(response: OnlineResponse, accept: str) -> Any:
+    """
+    Serializes a response in the format requested by the Accept header.
+
+    Binary protobuf responses contain the raw GetOnlineFeaturesResponse. Arrow responses
+    contain an Arrow IPC stream with a column of values and a column of FieldStatus values
+    ("<name>__status") per feature, where missing values are null. Otherwise, the response
+    is returned as a JSON-compatible dictionary.
+
+    Responses of the Go feature server are only converted into protos if they aren't
+    requested as Arrow streams.
+    """
+    if ARROW_STREAM_MEDIA_TYPE in accept:
+        if not isinstance(response, ArrowOnlineResponse):
+            response = _to_arrow_response(response.proto)
+        table = response.to_arrow(include_statuses=True)
+        sink = pa.BufferOutputStream()
+        writer = pa.ipc.new_stream(sink, table.schema)
+        writer.write_table(table)
+        writer.close()
+        return Response(
+            content=sink.getvalue().to_pybytes(), media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+    if PROTOBUF_MEDIA_TYPE in accept:
+        return Response(
+            content=response.proto.SerializeToString(), media_type=PROTOBUF_MEDIA_TYPE
+        )
+    return MessageToDict(  # type: ignore
+        response.proto, preserving_proto_field_name=True, float_precision=18
+    )
+
+
+def _to_arrow_response(
+    response_proto: GetOnlineFeaturesResponse,
+) -> ArrowOnlineResponse:
+    """
+    Converts a response into a record batch in the layout of the Go feature server, with
+    columns built from the feature vectors instead of from Python values. The event
+    timestamps are left out, since they aren't serialized.
+    """
+    names = []
+    columns = []
+    for feature_ref, feature_vector in zip(
+        response_proto.metadata.feature_names.val, response_proto.results
+    ):
+        names.extend([feature_ref, feature_ref + STATUS_SUFFIX])
+        columns.extend(
+            [
+                proto_to_arrow(feature_vector.values),
+                pa.array(feature_vector.statuses, pa.int32()),
+            ]
+        )
+    record_batch = pa.RecordBatch.from_arrays(columns, names=names)
+    return ArrowOnlineResponse(record_batch, lambda _: response_proto)
+
+
+def get_app(store: "feast.FeatureStore", threads: Optional[int] = None):
+    """
+    Creates the feature server application.
+
+    Online reads are blocking, so requests are handled on a thread pool to keep the
+    event loop free to accept new requests.
+
+    Args:
+        store: The feature store used to serve features.
+        threads: The maximum number of requests handled concurrently by this process,
+            which also bounds the number of concurrent online store connections. Defaults
+            to the thread pool size of the event loop.
+    """
     proto_json.patch()
 
     app = FastAPI()
 
-    async def get_body(request: Request):
-        return await request.body()
+    @app.on_event("startup")
+    def set_thread_pool_size():
+        if threads:
+            to_thread.current_default_thread_limiter().total_tokens = threads
+
+    @app.on_event("startup")
+    def warm_up_online_store():
+        # The startup events run in every worker process.
+        store.warm_up_online_store()
+
+    def _get_online_features(body: bytes, content_type: str, accept: str) -> Any:
+        # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
+        request_proto = parse_request(body, content_type)
+
+        # Initialize parameters for FeatureStore.get_online_features(...) call
+        if request_proto.HasField("feature_service"):
+            features = store.get_feature_service(
+                request_proto.feature_service, allow_cache=True
+            )
+        else:
+            features = list(request_proto.features.val)
+
+        full_feature_names = request_proto.full_feature_names
+
+        batch_sizes = [len(v.val) for v in request_proto.entities.values()]
+        num_entities = batch_sizes[0]
+        if any(batch_size != num_entities for batch_size in batch_sizes):
+            raise HTTPException(status_code=500, detail="Uneven number of columns")
+
+        response = store._get_online_features(
+            features,
+            request_proto.entities,
+            full_feature_names=full_feature_names,
+            native_entity_values=False,
+        )
+
+        # Convert the response to the requested format and return it
+        return serialize_response(response, accept)
 
     @app.post("/get-online-features")
-    def get_online_features(body=Depends(get_body)):
+    async def get_online_features(request: Request):
         try:
-            # Validate and parse the request data into GetOnlineFeaturesRequest Protobuf object
-            request_proto = GetOnlineFeaturesRequest()
-            Parse(body, request_proto)
-
-            # Initialize parameters for FeatureStore.get_online_features(...) call
-            if request_proto.HasField("feature_service"):
-                features = store.get_feature_service(
-                    request_proto.feature_service, allow_cache=True
-                )
-            else:
-                features = list(request_proto.features.val)
-
-            full_feature_names = request_proto.full_feature_names
-
-            batch_sizes = [len(v.val) for v in request_proto.entities.values()]
-            num_entities = batch_sizes[0]
-            if any(batch_size != num_entities for batch_size in batch_sizes):
-                raise HTTPException(status_code=500, detail="Uneven number of columns")
-
-            response_proto = store._get_online_features(
-                features,
-                request_proto.entities,
-                full_feature_names=full_feature_names,
-                native_entity_values=False,
-            ).proto
-
-            # Convert the Protobuf object to JSON and return it
-            return MessageToDict(  # type: ignore
-                response_proto, preserving_proto_field_name=True, float_precision=18
+            body = await request.body()
+            return await run_in_threadpool(
+                _get_online_features,
+                body,
+                request.headers.get("content-type", ""),
+                request.headers.get("accept", ""),
             )
         except Exception as e:
             # Print the original exception on the server side
@@ -61,8 +171,54 @@ def get_app(store: "feast.FeatureStore"):
     return app
 
 
+def get_worker_app():
+    """
+    Creates the application of a single `feast serve` worker process.
+
+    Worker processes are started by uvicorn, so the feature store and registry (and
+    therefore any online store connections) are created in the worker itself instead of
+    being inherited from the parent process.
+    """
+    store = feast.FeatureStore(repo_path=os.environ[FEATURE_SERVER_REPO_PATH_ENV])
+    # Load the registry before accepting requests, so that the first request served by
+    # each worker does not pay for it.
+    store.refresh_registry()
+    threads = os.environ.get(FEATURE_SERVER_THREADS_ENV)
+    return get_app(store, int(threads) if threads else None)
+
+
 def start_server(
-    store: "feast.FeatureStore", host: str, port: int, no_access_log: bool
+    store: "feast.FeatureStore",
+    host: str,
+    port: int,
+    no_access_log: bool,
+    workers: int = 1,
+    threads: Optional[int] = None,
 ):
-    app = get_app(store)
-    uvicorn.run(app, host=host, port=port, access_log=(not no_access_log))
+    """
+    Starts the feature server.
+
+    Args:
+        store: The feature store used to serve features.
+        host: The host to bind to.
+        port: The port to bind to.
+        no_access_log: Whether to disable the access log.
+        workers: The number of worker processes. If larger than one, each worker loads
+            the feature repo of the store independently.
+        threads: The maximum number of requests handled concurrently by each worker.
+    """
+    if workers > 1:
+        os.environ[FEATURE_SERVER_REPO_PATH_ENV] = str(store.repo_path)
+        if threads:
+            os.environ[FEATURE_SERVER_THREADS_ENV] = str(threads)
+        uvicorn.run(
+            "feast.feature_server:get_worker_app",
+            factory=True,
+            host=host,
+            port=port,
+            access_log=(not no_access_log),
+            workers=workers,
+        )
+    else:
+        app = get_app(store, threads)
+        uvicorn.run(app, host=host, port=port, access_log=(not no_access_log))
@@ -62,13 +62,17 @@ from feast.feature_view import (
     FeatureView,
 )
 from feast.inference import (
+    DataSourceSchemas,
     update_data_sources_with_inferred_event_timestamp_col,
     update_entities_with_inferred_types_from_feature_views,
     update_feature_views_with_inferred_features,
 )
 from feast.infra.infra_object import Infra
+from feast.infra.offline_stores.offline_store import ChunkedRetrievalJob
+from feast.infra.offline_stores.offline_utils import split_entity_df_by_time_range
+from feast.infra.offline_stores.retrieval_cache import RetrievalCache
 from feast.infra.provider import Provider, RetrievalJob, get_provider
-from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.on_demand_feature_view import PYTHON_MODE, OnDemandFeatureView
 from feast.online_response import OnlineResponse
 from feast.protos.feast.core.InfraObject_pb2 import Infra as InfraProto
 from feast.protos.feast.serving.ServingService_pb2 import (
@@ -176,6 +180,18 @@ class FeatureStore:
 
         self._registry = registry
 
+    @log_exceptions_and_usage
+    def warm_up_online_store(self):
+        """Opens the connections to the online store ahead of the first online reads.
+
+        The first online reads otherwise pay for connecting to the online store. The connections aren't shared with
+        forked processes, which open their own, so servers which fork worker processes should call this method in
+        every worker. Failures to connect are logged rather than raised, and are raised by the reads instead.
+        """
+        self._get_provider().warm_up_online_store(
+            self.config, self._list_feature_views(allow_cache=True)
+        )
+
     @log_exceptions_and_usage
     def list_entities(self, allow_cache: bool = False) -> List[Entity]:
         """
@@ -351,12 +367,15 @@ class FeatureStore:
         return feature_view
 
     @log_exceptions_and_usage
-    def get_on_demand_feature_view(self, name: str) -> OnDemandFeatureView:
+    def get_on_demand_feature_view(
+        self, name: str, allow_registry_cache: bool = False
+    ) -> OnDemandFeatureView:
         """
         Retrieves a feature view.
 
         Args:
             name: Name of feature view.
+            allow_registry_cache: (Optional) Whether to allow returning this feature view from a cached registry
 
         Returns:
             The specified feature view.
@@ -364,7 +383,9 @@ class FeatureStore:
         Raises:
             FeatureViewNotFoundException: The feature view could not be found.
         """
-        return self._registry.get_on_demand_feature_view(name, self.project)
+        return self._registry.get_on_demand_feature_view(
+            name, self.project, allow_cache=allow_registry_cache
+        )
 
     @log_exceptions_and_usage
     def get_data_source(self, name: str) -> DataSource:
@@ -473,22 +494,25 @@ class FeatureStore:
         odfvs_to_update: List[OnDemandFeatureView],
     ):
         """Makes inferences for entities, feature views, and odfvs."""
+        # The schema of every data source is read at most once for all inferences.
+        schemas = DataSourceSchemas(self.config)
+
         update_entities_with_inferred_types_from_feature_views(
-            entities_to_update, views_to_update, self.config
+            entities_to_update, views_to_update, self.config, schemas
         )
 
         update_data_sources_with_inferred_event_timestamp_col(
-            data_sources_to_update, self.config
+            data_sources_to_update, self.config, schemas
         )
 
         update_data_sources_with_inferred_event_timestamp_col(
-            [view.batch_source for view in views_to_update], self.config
+            [view.batch_source for view in views_to_update], self.config, schemas
         )
 
         # New feature views may reference previously applied entities.
         entities = self._list_entities()
         update_feature_views_with_inferred_features(
-            views_to_update, entities + entities_to_update, self.config
+            views_to_update, entities + entities_to_update, self.config, schemas
         )
 
         for odfv in odfvs_to_update:
@@ -790,6 +814,8 @@ class FeatureStore:
         entity_df: Union[pd.DataFrame, str],
         features: Union[List[str], FeatureService],
         full_feature_names: bool = False,
+        entity_df_chunk_size: Optional[int] = None,
+        max_workers: int = 1,
     ) -> RetrievalJob:
         """Enrich an entity dataframe with historical feature values for either training or batch scoring.
 
@@ -815,6 +841,10 @@ class FeatureStore:
             full_feature_names: If True, feature names will be prefixed with the corresponding feature view name,
                 changing them from the format "feature" to "feature_view__feature" (e.g. "daily_transactions"
                 changes to "customer_fv__daily_transactions").
+            entity_df_chunk_size (optional): If set, an entity dataframe with more rows is split into chunks of at
+                most this many rows, each covering a separate time range. Features are retrieved separately for each
+                chunk, which limits the amount of source data that is scanned and held in memory at once.
+            max_workers: The maximum number of chunks for which features are retrieved in parallel.
 
         Returns:
             RetrievalJob which can be used to materialize the results.
@@ -900,15 +930,42 @@ class FeatureStore:
         _feature_refs = [ref for ref in _feature_refs if ref not in request_fv_refs]
         provider = self._get_provider()
 
-        job = provider.get_historical_features(
-            self.config,
-            feature_views,
-            _feature_refs,
-            entity_df,
-            self._registry,
-            self.project,
-            full_feature_names,
-        )
+        if (
+            entity_df_chunk_size
+            and isinstance(entity_df, pd.DataFrame)
+            and len(entity_df) > entity_df_chunk_size
+        ):
+            job: RetrievalJob = ChunkedRetrievalJob(
+                [
+                    provider.get_historical_features(
+                        self.config,
+                        feature_views,
+                        _feature_refs,
+                        entity_df_chunk,
+                        self._registry,
+                        self.project,
+                        full_feature_names,
+                    )
+                    for entity_df_chunk in split_entity_df_by_time_range(
+                        entity_df, entity_df_chunk_size
+                    )
+                ],
+                max_workers=max_workers,
+            )
+        else:
+            job = provider.get_historical_features(
+                self.config,
+                feature_views,
+                _feature_refs,
+                entity_df,
+                self._registry,
+                self.project,
+                full_feature_names,
+            )
+        if self.config.retrieval_cache:
+            job = RetrievalCache(self.config).wrap(
+                job, feature_views, _feature_refs, entity_df, full_feature_names
+            )
 
         return job
 
@@ -1284,6 +1341,22 @@ class FeatureStore:
                 except KeyError as e:
                     raise ValueError("All entity_rows must have the same keys.") from e
 
+        return self._get_online_features(
+            features=features,
+            entity_values=columnar,
+            full_feature_names=full_feature_names,
+            native_entity_values=True,
+        )
+
+    def _get_online_features(
+        self,
+        features: Union[List[str], FeatureService],
+        entity_values: Mapping[
+            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
+        ],
+        full_feature_names: bool = False,
+        native_entity_values: bool = True,
+    ):
         # If Go feature server is enabled, send request to it instead of going through a regular Python logic
         if self.config.go_feature_server:
             from feast.embedded_go.online_features_service import (
@@ -1296,32 +1369,24 @@ class FeatureStore:
                     str(self.repo_path.absolute()), self.config, self
                 )
 
+            entities: Dict[str, Union[List[Any], RepeatedValue]] = {}
+            for k, v in entity_values.items():
+                if isinstance(v, RepeatedValue):
+                    entities[k] = v
+                elif native_entity_values:
+                    entities[k] = list(v)
+                else:
+                    entities[k] = RepeatedValue(val=v)
             return self._go_server.get_online_features(
                 features_refs=features if isinstance(features, list) else [],
                 feature_service=features
                 if isinstance(features, FeatureService)
                 else None,
-                entities=columnar,
+                entities=entities,
                 request_data={},  # TODO: add request data parameter to public API
                 full_feature_names=full_feature_names,
             )
 
-        return self._get_online_features(
-            features=features,
-            entity_values=columnar,
-            full_feature_names=full_feature_names,
-            native_entity_values=True,
-        )
-
-    def _get_online_features(
-        self,
-        features: Union[List[str], FeatureService],
-        entity_values: Mapping[
-            str, Union[Sequence[Any], Sequence[Value], RepeatedValue]
-        ],
-        full_feature_names: bool = False,
-        native_entity_values: bool = True,
-    ):
         _feature_refs = self._get_features(features, allow_cache=True)
         (
             requested_feature_views,
@@ -1801,25 +1866,38 @@ class FeatureStore:
                 )
 
         initial_response = OnlineResponse(online_features_response)
-        initial_response_df = initial_response.to_df()
+        # The initial response is converted lazily, since "python" mode odfvs do not
+        # need a dataframe and "pandas" mode odfvs do not need a dictionary.
+        initial_response_df: Optional[pd.DataFrame] = None
+        initial_response_dict: Optional[Dict[str, List[Any]]] = None
 
         # Apply on demand transformations and augment the result rows
         odfv_result_names = set()
         for odfv_name, _feature_refs in odfv_feature_refs.items():
             odfv = requested_odfv_map[odfv_name]
-            transformed_features_df = odfv.get_transformed_features_df(
-                initial_response_df, full_feature_names,
-            )
-            selected_subset = [
-                f for f in transformed_features_df.columns if f in _feature_refs
-            ]
-
-            proto_values = [
-                python_values_to_proto_values(
-                    transformed_features_df[feature].values, ValueType.UNKNOWN
+            transformed_features: Mapping[str, Any]
+            if odfv.mode == PYTHON_MODE:
+                if initial_response_dict is None:
+                    initial_response_dict = initial_response.to_dict()
+                transformed_features = odfv.get_transformed_features_dict(
+                    initial_response_dict, full_feature_names,
+                )
+            else:
+                if initial_response_df is None:
+                    initial_response_df = initial_response.to_df()
+                transformed_features = odfv.get_transformed_features_df(
+                    initial_response_df, full_feature_names,
+                )
+            selected_subset = [f for f in transformed_features if f in _feature_refs]
+
+            proto_values = []
+            for feature in selected_subset:
+                feature_values = transformed_features[feature]
+                if isinstance(feature_values, pd.Series):
+                    feature_values = feature_values.values
+                proto_values.append(
+                    python_values_to_proto_values(feature_values, ValueType.UNKNOWN)
                 )
-                for feature in selected_subset
-            ]
 
             odfv_result_names |= set(selected_subset)
 
@@ -1925,9 +2003,18 @@ class FeatureStore:
         return views_to_use
 
     @log_exceptions_and_usage
-    def serve(self, host: str, port: int, no_access_log: bool) -> None:
+    def serve(
+        self,
+        host: str,
+        port: int,
+        no_access_log: bool,
+        workers: int = 1,
+        threads: Optional[int] = None,
+    ) -> None:
         """Start the feature consumption server locally on a given port."""
-        feature_server.start_server(self, host, port, no_access_log)
+        feature_server.start_server(
+            self, host, port, no_access_log, workers=workers, threads=threads
+        )
 
     @log_exceptions_and_usage
     def get_feature_server_endpoint(self) -> Optional[str]:
@@ -1935,14 +2022,14 @@ class FeatureStore:
         return self._provider.get_feature_server_endpoint()
 
     @log_exceptions_and_usage
-    def serve_transformations(self, port: int) -> None:
+    def serve_transformations(self, port: int, transformation_workers: int = 0) -> None:
         """Start the feature transformation server locally on a given port."""
         if not flags_helper.enable_on_demand_feature_views(self.config):
             raise ExperimentalFeatureNotEnabled(flags.FLAG_ON_DEMAND_TRANSFORM_NAME)
 
         from feast import transformation_server
 
-        transformation_server.start_server(self, port)
+        transformation_server.start_server(self, port, transformation_workers)
 
     def _teardown_go_server(self):
         self._go_server = None
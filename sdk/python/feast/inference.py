@@ -1,5 +1,11 @@
+import hashlib
+import json
+import os
 import re
-from typing import List
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from feast import (
     BigQuerySource,
@@ -12,12 +18,125 @@ from feast import (
 from feast.data_source import DataSource, RequestSource
 from feast.errors import RegistryInferenceFailure
 from feast.feature_view import FeatureView
+from feast.infra.offline_stores.file_source import get_file_source_version
 from feast.repo_config import RepoConfig
 from feast.value_type import ValueType
 
+# Schema lookups mostly wait on the offline store, so they run on more threads than there are cores.
+MAX_CONCURRENT_SCHEMA_LOOKUPS = 16
+
+
+class DataSourceSchemas:
+    """
+    The column names and types of data sources, which are looked up at most once for every
+    distinct source definition. Lookups of several sources run concurrently. If the config
+    has a schema cache, the schemas of local file sources are also cached across runs, until
+    their files change.
+    """
+
+    def __init__(self, config: RepoConfig):
+        self._config = config
+        self._schemas: Dict[str, "Future[List[Tuple[str, str]]]"] = {}
+        # The definition keys of the data sources by their ids. The data sources are kept, so
+        # that their ids are not reused.
+        self._keys: Dict[int, Tuple[DataSource, str]] = {}
+
+        self._cache_path: Optional[Path] = None
+        self._cache: Dict[str, list] = {}
+        self._cache_modified = False
+        if config.schema_cache is not None:
+            path = Path(config.schema_cache.path)
+            if not path.is_absolute() and config.repo_path is not None:
+                path = config.repo_path / path
+            self._cache_path = path
+            try:
+                self._cache = json.loads(path.read_text())
+            except (FileNotFoundError, ValueError):
+                pass
+
+    def fetch(self, data_sources: Iterable[DataSource]):
+        """Looks up the schemas of the given data sources which have not been looked up yet."""
+        to_fetch: Dict[str, DataSource] = {}
+        for data_source in data_sources:
+            key = self._get_key(data_source)
+            if key not in self._schemas:
+                to_fetch.setdefault(key, data_source)
+        if not to_fetch:
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(to_fetch), MAX_CONCURRENT_SCHEMA_LOOKUPS)
+        ) as executor:
+            for key, data_source in to_fetch.items():
+                self._schemas[key] = executor.submit(self._lookup, key, data_source)
+        self._save_cache()
+
+    def get(self, data_source: DataSource) -> List[Tuple[str, str]]:
+        """
+        Returns the column names and types of the data source. Errors of the lookup are raised
+        here, rather than when the lookup runs.
+        """
+        self.fetch([data_source])
+        return self._schemas[self._get_key(data_source)].result()
+
+    def _get_key(self, data_source: DataSource) -> str:
+        if id(data_source) not in self._keys:
+            self._keys[id(data_source)] = (
+                data_source,
+                _get_definition_key(data_source),
+            )
+        return self._keys[id(data_source)][1]
+
+    def _lookup(self, key: str, data_source: DataSource) -> List[Tuple[str, str]]:
+        version = (
+            get_file_source_version(data_source)
+            if self._cache_path is not None
+            else None
+        )
+        if version is not None and key in self._cache:
+            cached_version, columns = self._cache[key]
+            if cached_version == version:
+                return [(name, datatype) for name, datatype in columns]
+
+        columns = list(data_source.get_table_column_names_and_types(self._config))
+        if version is not None:
+            self._cache[key] = [version, columns]
+            self._cache_modified = True
+        return columns
+
+    def _save_cache(self):
+        if self._cache_path is None or not self._cache_modified:
+            return
+        self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that concurrent runs never read a partial cache.
+        tmp_path = self._cache_path.with_name(
+            f".{self._cache_path.name}.{uuid.uuid4().hex}.tmp"
+        )
+        tmp_path.write_text(json.dumps(self._cache))
+        os.replace(tmp_path, self._cache_path)
+        self._cache_modified = False
+
+
+def _get_definition_key(data_source: DataSource) -> str:
+    """Returns a key of the fields of the data source which determine its schema."""
+    proto = data_source.to_proto()
+    proto.ClearField("name")
+    proto.ClearField("project")
+    proto.ClearField("description")
+    proto.ClearField("tags")
+    proto.ClearField("owner")
+    proto.ClearField("field_mapping")
+    proto.ClearField("timestamp_field")
+    proto.ClearField("date_partition_column")
+    proto.ClearField("created_timestamp_column")
+    return hashlib.sha256(proto.SerializeToString(deterministic=True)).hexdigest()
+
 
 def update_entities_with_inferred_types_from_feature_views(
-    entities: List[Entity], feature_views: List[FeatureView], config: RepoConfig
+    entities: List[Entity],
+    feature_views: List[FeatureView],
+    config: RepoConfig,
+    schemas: Optional[DataSourceSchemas] = None,
 ) -> None:
     """
     Infers the types of the entities by examining the schemas of feature view batch sources.
@@ -26,6 +145,7 @@ def update_entities_with_inferred_types_from_feature_views(
         entities: The entities to be updated.
         feature_views: A list containing feature views associated with the entities.
         config: The config for the current feature store.
+        schemas (optional): The schemas of the data sources, if they are shared with other inferences.
     """
     incomplete_entities = {
         entity.name: entity
@@ -34,11 +154,15 @@ def update_entities_with_inferred_types_from_feature_views(
     }
     incomplete_entities_keys = incomplete_entities.keys()
 
-    for view in feature_views:
-        if not (incomplete_entities_keys & set(view.entities)):
-            continue  # skip if view doesn't contain any entities that need inference
+    # skip views that don't contain any entities that need inference
+    feature_views = [
+        view for view in feature_views if incomplete_entities_keys & set(view.entities)
+    ]
+    schemas = schemas or DataSourceSchemas(config)
+    schemas.fetch(view.batch_source for view in feature_views)
 
-        col_names_and_types = view.batch_source.get_table_column_names_and_types(config)
+    for view in feature_views:
+        col_names_and_types = schemas.get(view.batch_source)
         for entity_name in view.entities:
             if entity_name in incomplete_entities:
                 entity = incomplete_entities[entity_name]
@@ -73,10 +197,20 @@ def update_entities_with_inferred_types_from_feature_views(
 
 
 def update_data_sources_with_inferred_event_timestamp_col(
-    data_sources: List[DataSource], config: RepoConfig
+    data_sources: List[DataSource],
+    config: RepoConfig,
+    schemas: Optional[DataSourceSchemas] = None,
 ) -> None:
     ERROR_MSG_PREFIX = "Unable to infer DataSource event_timestamp_column"
 
+    schemas = schemas or DataSourceSchemas(config)
+    schemas.fetch(
+        data_source
+        for data_source in data_sources
+        if not isinstance(data_source, RequestSource)
+        and (data_source.timestamp_field is None or data_source.timestamp_field == "")
+    )
+
     for data_source in data_sources:
         if isinstance(data_source, RequestSource):
             continue
@@ -115,10 +249,7 @@ def update_data_sources_with_inferred_event_timestamp_col(
 
             # loop through table columns to find singular match
             timestamp_field, matched_flag = None, False
-            for (
-                col_name,
-                col_datatype,
-            ) in data_source.get_table_column_names_and_types(config):
+            for col_name, col_datatype in schemas.get(data_source):
                 if re.match(ts_column_type_regex_pattern, col_datatype):
                     if matched_flag:
                         raise RegistryInferenceFailure(
@@ -143,7 +274,10 @@ def update_data_sources_with_inferred_event_timestamp_col(
 
 
 def update_feature_views_with_inferred_features(
-    fvs: List[FeatureView], entities: List[Entity], config: RepoConfig
+    fvs: List[FeatureView],
+    entities: List[Entity],
+    config: RepoConfig,
+    schemas: Optional[DataSourceSchemas] = None,
 ) -> None:
     """
     Infers the set of features associated to each FeatureView and updates the FeatureView with those features.
@@ -154,9 +288,13 @@ def update_feature_views_with_inferred_features(
         fvs: The feature views to be updated.
         entities: A list containing entities associated with the feature views.
         config: The config for the current feature store.
+        schemas (optional): The schemas of the data sources, if they are shared with other inferences.
     """
     entity_name_to_join_key_map = {entity.name: entity.join_key for entity in entities}
 
+    schemas = schemas or DataSourceSchemas(config)
+    schemas.fetch(fv.batch_source for fv in fvs if not fv.features)
+
     for fv in fvs:
         if not fv.features:
             columns_to_exclude = {
@@ -180,10 +318,7 @@ def update_feature_views_with_inferred_features(
                     ]
                 )
 
-            for (
-                col_name,
-                col_datatype,
-            ) in fv.batch_source.get_table_column_names_and_types(config):
+            for col_name, col_datatype in schemas.get(fv.batch_source):
                 if col_name not in columns_to_exclude and not re.match(
                     "^__|__$",
                     col_name,  # double underscores often signal an internal-use column
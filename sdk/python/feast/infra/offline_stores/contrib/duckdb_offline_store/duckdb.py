@@ -0,0 +1,513 @@
+from dataclasses import replace
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple, Union, cast
+
+import numpy as np
+import pandas as pd
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+from pydantic import StrictInt, StrictStr
+from pydantic.typing import Literal
+
+from feast import FileSource, OnDemandFeatureView
+from feast.data_source import DataSource
+from feast.errors import FeastJoinKeysDuringMaterialization, InvalidEntityType
+from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL, FeatureView
+from feast.infra.offline_stores import offline_utils
+from feast.infra.offline_stores.file_source import SavedDatasetFileStorage
+from feast.infra.offline_stores.offline_store import (
+    OfflineStore,
+    RetrievalJob,
+    RetrievalMetadata,
+)
+from feast.registry import Registry
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+from feast.saved_dataset import SavedDatasetStorage
+from feast.usage import log_exceptions_and_usage
+
+try:
+    import duckdb
+except ImportError as e:
+    from feast.errors import FeastExtrasDependencyImportError
+
+    raise FeastExtrasDependencyImportError("duckdb", str(e))
+
+
+class DuckDBOfflineStoreConfig(FeastConfigBaseModel):
+    """Offline store config for running queries over file sources with DuckDB"""
+
+    type: Literal["duckdb"] = "duckdb"
+    """ Offline store type selector"""
+
+    threads: Optional[StrictInt] = None
+    """ Number of threads used by DuckDB. Defaults to the number of cores. """
+
+    memory_limit: Optional[StrictStr] = None
+    """ Maximum memory used by DuckDB (e.g. "4GB"), beyond which intermediate results
+    are spilled to the temp directory. Defaults to 80% of the system memory. """
+
+    temp_directory: Optional[StrictStr] = None
+    """ Directory used by DuckDB to spill intermediate results to disk. """
+
+
+class DuckDBOfflineStore(OfflineStore):
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def pull_latest_from_table_or_query(
+        config: RepoConfig,
+        data_source: DataSource,
+        join_key_columns: List[str],
+        feature_name_columns: List[str],
+        event_timestamp_column: str,
+        created_timestamp_column: Optional[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RetrievalJob:
+        assert isinstance(data_source, FileSource)
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+
+        connection = _get_connection(config.offline_store)
+        from_expression = _register_file_source(connection, data_source)
+
+        source_columns = set(
+            connection.execute(f"SELECT * FROM {_quote(from_expression)} LIMIT 0")
+            .fetch_arrow_table()
+            .column_names
+        )
+        if not set(join_key_columns).issubset(source_columns):
+            raise FeastJoinKeysDuringMaterialization(
+                data_source.path, set(join_key_columns), source_columns
+            )
+
+        partition_by_join_key_string = ", ".join(_quote(c) for c in join_key_columns)
+        if partition_by_join_key_string:
+            partition_by_join_key_string = (
+                "PARTITION BY " + partition_by_join_key_string
+            )
+
+        timestamp_columns = [event_timestamp_column]
+        if created_timestamp_column:
+            timestamp_columns.append(created_timestamp_column)
+
+        timestamp_desc_string = " DESC, ".join(map(_quote, timestamp_columns)) + " DESC"
+        field_string = ", ".join(
+            map(_quote, join_key_columns + feature_name_columns + timestamp_columns)
+        )
+
+        query = f"""
+            SELECT
+                {field_string}
+                {f", '{DUMMY_ENTITY_VAL}' AS {_quote(DUMMY_ENTITY_ID)}" if not join_key_columns else ""}
+            FROM (
+                SELECT {field_string},
+                ROW_NUMBER() OVER({partition_by_join_key_string} ORDER BY {timestamp_desc_string}) AS _feast_row
+                FROM {_quote(from_expression)}
+                WHERE {_as_timestamptz(event_timestamp_column)} >= {_timestamp_literal(start_date)}
+                AND {_as_timestamptz(event_timestamp_column)} < {_timestamp_literal(end_date)}
+            )
+            WHERE _feast_row = 1
+            """
+
+        # When materializing a single feature view, we don't need full feature names. On demand transforms aren't materialized
+        return DuckDBRetrievalJob(
+            query=query, connection=connection, full_feature_names=False,
+        )
+
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def pull_all_from_table_or_query(
+        config: RepoConfig,
+        data_source: DataSource,
+        join_key_columns: List[str],
+        feature_name_columns: List[str],
+        event_timestamp_column: str,
+        start_date: datetime,
+        end_date: datetime,
+    ) -> RetrievalJob:
+        assert isinstance(data_source, FileSource)
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+
+        connection = _get_connection(config.offline_store)
+        from_expression = _register_file_source(connection, data_source)
+
+        field_string = ", ".join(
+            map(
+                _quote,
+                join_key_columns + feature_name_columns + [event_timestamp_column],
+            )
+        )
+
+        query = f"""
+            SELECT {field_string}
+            FROM {_quote(from_expression)}
+            WHERE {_as_timestamptz(event_timestamp_column)} >= {_timestamp_literal(start_date)}
+            AND {_as_timestamptz(event_timestamp_column)} < {_timestamp_literal(end_date)}
+        """
+
+        return DuckDBRetrievalJob(
+            query=query, connection=connection, full_feature_names=False,
+        )
+
+    @staticmethod
+    @log_exceptions_and_usage(offline_store="duckdb")
+    def get_historical_features(
+        config: RepoConfig,
+        feature_views: List[FeatureView],
+        feature_refs: List[str],
+        entity_df: Union[pd.DataFrame, str],
+        registry: Registry,
+        project: str,
+        full_feature_names: bool = False,
+    ) -> RetrievalJob:
+        assert isinstance(config.offline_store, DuckDBOfflineStoreConfig)
+        for fv in feature_views:
+            assert isinstance(fv.batch_source, FileSource)
+
+        connection = _get_connection(config.offline_store)
+
+        table_name = offline_utils.get_temp_entity_table_name()
+        _upload_entity_df(connection, entity_df, table_name)
+
+        entity_schema = _get_entity_schema(connection, table_name)
+
+        entity_df_event_timestamp_col = offline_utils.infer_event_timestamp_from_entity_df(
+            entity_schema
+        )
+
+        expected_join_keys = offline_utils.get_expected_join_keys(
+            project, feature_views, registry
+        )
+
+        offline_utils.assert_expected_columns_in_entity_df(
+            entity_schema, expected_join_keys, entity_df_event_timestamp_col
+        )
+
+        entity_df_event_timestamp_range = _get_entity_df_event_timestamp_range(
+            connection, table_name, entity_df_event_timestamp_col
+        )
+
+        # Build a query context containing all information required to template the DuckDB SQL query
+        query_context = offline_utils.get_feature_view_query_context(
+            feature_refs,
+            feature_views,
+            registry,
+            project,
+            entity_df_event_timestamp_range,
+        )
+
+        # File sources do not have a table query string, so each source is registered
+        # as a view over its Parquet dataset, which is scanned lazily by DuckDB.
+        table_subqueries = {
+            fv.projection.name_to_use(): _quote(
+                _register_file_source(connection, cast(FileSource, fv.batch_source))
+            )
+            for fv in feature_views
+        }
+        query_context = [
+            replace(context, table_subquery=table_subqueries[context.name])
+            for context in query_context
+        ]
+
+        # Generate the DuckDB SQL query from the query context
+        query = offline_utils.build_point_in_time_query(
+            query_context,
+            left_table_query_string=_quote(table_name),
+            entity_df_event_timestamp_col=entity_df_event_timestamp_col,
+            entity_df_columns=entity_schema.keys(),
+            query_template=MULTIPLE_FEATURE_VIEW_POINT_IN_TIME_JOIN,
+            full_feature_names=full_feature_names,
+        )
+
+        return DuckDBRetrievalJob(
+            query=query,
+            connection=connection,
+            full_feature_names=full_feature_names,
+            on_demand_feature_views=OnDemandFeatureView.get_requested_odfvs(
+                feature_refs, project, registry
+            ),
+            metadata=RetrievalMetadata(
+                features=feature_refs,
+                keys=list(entity_schema.keys() - {entity_df_event_timestamp_col}),
+                min_event_timestamp=entity_df_event_timestamp_range[0],
+                max_event_timestamp=entity_df_event_timestamp_range[1],
+            ),
+        )
+
+
+class DuckDBRetrievalJob(RetrievalJob):
+    def __init__(
+        self,
+        query: str,
+        connection: "duckdb.DuckDBPyConnection",
+        full_feature_names: bool,
+        on_demand_feature_views: Optional[List[OnDemandFeatureView]] = None,
+        metadata: Optional[RetrievalMetadata] = None,
+    ):
+        self.query = query
+        self._connection = connection
+        self._full_feature_names = full_feature_names
+        self._on_demand_feature_views = (
+            on_demand_feature_views if on_demand_feature_views else []
+        )
+        self._metadata = metadata
+
+    @property
+    def full_feature_names(self) -> bool:
+        return self._full_feature_names
+
+    @property
+    def on_demand_feature_views(self) -> Optional[List[OnDemandFeatureView]]:
+        return self._on_demand_feature_views
+
+    @log_exceptions_and_usage
+    def _to_df_internal(self) -> pd.DataFrame:
+        return self._connection.execute(self.query).df()
+
+    @log_exceptions_and_usage
+    def _to_arrow_internal(self) -> pyarrow.Table:
+        return self._connection.execute(self.query).fetch_arrow_table()
+
+    def _to_arrow_batches_internal(
+        self, batch_size: int = 1_000_000
+    ) -> pyarrow.RecordBatchReader:
+        """
+        Return dataset as a reader of pyarrow RecordBatches.
+
+        The batches are produced while the query runs, so the result does not need to fit
+        in memory.
+        """
+        return self._connection.execute(self.query).fetch_record_batch(batch_size)
+
+    def to_sql(self) -> str:
+        """
+        Returns the SQL query that will be executed in DuckDB to build the historical feature table.
+        """
+        return self.query
+
+    def persist(self, storage: SavedDatasetStorage):
+        assert isinstance(storage, SavedDatasetFileStorage)
+        filesystem, path = FileSource.create_filesystem_and_path(
+            storage.file_options.uri, storage.file_options.s3_endpoint_override,
+        )
+
+        if path.endswith(".parquet"):
+            pyarrow.parquet.write_table(
+                self.to_arrow(), where=path, filesystem=filesystem
+            )
+        else:
+            # otherwise assume destination is directory
+            pyarrow.parquet.write_to_dataset(
+                self.to_arrow(), root_path=path, filesystem=filesystem
+            )
+
+    @property
+    def metadata(self) -> Optional[RetrievalMetadata]:
+        return self._metadata
+
+
+def _get_connection(
+    store_config: DuckDBOfflineStoreConfig,
+) -> "duckdb.DuckDBPyConnection":
+    connection = duckdb.connect()
+    # Feast treats timestamps without a time zone as UTC.
+    connection.execute("SET TimeZone = 'UTC'")
+    if store_config.threads:
+        connection.execute(f"SET threads = {store_config.threads}")
+    if store_config.memory_limit:
+        connection.execute(f"SET memory_limit = '{store_config.memory_limit}'")
+    if store_config.temp_directory:
+        connection.execute(f"SET temp_directory = '{store_config.temp_directory}'")
+    return connection
+
+
+def _register_file_source(
+    connection: "duckdb.DuckDBPyConnection", data_source: FileSource
+) -> str:
+    """Registers the Parquet dataset of a file source as a view and returns its name."""
+    filesystem, path = FileSource.create_filesystem_and_path(
+        data_source.path, data_source.file_options.s3_endpoint_override
+    )
+    dataset = pyarrow.dataset.dataset(
+        path, filesystem=filesystem, format="parquet", partitioning="hive"
+    )
+    view_name = f"feast_source_{abs(hash(data_source.path)):x}"
+    connection.register(view_name, dataset)
+    return view_name
+
+
+def _upload_entity_df(
+    connection: "duckdb.DuckDBPyConnection",
+    entity_df: Union[pd.DataFrame, str],
+    table_name: str,
+) -> None:
+    if isinstance(entity_df, pd.DataFrame):
+        connection.register(table_name, entity_df)
+    elif isinstance(entity_df, str):
+        # If the entity_df is a string (SQL query), create a view out of it
+        connection.execute(f"CREATE TEMPORARY VIEW {_quote(table_name)} AS {entity_df}")
+    else:
+        raise InvalidEntityType(type(entity_df))
+
+
+def _get_entity_schema(
+    connection: "duckdb.DuckDBPyConnection", table_name: str
+) -> Dict[str, np.dtype]:
+    limited_entity_df = connection.execute(
+        f"SELECT * FROM {_quote(table_name)} LIMIT 0"
+    ).df()
+    return dict(zip(limited_entity_df.columns, limited_entity_df.dtypes))
+
+
+def _get_entity_df_event_timestamp_range(
+    connection: "duckdb.DuckDBPyConnection",
+    table_name: str,
+    entity_df_event_timestamp_col: str,
+) -> Tuple[datetime, datetime]:
+    timestamp = _quote(entity_df_event_timestamp_col)
+    # An aggregation without GROUP BY always returns a single row.
+    row = connection.execute(
+        f"SELECT MIN({timestamp}), MAX({timestamp}) FROM {_quote(table_name)}"
+    ).fetchone()
+    assert row is not None
+    min_timestamp, max_timestamp = row
+    return min_timestamp, max_timestamp
+
+
+def _quote(identifier: str) -> str:
+    return '"' + identifier.replace('"', '""') + '"'
+
+
+def _as_timestamptz(column: str) -> str:
+    # Timestamps may be stored with or without a time zone and with different precisions,
+    # which DuckDB does not compare implicitly.
+    return f"CAST({_quote(column)} AS TIMESTAMPTZ)"
+
+
+def _timestamp_literal(timestamp: datetime) -> str:
+    return f"CAST('{timestamp.isoformat()}' AS TIMESTAMPTZ)"
+
+
+MULTIPLE_FEATURE_VIEW_POINT_IN_TIME_JOIN = """
+/*
+ Compute a deterministic hash for the `left_table_query_string` that will be used throughout
+ all the logic as the field to GROUP BY the data
+*/
+WITH entity_dataframe AS (
+    SELECT *,
+        CAST({{entity_df_event_timestamp_col}} AS TIMESTAMPTZ) AS entity_timestamp
+        {% for featureview in featureviews %}
+            {% if featureview.entities %}
+            ,(
+                {% for entity in featureview.entities %}
+                    CAST({{entity}} AS VARCHAR) ||
+                {% endfor %}
+                CAST({{entity_df_event_timestamp_col}} AS VARCHAR)
+            ) AS {{featureview.name}}__entity_row_unique_id
+            {% else %}
+            ,CAST({{entity_df_event_timestamp_col}} AS VARCHAR) AS {{featureview.name}}__entity_row_unique_id
+            {% endif %}
+        {% endfor %}
+    FROM {{ left_table_query_string }}
+),
+
+{% for featureview in featureviews %}
+
+{{ featureview.name }}__entity_dataframe AS (
+    SELECT
+        {{ featureview.entities | join(', ')}}{% if featureview.entities %},{% else %}{% endif %}
+        entity_timestamp,
+        {{featureview.name}}__entity_row_unique_id
+    FROM entity_dataframe
+    GROUP BY
+        {{ featureview.entities | join(', ')}}{% if featureview.entities %},{% else %}{% endif %}
+        entity_timestamp,
+        {{featureview.name}}__entity_row_unique_id
+),
+
+/*
+ This query template performs the point-in-time correctness join for a single feature set table
+ to the provided entity table.
+
+ 1. We first join the current feature_view to the entity dataframe that has been passed.
+ This JOIN has the following logic:
+    - For each row of the entity dataframe, only keep the rows where the `event_timestamp_column`
+    is less than the one provided in the entity dataframe
+    - If there a TTL for the current feature_view, also keep the rows where the `event_timestamp_column`
+    is higher the the one provided minus the TTL
+    - For each row, Join on the entity key and retrieve the `entity_row_unique_id` that has been
+    computed previously
+
+ The output of this CTE will contain all the necessary information and already filtered out most
+ of the data that is not relevant.
+*/
+
+{{ featureview.name }}__subquery AS (
+    SELECT
+        CAST({{ featureview.event_timestamp_column }} AS TIMESTAMPTZ) as event_timestamp,
+        {{ 'CAST(' ~ featureview.created_timestamp_column ~ ' AS TIMESTAMPTZ) as created_timestamp,' if featureview.created_timestamp_column else '' }}
+        {{ featureview.entity_selections | join(', ')}}{% if featureview.entity_selections %},{% else %}{% endif %}
+        {% for feature in featureview.features %}
+            {{ feature }} as {% if full_feature_names %}{{ featureview.name }}__{{featureview.field_mapping.get(feature, feature)}}{% else %}{{ featureview.field_mapping.get(feature, feature) }}{% endif %}{% if loop.last %}{% else %}, {% endif %}
+        {% endfor %}
+    FROM {{ featureview.table_subquery }}
+    WHERE CAST({{ featureview.event_timestamp_column }} AS TIMESTAMPTZ) <= CAST('{{ featureview.max_event_timestamp }}' AS TIMESTAMP)
+    {% if featureview.ttl == 0 %}{% else %}
+    AND CAST({{ featureview.event_timestamp_column }} AS TIMESTAMPTZ) >= CAST('{{ featureview.min_event_timestamp }}' AS TIMESTAMP)
+    {% endif %}
+),
+
+{{ featureview.name }}__base AS (
+    SELECT
+        subquery.*,
+        entity_dataframe.entity_timestamp,
+        entity_dataframe.{{featureview.name}}__entity_row_unique_id
+    FROM {{ featureview.name }}__subquery AS subquery
+    INNER JOIN {{ featureview.name }}__entity_dataframe AS entity_dataframe
+    ON TRUE
+        AND subquery.event_timestamp <= entity_dataframe.entity_timestamp
+
+        {% if featureview.ttl == 0 %}{% else %}
+        AND subquery.event_timestamp >= entity_dataframe.entity_timestamp - {{ featureview.ttl }} * INTERVAL '1' SECOND
+        {% endif %}
+
+        {% for entity in featureview.entities %}
+        AND subquery.{{ entity }} = entity_dataframe.{{ entity }}
+        {% endfor %}
+),
+
+/*
+ 2. The data has been filtered during the first CTE "*__base"
+ Thus we only need to keep the latest row of each entity row. Rows with the
+ same event timestamp are ordered by their created timestamp, and exact ties
+ are broken arbitrarily, so that each entity row is joined to a single row.
+*/
+{{ featureview.name }}__cleaned AS (
+    SELECT *
+    FROM {{ featureview.name }}__base
+    QUALIFY ROW_NUMBER() OVER(
+        PARTITION BY {{featureview.name}}__entity_row_unique_id
+        ORDER BY event_timestamp DESC{% if featureview.created_timestamp_column %},created_timestamp DESC{% endif %}
+    ) = 1
+){% if loop.last %}{% else %}, {% endif %}
+
+
+{% endfor %}
+/*
+ Joins the outputs of multiple time travel joins to a single table.
+ The entity_dataframe dataset being our source of truth here.
+ */
+
+SELECT {{ final_output_feature_names | join(', ')}}
+FROM entity_dataframe
+{% for featureview in featureviews %}
+LEFT JOIN (
+    SELECT
+        {{featureview.name}}__entity_row_unique_id
+        {% for feature in featureview.features %}
+            ,{% if full_feature_names %}{{ featureview.name }}__{{featureview.field_mapping.get(feature, feature)}}{% else %}{{ featureview.field_mapping.get(feature, feature) }}{% endif %}
+        {% endfor %}
+    FROM {{ featureview.name }}__cleaned
+) AS {{ featureview.name }}__cleaned USING ({{featureview.name}}__entity_row_unique_id)
+{% endfor %}
+"""
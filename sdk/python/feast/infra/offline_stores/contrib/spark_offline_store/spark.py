@@ -1,6 +1,6 @@
 import warnings
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas
@@ -8,8 +8,9 @@ import pandas as pd
 import pyarrow
 import pyspark
 from pydantic import StrictStr
-from pyspark import SparkConf
+from pyspark import SparkConf, StorageLevel
 from pyspark.sql import SparkSession
+from pyspark.sql.pandas.types import to_arrow_schema
 from pytz import utc
 
 from feast import FeatureView, OnDemandFeatureView
@@ -18,6 +19,7 @@ from feast.errors import InvalidEntityType
 from feast.feature_view import DUMMY_ENTITY_ID, DUMMY_ENTITY_VAL
 from feast.infra.offline_stores import offline_utils
 from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
+    SavedDatasetSparkStorage,
     SparkSource,
 )
 from feast.infra.offline_stores.offline_store import (
@@ -38,6 +40,11 @@ class SparkOfflineStoreConfig(FeastConfigBaseModel):
 
     spark_conf: Optional[Dict[str, str]] = None
     """ Configuration overlay for the spark session """
+
+    cache_historical_results: bool = False
+    """ Whether the results of historical retrievals are cached by spark, so that converting them
+    several times does not recompute them. The cache is held until it is released with
+    `to_spark_df().unpersist()` """
     # sparksession is not serializable and we dont want to pass it around as an argument
 
 
@@ -176,6 +183,7 @@ class SparkOfflineStore(OfflineStore):
                 min_event_timestamp=entity_df_event_timestamp_range[0],
                 max_event_timestamp=entity_df_event_timestamp_range[1],
             ),
+            cache_results=config.offline_store.cache_historical_results,
         )
 
     @staticmethod
@@ -233,13 +241,30 @@ class SparkRetrievalJob(RetrievalJob):
         full_feature_names: bool,
         on_demand_feature_views: Optional[List[OnDemandFeatureView]] = None,
         metadata: Optional[RetrievalMetadata] = None,
+        cache_results: bool = False,
     ):
+        """
+        Creates a SparkRetrievalJob.
+
+        Args:
+            spark_session: The spark session used to run the query.
+            query: The spark SQL statements of the retrieval, separated by "---EOS---".
+            full_feature_names: Whether feature names are prefixed with the feature view name.
+            on_demand_feature_views: The on demand feature views applied to the result.
+            metadata: Metadata about the retrieval.
+            cache_results: Whether the result is cached by spark the first time it is
+                computed, so that converting it multiple times (e.g. persisting and then
+                profiling a saved dataset) does not recompute the query. The cache can be
+                released with `to_spark_df().unpersist()`.
+        """
         super().__init__()
         self.spark_session = spark_session
         self.query = query
         self._full_feature_names = full_feature_names
         self._on_demand_feature_views = on_demand_feature_views
         self._metadata = metadata
+        self._cache_results = cache_results
+        self._spark_df: Optional[pyspark.sql.DataFrame] = None
 
     @property
     def full_feature_names(self) -> bool:
@@ -250,11 +275,16 @@ class SparkRetrievalJob(RetrievalJob):
         return self._on_demand_feature_views
 
     def to_spark_df(self) -> pyspark.sql.DataFrame:
-        statements = self.query.split(
-            "---EOS---"
-        )  # TODO can do better than this dirty split
-        *_, last = map(self.spark_session.sql, statements)
-        return last
+        # The statements creating the temporary views are only run once per job.
+        if self._spark_df is None:
+            statements = self.query.split(
+                "---EOS---"
+            )  # TODO can do better than this dirty split
+            *_, last = map(self.spark_session.sql, statements)
+            if self._cache_results:
+                last = last.persist(StorageLevel.MEMORY_AND_DISK)
+            self._spark_df = last
+        return self._spark_df
 
     def _to_df_internal(self) -> pd.DataFrame:
         """Return dataset as Pandas DataFrame synchronously"""
@@ -262,14 +292,51 @@ class SparkRetrievalJob(RetrievalJob):
 
     def _to_arrow_internal(self) -> pyarrow.Table:
         """Return dataset as pyarrow Table synchronously"""
-        df = self.to_df()
-        return pyarrow.Table.from_pandas(df)  # noqa
+        spark_df = self.to_spark_df()
+        batches = _collect_as_arrow(spark_df)
+        if not batches:
+            return to_arrow_schema(spark_df.schema).empty_table()
+        return pyarrow.Table.from_batches(batches)
+
+    def _to_arrow_batches_internal(self) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Return dataset as an iterator of pyarrow RecordBatches.
+
+        The batches are transferred to the driver one Spark partition at a time, so only a
+        single partition needs to fit in the memory of the driver. This requires pyspark
+        3.3 or later; with older versions all batches are collected before the first one
+        is returned. The size of the batches is controlled by the
+        `spark.sql.execution.arrow.maxRecordsPerBatch` setting.
+        """
+        spark_df = self.to_spark_df()
+        if not hasattr(spark_df, "mapInArrow"):
+            yield from _collect_as_arrow(spark_df)
+            return
+
+        serialized_df = spark_df.mapInArrow(
+            _serialize_record_batches, f"{SERIALIZED_BATCH_COLUMN} binary"
+        )
+        for row in serialized_df.toLocalIterator():
+            yield from pyarrow.ipc.open_stream(row[SERIALIZED_BATCH_COLUMN])
 
     def persist(self, storage: SavedDatasetStorage):
         """
         Run the retrieval and persist the results in the same offline store used for read.
         """
-        pass
+        assert isinstance(storage, SavedDatasetSparkStorage)
+
+        spark_options = storage.spark_options
+        writer = self.to_spark_df().write
+        if spark_options.table:
+            writer.saveAsTable(spark_options.table)
+        elif spark_options.path:
+            # Storages with a path have a file format, parquet by default.
+            assert spark_options.file_format
+            writer.format(spark_options.file_format).save(spark_options.path)
+        else:
+            raise ValueError(
+                "Saved datasets can only be persisted to a spark table or path."
+            )
 
     @property
     def metadata(self) -> Optional[RetrievalMetadata]:
@@ -280,6 +347,35 @@ class SparkRetrievalJob(RetrievalJob):
         return self._metadata
 
 
+SERIALIZED_BATCH_COLUMN = "arrow_batch"
+
+
+def _collect_as_arrow(spark_df: pyspark.sql.DataFrame) -> List[pyarrow.RecordBatch]:
+    """
+    Collects the Arrow batches produced by Spark directly, instead of converting the dataset to
+    pandas and then back to Arrow. This relies on a private method of pyspark, so the dataset is
+    converted through pandas if the method is missing.
+    """
+    if hasattr(spark_df, "_collect_as_arrow"):
+        return spark_df._collect_as_arrow()
+    table = pyarrow.Table.from_pandas(spark_df.toPandas(), preserve_index=False)
+    return table.to_batches()
+
+
+def _serialize_record_batches(
+    batches: Iterable[pyarrow.RecordBatch],
+) -> Iterator[pyarrow.RecordBatch]:
+    """Serializes each record batch of a Spark partition into a single binary value."""
+    for batch in batches:
+        sink = pyarrow.BufferOutputStream()
+        with pyarrow.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        yield pyarrow.RecordBatch.from_arrays(
+            [pyarrow.array([sink.getvalue().to_pybytes()], pyarrow.binary())],
+            names=[SERIALIZED_BATCH_COLUMN],
+        )
+
+
 def get_spark_session_or_start_new_with_repoconfig(
     store_config: SparkOfflineStoreConfig,
 ) -> SparkSession:
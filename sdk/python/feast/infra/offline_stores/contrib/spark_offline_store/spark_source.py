@@ -260,16 +260,41 @@ class SavedDatasetSparkStorage(SavedDatasetStorage):
 
     spark_options: SparkOptions
 
-    def __init__(self, table_ref: Optional[str] = None, query: Optional[str] = None):
-        self.spark_options = SparkOptions(table=table_ref, query=query)
+    def __init__(
+        self,
+        table_ref: Optional[str] = None,
+        query: Optional[str] = None,
+        path: Optional[str] = None,
+        file_format: Optional[str] = None,
+    ):
+        # Datasets saved to a path are written and read as parquet by default.
+        if path and not file_format:
+            file_format = "parquet"
+        self.spark_options = SparkOptions(
+            table=table_ref or None,
+            query=query or None,
+            path=path or None,
+            file_format=file_format or None,
+        )
 
     @staticmethod
     def from_proto(storage_proto: SavedDatasetStorageProto) -> SavedDatasetStorage:
-        # TODO: implementation is not correct. Needs fix and update to protos.
-        return SavedDatasetSparkStorage(table_ref="", query=None)
+        spark_options = SparkOptions.from_proto(storage_proto.spark_storage)
+        return SavedDatasetSparkStorage(
+            table_ref=spark_options.table,
+            query=spark_options.query,
+            path=spark_options.path,
+            file_format=spark_options.file_format,
+        )
 
     def to_proto(self) -> SavedDatasetStorageProto:
-        return SavedDatasetStorageProto()
+        return SavedDatasetStorageProto(spark_storage=self.spark_options.to_proto())
 
     def to_data_source(self) -> DataSource:
-        return SparkSource(table=self.spark_options.table)
+        return SparkSource(
+            name=self.spark_options.table or self.spark_options.path,
+            table=self.spark_options.table,
+            query=self.spark_options.query,
+            path=self.spark_options.path,
+            file_format=self.spark_options.file_format,
+        )
@@ -1,5 +1,5 @@
-from datetime import datetime
-from typing import Callable, List, Optional, Tuple, Union
+from datetime import datetime, timedelta
+from typing import Any, Callable, List, Optional, Tuple, Union
 
 import dask.dataframe as dd
 import pandas as pd
@@ -28,6 +28,7 @@ from feast.registry import Registry
 from feast.repo_config import FeastConfigBaseModel, RepoConfig
 from feast.saved_dataset import SavedDatasetStorage
 from feast.usage import log_exceptions_and_usage
+from feast.utils import make_series_tzaware
 
 
 class FileOfflineStoreConfig(FeastConfigBaseModel):
@@ -147,34 +148,13 @@ class FileOfflineStore(OfflineStore):
             # Create a copy of entity_df to prevent modifying the original
             entity_df_with_features = entity_df.copy()
 
-            entity_df_event_timestamp_col_type = entity_df_with_features.dtypes[
+            # Make sure all event timestamp fields are tz-aware. We default tz-naive fields to UTC
+            # This is necessary to avoid issues with pd.merge_asof
+            entity_df_with_features[
                 entity_df_event_timestamp_col
-            ]
-            if (
-                not hasattr(entity_df_event_timestamp_col_type, "tz")
-                or entity_df_event_timestamp_col_type.tz != pytz.UTC
-            ):
-                # Make sure all event timestamp fields are tz-aware. We default tz-naive fields to UTC
-                entity_df_with_features[
-                    entity_df_event_timestamp_col
-                ] = entity_df_with_features[entity_df_event_timestamp_col].apply(
-                    lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc)
-                )
-
-                # Convert event timestamp column to datetime and normalize time zone to UTC
-                # This is necessary to avoid issues with pd.merge_asof
-                if isinstance(entity_df_with_features, dd.DataFrame):
-                    entity_df_with_features[
-                        entity_df_event_timestamp_col
-                    ] = dd.to_datetime(
-                        entity_df_with_features[entity_df_event_timestamp_col], utc=True
-                    )
-                else:
-                    entity_df_with_features[
-                        entity_df_event_timestamp_col
-                    ] = pd.to_datetime(
-                        entity_df_with_features[entity_df_event_timestamp_col], utc=True
-                    )
+            ] = make_series_tzaware(
+                entity_df_with_features[entity_df_event_timestamp_col]
+            )
 
             # Sort event timestamp values
             entity_df_with_features = entity_df_with_features.sort_values(
@@ -209,7 +189,27 @@ class FileOfflineStore(OfflineStore):
 
                 all_join_keys = list(set(all_join_keys + join_keys))
 
-                df_to_join = _read_datasource(feature_view.batch_source)
+                # Only read the rows that can be joined to the entity dataframe, which are those
+                # from within the ttl before the first entity timestamp up to the last one.
+                source_event_timestamp_column = {
+                    mapped_column: column
+                    for column, mapped_column in feature_view.batch_source.field_mapping.items()
+                }.get(event_timestamp_column, event_timestamp_column)
+                source_dtypes = _read_datasource(feature_view.batch_source).dtypes
+                filters = None
+                if source_event_timestamp_column in source_dtypes:
+                    filters = _get_time_range_filters(
+                        source_dtypes[source_event_timestamp_column],
+                        source_event_timestamp_column,
+                        entity_df_event_timestamp_range[0] - feature_view.ttl
+                        if feature_view.ttl
+                        else None,
+                        # The end of the time range is exclusive.
+                        entity_df_event_timestamp_range[1] + timedelta(microseconds=1),
+                    )
+                df_to_join = _read_datasource(
+                    feature_view.batch_source, filters=filters
+                )
 
                 df_to_join, event_timestamp_column = _field_mapping(
                     df_to_join,
@@ -284,10 +284,6 @@ class FileOfflineStore(OfflineStore):
         def evaluate_offline_job():
             source_df = _read_datasource(data_source)
 
-            source_df = _normalize_timestamp(
-                source_df, event_timestamp_column, created_timestamp_column
-            )
-
             source_columns = set(source_df.columns)
             if not set(join_key_columns).issubset(source_columns):
                 raise FeastJoinKeysDuringMaterialization(
@@ -300,32 +296,53 @@ class FileOfflineStore(OfflineStore):
                 else [event_timestamp_column]
             )
 
-            if created_timestamp_column:
-                source_df = source_df.sort_values(by=created_timestamp_column)
+            columns_to_extract = list(
+                dict.fromkeys(join_key_columns + feature_name_columns + ts_columns)
+            )
 
-            source_df = source_df.sort_values(by=event_timestamp_column)
+            # Only read the required columns, and skip the files and row groups whose
+            # statistics show that they are outside of the time range.
+            source_df = _read_datasource(
+                data_source,
+                columns=columns_to_extract,
+                filters=_get_time_range_filters(
+                    source_df.dtypes[event_timestamp_column],
+                    event_timestamp_column,
+                    start_date,
+                    end_date,
+                ),
+            )
+
+            source_df = _normalize_timestamp(
+                source_df, event_timestamp_column, created_timestamp_column
+            )
 
             source_df = source_df[
                 (source_df[event_timestamp_column] >= start_date)
                 & (source_df[event_timestamp_column] < end_date)
             ]
 
-            source_df = source_df.persist()
-
-            columns_to_extract = set(
-                join_key_columns + feature_name_columns + ts_columns
-            )
-            if join_key_columns:
-                source_df = source_df.drop_duplicates(
-                    join_key_columns, keep="last", ignore_index=True
-                )
-            else:
+            latest_key_columns = join_key_columns
+            if not join_key_columns:
                 source_df[DUMMY_ENTITY_ID] = DUMMY_ENTITY_VAL
-                columns_to_extract.add(DUMMY_ENTITY_ID)
-
-            source_df = source_df.persist()
+                columns_to_extract.append(DUMMY_ENTITY_ID)
+                latest_key_columns = [DUMMY_ENTITY_ID]
+
+            # The latest row of each entity is found in each partition first, so that
+            # only those rows are combined.
+            latest_kwargs = {
+                "join_key_columns": latest_key_columns,
+                "timestamp_columns": ts_columns,
+            }
+            source_df = source_df[columns_to_extract].reduction(
+                chunk=_latest_rows,
+                aggregate=_latest_rows,
+                chunk_kwargs=latest_kwargs,
+                aggregate_kwargs=latest_kwargs,
+                meta=source_df[columns_to_extract]._meta,
+            )
 
-            return source_df[list(columns_to_extract)].persist()
+            return source_df.persist()
 
         # When materializing a single feature view, we don't need full feature names. On demand transforms aren't materialized
         return FileRetrievalJob(
@@ -376,7 +393,11 @@ def _get_entity_df_event_timestamp_range(
     )
 
 
-def _read_datasource(data_source) -> dd.DataFrame:
+def _read_datasource(
+    data_source,
+    columns: Optional[List[str]] = None,
+    filters: Optional[List[Tuple[str, str, Any]]] = None,
+) -> dd.DataFrame:
     storage_options = (
         {
             "client_kwargs": {
@@ -387,7 +408,60 @@ def _read_datasource(data_source) -> dd.DataFrame:
         else None
     )
 
-    return dd.read_parquet(data_source.path, storage_options=storage_options,)
+    return dd.read_parquet(
+        data_source.path,
+        columns=columns,
+        filters=filters,
+        storage_options=storage_options,
+    )
+
+
+def _get_time_range_filters(
+    timestamp_dtype: Any,
+    timestamp_column: str,
+    start_date: Optional[datetime],
+    end_date: datetime,
+) -> Optional[List[Tuple[str, str, Any]]]:
+    """
+    Returns parquet filters selecting the time range, based on the type of the timestamps.
+
+    Parquet statistics can only be compared with timestamps of the same kind, so time zone
+    naive timestamps (which are assumed to be in UTC) are compared with naive bounds.
+    """
+    if not pd.api.types.is_datetime64_any_dtype(timestamp_dtype):
+        return None
+
+    def to_bound(date: datetime) -> pd.Timestamp:
+        bound = pd.Timestamp(date)
+        if bound.tzinfo is None:
+            bound = bound.tz_localize(pytz.utc)
+        if getattr(timestamp_dtype, "tz", None) is None:
+            bound = bound.tz_convert(pytz.utc).tz_localize(None)
+        return bound
+
+    filters = [(timestamp_column, "<", to_bound(end_date))]
+    if start_date is not None:
+        filters.insert(0, (timestamp_column, ">=", to_bound(start_date)))
+    return filters
+
+
+def _latest_rows(
+    df: pd.DataFrame, join_key_columns: List[str], timestamp_columns: List[str],
+) -> pd.DataFrame:
+    """
+    Keeps the row with the latest timestamps for each entity.
+
+    The latest timestamps are found with group-wise maxima, instead of sorting all rows.
+    Ties are broken by each subsequent timestamp column, and then by keeping the last row.
+    """
+    for timestamp_column in timestamp_columns:
+        if df.empty:
+            break
+        latest = df.groupby(join_key_columns, sort=False)[timestamp_column].transform(
+            "max"
+        )
+        df = df[(df[timestamp_column] == latest) | latest.isna()]
+    return df.drop_duplicates(join_key_columns, keep="last")
 
 
 def _field_mapping(
@@ -479,31 +553,13 @@ def _normalize_timestamp(
     event_timestamp_column: str,
     created_timestamp_column: str,
 ) -> dd.DataFrame:
-    df_to_join_types = df_to_join.dtypes
-    event_timestamp_column_type = df_to_join_types[event_timestamp_column]
-
+    # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
+    df_to_join[event_timestamp_column] = make_series_tzaware(
+        df_to_join[event_timestamp_column]
+    )
     if created_timestamp_column:
-        created_timestamp_column_type = df_to_join_types[created_timestamp_column]
-
-    if (
-        not hasattr(event_timestamp_column_type, "tz")
-        or event_timestamp_column_type.tz != pytz.UTC
-    ):
-        # Make sure all timestamp fields are tz-aware. We default tz-naive fields to UTC
-        df_to_join[event_timestamp_column] = df_to_join[event_timestamp_column].apply(
-            lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc),
-            meta=(event_timestamp_column, "datetime64[ns, UTC]"),
-        )
-
-    if created_timestamp_column and (
-        not hasattr(created_timestamp_column_type, "tz")
-        or created_timestamp_column_type.tz != pytz.UTC
-    ):
-        df_to_join[created_timestamp_column] = df_to_join[
-            created_timestamp_column
-        ].apply(
-            lambda x: x if x.tzinfo is not None else x.replace(tzinfo=pytz.utc),
-            meta=(event_timestamp_column, "datetime64[ns, UTC]"),
+        df_to_join[created_timestamp_column] = make_series_tzaware(
+            df_to_join[created_timestamp_column]
         )
 
     return df_to_join.persist()
@@ -1,4 +1,6 @@
+import json
 import warnings
+from pathlib import Path
 from typing import Callable, Dict, Iterable, Optional, Tuple
 
 from pyarrow._fs import FileSystem
@@ -346,3 +348,26 @@ class SavedDatasetFileStorage(SavedDatasetStorage):
             file_format=self.file_options.file_format,
             s3_endpoint_override=self.file_options.s3_endpoint_override,
         )
+
+
+def get_file_source_version(data_source: DataSource) -> Optional[str]:
+    """
+    Returns a string which changes whenever the data of the source changes, or None if this
+    cannot be determined, which is the case for all sources except local files.
+    """
+    if not isinstance(data_source, FileSource) or "://" in data_source.path:
+        return None
+
+    path = Path(data_source.path)
+    if path.is_file():
+        files = [path]
+    elif path.is_dir():
+        files = sorted(p for p in path.rglob("*") if p.is_file())
+    else:
+        return None
+
+    stats = []
+    for file in files:
+        stat = file.stat()
+        stats.append([str(file), stat.st_size, stat.st_mtime_ns])
+    return json.dumps(stats)
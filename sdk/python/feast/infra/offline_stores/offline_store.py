@@ -13,15 +13,30 @@
 # limitations under the License.
 import warnings
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import TYPE_CHECKING, List, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import pandas as pd
 import pyarrow
+import pyarrow.parquet
 
 from feast.data_source import DataSource
 from feast.dqm.errors import ValidationFailed
 from feast.feature_view import FeatureView
+from feast.infra.offline_stores.file_source import FileSource, SavedDatasetFileStorage
 from feast.on_demand_feature_view import OnDemandFeatureView
 from feast.registry import Registry
 from feast.repo_config import RepoConfig
@@ -30,6 +45,8 @@ from feast.saved_dataset import SavedDatasetStorage
 if TYPE_CHECKING:
     from feast.saved_dataset import ValidationReference
 
+T = TypeVar("T")
+
 
 class RetrievalMetadata:
     min_event_timestamp: Optional[datetime]
@@ -74,24 +91,10 @@ class RetrievalJob(ABC):
         Args:
             validation_reference: If provided resulting dataset will be validated against this reference profile.
         """
-        features_df = self._to_df_internal()
-
-        if self.on_demand_feature_views:
-            # TODO(adchia): Fix requirement to specify dependent feature views in feature_refs
-            for odfv in self.on_demand_feature_views:
-                features_df = features_df.join(
-                    odfv.get_transformed_features_df(
-                        features_df, self.full_feature_names,
-                    )
-                )
+        features_df = self._apply_on_demand_transforms(self._to_df_internal())
 
         if validation_reference:
-            warnings.warn(
-                "Dataset validation is an experimental feature. "
-                "This API is unstable and it could and most probably will be changed in the future. "
-                "We do not guarantee that future changes will maintain backward compatibility.",
-                RuntimeWarning,
-            )
+            _warn_experimental_validation()
 
             validation_result = validation_reference.profile.validate(features_df)
             if not validation_result.is_success:
@@ -109,6 +112,13 @@ class RetrievalJob(ABC):
         """Return dataset as pyarrow Table synchronously"""
         pass
 
+    def _to_arrow_batches_internal(self) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Return dataset as an iterator of pyarrow RecordBatches. Offline stores which can produce the
+        results incrementally should override this, by default the full table is retrieved first.
+        """
+        yield from self._to_arrow_internal().to_batches()
+
     def to_arrow(
         self, validation_reference: Optional["ValidationReference"] = None
     ) -> pyarrow.Table:
@@ -117,31 +127,68 @@ class RetrievalJob(ABC):
         Args:
             validation_reference: If provided resulting dataset will be validated against this reference profile.
         """
-        if not self.on_demand_feature_views and not validation_reference:
-            return self._to_arrow_internal()
+        if self.on_demand_feature_views:
+            features_df = self._apply_on_demand_transforms(self._to_df_internal())
+            table = pyarrow.Table.from_pandas(features_df)
+            batches: Iterable[pd.DataFrame] = [features_df]
+        else:
+            table = self._to_arrow_internal()
+            # Validate the table batch by batch, instead of converting it to pandas at once.
+            batches = (batch.to_pandas() for batch in table.to_batches())
+
+        if validation_reference:
+            _warn_experimental_validation()
+
+            validator = validation_reference.profile.batch_validator()
+            for batch in batches:
+                validator.update(batch)
+            validation_result = validator.report()
+            if not validation_result.is_success:
+                raise ValidationFailed(validation_result)
+
+        return table
+
+    def to_arrow_batches(
+        self, validation_reference: Optional["ValidationReference"] = None
+    ) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Return dataset as an iterator of pyarrow RecordBatches including on demand transforms
+        Args:
+            validation_reference: If provided, every batch is validated against this reference profile as it is
+                produced, and ValidationFailed is raised after the last batch if the dataset as a whole fails
+                the validation.
+        """
+        validator = None
+        if validation_reference:
+            _warn_experimental_validation()
+            validator = validation_reference.profile.batch_validator()
+
+        for batch in self._to_arrow_batches_internal():
+            if self.on_demand_feature_views or validator:
+                features_df = self._apply_on_demand_transforms(batch.to_pandas())
+                if self.on_demand_feature_views:
+                    batch = pyarrow.RecordBatch.from_pandas(
+                        features_df, preserve_index=False
+                    )
+                if validator:
+                    validator.update(features_df)
+            yield batch
 
-        features_df = self._to_df_internal()
+        if validator:
+            validation_result = validator.report()
+            if not validation_result.is_success:
+                raise ValidationFailed(validation_result)
+
+    def _apply_on_demand_transforms(self, features_df: pd.DataFrame) -> pd.DataFrame:
         if self.on_demand_feature_views:
+            # TODO(adchia): Fix requirement to specify dependent feature views in feature_refs
             for odfv in self.on_demand_feature_views:
                 features_df = features_df.join(
                     odfv.get_transformed_features_df(
                         features_df, self.full_feature_names,
                     )
                 )
-
-        if validation_reference:
-            warnings.warn(
-                "Dataset validation is an experimental feature. "
-                "This API is unstable and it could and most probably will be changed in the future. "
-                "We do not guarantee that future changes will maintain backward compatibility.",
-                RuntimeWarning,
-            )
-
-            validation_result = validation_reference.profile.validate(features_df)
-            if not validation_result.is_success:
-                raise ValidationFailed(validation_result)
-
-        return pyarrow.Table.from_pandas(features_df)
+        return features_df
 
     @abstractmethod
     def persist(self, storage: SavedDatasetStorage):
@@ -160,6 +207,117 @@ class RetrievalJob(ABC):
         pass
 
 
+def _warn_experimental_validation():
+    warnings.warn(
+        "Dataset validation is an experimental feature. "
+        "This API is unstable and it could and most probably will be changed in the future. "
+        "We do not guarantee that future changes will maintain backward compatibility.",
+        RuntimeWarning,
+    )
+
+
+class ChunkedRetrievalJob(RetrievalJob):
+    """
+    Retrieval job which runs a separate retrieval for each chunk of an entity dataframe and
+    concatenates their results.
+    """
+
+    def __init__(self, jobs: List[RetrievalJob], max_workers: int = 1):
+        """
+        Args:
+            jobs: Retrieval jobs for each of the chunks, in order.
+            max_workers: Maximum number of chunks which are retrieved in parallel.
+        """
+        assert jobs, "At least one retrieval job is required."
+        self._jobs = jobs
+        self._max_workers = max_workers
+
+    @property
+    def full_feature_names(self) -> bool:
+        return self._jobs[0].full_feature_names
+
+    @property
+    def on_demand_feature_views(self) -> Optional[List[OnDemandFeatureView]]:
+        return self._jobs[0].on_demand_feature_views
+
+    def _to_df_internal(self) -> pd.DataFrame:
+        return pd.concat(
+            self._run_jobs(lambda job: job._to_df_internal()), ignore_index=True
+        )
+
+    def _to_arrow_internal(self) -> pyarrow.Table:
+        tables = [
+            table.replace_schema_metadata()
+            for table in self._run_jobs(lambda job: job._to_arrow_internal())
+        ]
+        try:
+            return pyarrow.concat_tables(tables)
+        except pyarrow.ArrowInvalid:
+            # Chunks can end up with different types, for example when only some of them
+            # are missing values for an integer feature. Pandas knows how to combine those.
+            return pyarrow.Table.from_pandas(
+                pd.concat([table.to_pandas() for table in tables], ignore_index=True)
+            )
+
+    def _to_arrow_batches_internal(self) -> Iterator[pyarrow.RecordBatch]:
+        # The chunks are retrieved lazily, so at most max_workers + 1 of them are held in memory
+        # at any time. Note that the types of the columns can differ between chunks.
+        for table in self._run_jobs(lambda job: job._to_arrow_internal()):
+            yield from table.to_batches()
+
+    def _run_jobs(self, fn: Callable[[RetrievalJob], T]) -> Iterator[T]:
+        if self._max_workers <= 1:
+            for job in self._jobs:
+                yield fn(job)
+            return
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            futures: Deque["Future[T]"] = deque()
+            for job in self._jobs:
+                futures.append(executor.submit(fn, job))
+                if len(futures) > self._max_workers:
+                    yield futures.popleft().result()
+            while futures:
+                yield futures.popleft().result()
+
+    def persist(self, storage: SavedDatasetStorage):
+        if not isinstance(storage, SavedDatasetFileStorage):
+            raise ValueError(
+                "The results of chunked retrievals can only be persisted to files."
+            )
+        filesystem, path = FileSource.create_filesystem_and_path(
+            storage.file_options.uri, storage.file_options.s3_endpoint_override,
+        )
+        if path.endswith(".parquet"):
+            pyarrow.parquet.write_table(
+                self.to_arrow(), where=path, filesystem=filesystem
+            )
+        else:
+            # otherwise assume destination is directory
+            pyarrow.parquet.write_to_dataset(
+                self.to_arrow(), root_path=path, filesystem=filesystem
+            )
+
+    @property
+    def metadata(self) -> Optional[RetrievalMetadata]:
+        job_metadatas = [job.metadata for job in self._jobs]
+        if any(metadata is None for metadata in job_metadatas):
+            return None
+        metadatas = cast(List[RetrievalMetadata], job_metadatas)
+        min_event_timestamps = [m.min_event_timestamp for m in metadatas]
+        max_event_timestamps = [m.max_event_timestamp for m in metadatas]
+        return RetrievalMetadata(
+            features=metadatas[0].features,
+            keys=metadatas[0].keys,
+            min_event_timestamp=None
+            if None in min_event_timestamps
+            else min(cast(List[datetime], min_event_timestamps)),
+            max_event_timestamp=None
+            if None in max_event_timestamps
+            else max(cast(List[datetime], max_event_timestamps)),
+        )
+
+
 class OfflineStore(ABC):
     """
     OfflineStore is an object used for all interaction between Feast and the service used for offline storage of
@@ -42,6 +42,23 @@ def infer_event_timestamp_from_entity_df(entity_schema: Dict[str, np.dtype]) ->
         raise EntityTimestampInferenceException(DEFAULT_ENTITY_DF_EVENT_TIMESTAMP_COL)
 
 
+def split_entity_df_by_time_range(
+    entity_df: pd.DataFrame, chunk_size: int
+) -> List[pd.DataFrame]:
+    """
+    Splits the entity dataframe into chunks of at most chunk_size rows, each of which covers a
+    separate time range, so that retrievals for a chunk only need to scan part of the sources.
+    """
+    entity_df_event_timestamp_col = infer_event_timestamp_from_entity_df(
+        dict(zip(entity_df.columns, entity_df.dtypes))
+    )
+    entity_df = entity_df.sort_values(entity_df_event_timestamp_col, kind="mergesort")
+    return [
+        entity_df.iloc[start : start + chunk_size]
+        for start in range(0, len(entity_df), chunk_size)
+    ]
+
+
 def assert_expected_columns_in_entity_df(
     entity_schema: Dict[str, np.dtype],
     join_keys: Set[str],
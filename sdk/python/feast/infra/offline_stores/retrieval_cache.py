@@ -0,0 +1,173 @@
+import hashlib
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import List, Optional, Union
+
+import pandas as pd
+import pyarrow
+import pyarrow.parquet
+
+from feast.feature_view import FeatureView
+from feast.infra.offline_stores.file_source import get_file_source_version
+from feast.infra.offline_stores.offline_store import RetrievalJob, RetrievalMetadata
+from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.repo_config import RepoConfig
+from feast.saved_dataset import SavedDatasetStorage
+
+
+class RetrievalCache:
+    """
+    Local cache of historical retrieval results, stored as Parquet files.
+
+    Results are keyed by a fingerprint of the entity dataframe, the requested features, the
+    definitions of the feature views and the version of their source data. Only results for
+    which all of these are known locally can be cached, so retrievals with an SQL entity
+    dataframe or with sources that are not local files always bypass the cache.
+    """
+
+    def __init__(self, config: RepoConfig):
+        assert config.retrieval_cache is not None
+        path = Path(config.retrieval_cache.path)
+        if not path.is_absolute() and config.repo_path is not None:
+            path = config.repo_path / path
+        self._config = config
+        self._path = path
+        self._max_size_bytes = config.retrieval_cache.max_size_mb * 1024 * 1024
+
+    def wrap(
+        self,
+        job: RetrievalJob,
+        feature_views: List[FeatureView],
+        feature_refs: List[str],
+        entity_df: Union[pd.DataFrame, str],
+        full_feature_names: bool,
+    ) -> RetrievalJob:
+        """Returns a job that reads the results of the given job from the cache if they are available."""
+        key = _get_fingerprint(
+            self._config, feature_views, feature_refs, entity_df, full_feature_names
+        )
+        if key is None:
+            return job
+        return CachedRetrievalJob(job, self, key)
+
+    def get(self, key: str) -> Optional[pyarrow.Table]:
+        path = self._path / f"{key}.parquet"
+        try:
+            table = pyarrow.parquet.read_table(path)
+        except FileNotFoundError:
+            return None
+        # The modification time is used to evict the least recently used results first.
+        os.utime(path)
+        return table
+
+    def put(self, key: str, table: pyarrow.Table):
+        self._path.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so that concurrent readers never see partial results.
+        tmp_path = self._path / f".{key}.{uuid.uuid4().hex}.tmp"
+        pyarrow.parquet.write_table(table, tmp_path)
+        os.replace(tmp_path, self._path / f"{key}.parquet")
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for path in self._path.glob("*.parquet"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self._max_size_bytes:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            total_size -= size
+
+
+class CachedRetrievalJob(RetrievalJob):
+    """Retrieval job which only runs the wrapped job when its results are not cached yet."""
+
+    def __init__(self, job: RetrievalJob, cache: RetrievalCache, key: str):
+        self._job = job
+        self._cache = cache
+        self._key = key
+
+    @property
+    def full_feature_names(self) -> bool:
+        return self._job.full_feature_names
+
+    @property
+    def on_demand_feature_views(self) -> Optional[List[OnDemandFeatureView]]:
+        return self._job.on_demand_feature_views
+
+    def _to_df_internal(self) -> pd.DataFrame:
+        return self._to_arrow_internal().to_pandas()
+
+    def _to_arrow_internal(self) -> pyarrow.Table:
+        # On demand transformations are applied on top of the cached results, so they are
+        # not part of the cache key.
+        table = self._cache.get(self._key)
+        if table is None:
+            table = self._job._to_arrow_internal()
+            self._cache.put(self._key, table)
+        return table
+
+    def persist(self, storage: SavedDatasetStorage):
+        self._job.persist(storage)
+
+    @property
+    def metadata(self) -> Optional[RetrievalMetadata]:
+        return self._job.metadata
+
+
+def _get_fingerprint(
+    config: RepoConfig,
+    feature_views: List[FeatureView],
+    feature_refs: List[str],
+    entity_df: Union[pd.DataFrame, str],
+    full_feature_names: bool,
+) -> Optional[str]:
+    if not isinstance(entity_df, pd.DataFrame):
+        return None
+
+    fingerprint = hashlib.sha256()
+    fingerprint.update(
+        json.dumps(
+            [
+                config.project,
+                getattr(config.offline_store, "type", None),
+                sorted(feature_refs),
+                full_feature_names,
+                [str(column) for column in entity_df.columns],
+                [str(dtype) for dtype in entity_df.dtypes],
+            ]
+        ).encode()
+    )
+    try:
+        entity_df_hash = pd.util.hash_pandas_object(entity_df, index=True)
+    except TypeError:
+        # Columns with unhashable values, such as lists.
+        return None
+    fingerprint.update(entity_df_hash.values.tobytes())
+
+    for feature_view in sorted(
+        feature_views, key=lambda fv: fv.projection.name_to_use()
+    ):
+        source_version = get_file_source_version(feature_view.batch_source)
+        if source_version is None:
+            return None
+        fingerprint.update(
+            feature_view.to_proto().spec.SerializeToString(deterministic=True)
+        )
+        fingerprint.update(
+            feature_view.projection.to_proto().SerializeToString(deterministic=True)
+        )
+        fingerprint.update(source_version.encode())
+
+    return fingerprint.hexdigest()
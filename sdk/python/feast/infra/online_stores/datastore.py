@@ -13,20 +13,25 @@
 # limitations under the License.
 import itertools
 import logging
+import os
 from datetime import datetime
 from multiprocessing.pool import ThreadPool
 from queue import Queue
 from threading import Lock, Thread
 from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 
-from pydantic import PositiveInt, StrictStr
+from pydantic import PositiveFloat, PositiveInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, utils
 from feast.errors import FeastProviderLoginError
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import DATASTORE_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.helpers import (
+    assemble_online_read_result,
+    compute_entity_id,
+    created_in_another_process,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.DatastoreTable_pb2 import (
     DatastoreTable as DatastoreTableProto,
@@ -72,6 +77,9 @@ class DatastoreOnlineStoreConfig(FeastConfigBaseModel):
     write_batch_size: Optional[PositiveInt] = 50
     """ (optional) Amount of feature rows per batch being written into Datastore"""
 
+    read_timeout: Optional[PositiveFloat] = None
+    """ (optional) Timeout (in seconds) of reading feature rows from Datastore"""
+
 
 class DatastoreOnlineStore(OnlineStore):
     """
@@ -80,6 +88,7 @@ class DatastoreOnlineStore(OnlineStore):
     """
 
     _client: Optional[datastore.Client] = None
+    _client_pid: Optional[int] = None
 
     @log_exceptions_and_usage(online_store="datastore")
     def update(
@@ -134,12 +143,26 @@ class DatastoreOnlineStore(OnlineStore):
             client.delete(key)
 
     def _get_client(self, online_config: DatastoreOnlineStoreConfig):
-        if not self._client:
+        if not self._client or created_in_another_process(self._client_pid):
             self._client = _initialize_client(
                 online_config.project_id, online_config.namespace
             )
+            self._client_pid = os.getpid()
         return self._client
 
+    def warm_up(self, config: RepoConfig, tables: Sequence[FeatureView]) -> None:
+        online_config = config.online_store
+        assert isinstance(online_config, DatastoreOnlineStoreConfig)
+        client = self._get_client(online_config)
+
+        client.get_multi(
+            [
+                client.key("Project", config.project, "Table", table.name)
+                for table in tables
+            ],
+            timeout=online_config.read_timeout,
+        )
+
     @log_exceptions_and_usage(online_store="datastore")
     def online_write_batch(
         self,
@@ -239,7 +262,6 @@ class DatastoreOnlineStore(OnlineStore):
         feast_project = config.project
 
         keys: List[Key] = []
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
         for entity_key in entity_keys:
             document_id = compute_entity_id(entity_key)
             key = client.key(
@@ -250,21 +272,25 @@ class DatastoreOnlineStore(OnlineStore):
         # NOTE: get_multi doesn't return values in the same order as the keys in the request.
         # Also, len(values) can be less than len(keys) in the case of missing values.
         with tracing_span(name="remote_call"):
-            values = client.get_multi(keys)
-        values_dict = {v.key: v for v in values} if values is not None else {}
-        for key in keys:
-            if key in values_dict:
-                value = values_dict[key]
-                res = {}
-                for feature_name, value_bin in value["values"].items():
-                    val = ValueProto()
-                    val.ParseFromString(value_bin)
-                    res[feature_name] = val
-                result.append((value["event_ts"], res))
-            else:
-                result.append((None, None))
-
-        return result
+            values = client.get_multi(keys, timeout=online_config.read_timeout)
+        rows = []
+        for value in values or []:
+            # Lookups cannot be projected onto the requested features, so only their values
+            # are deserialized instead.
+            stored_values = value["values"]
+            feature_names = (
+                stored_values.keys()
+                if requested_features is None
+                else [f for f in requested_features if f in stored_values]
+            )
+            res = {}
+            for feature_name in feature_names:
+                val = ValueProto()
+                val.ParseFromString(stored_values[feature_name])
+                res[feature_name] = val
+            rows.append((value.key, (value["event_ts"], res)))
+
+        return assemble_online_read_result(keys, rows)
 
 
 def _delete_all_values(client, key):
@@ -13,15 +13,25 @@
 # limitations under the License.
 import itertools
 import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
-from pydantic import StrictStr
+from pydantic import NonNegativeInt, PositiveFloat, PositiveInt, StrictStr
 from pydantic.typing import Literal, Union
 
 from feast import Entity, FeatureView, utils
+from feast.errors import DynamoDBUnprocessedItems
 from feast.infra.infra_object import DYNAMODB_INFRA_OBJECT_CLASS_TYPE, InfraObject
-from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.helpers import (
+    assemble_online_read_result,
+    compute_entity_id,
+    created_in_another_process,
+)
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.core.DynamoDBTable_pb2 import (
     DynamoDBTable as DynamoDBTableProto,
@@ -34,6 +44,7 @@ from feast.usage import log_exceptions_and_usage, tracing_span
 
 try:
     import boto3
+    from botocore.config import Config
     from botocore.exceptions import ClientError
 except ImportError as e:
     from feast.errors import FeastExtrasDependencyImportError
@@ -60,23 +71,43 @@ class DynamoDBOnlineStoreConfig(FeastConfigBaseModel):
     """AWS Region Name"""
 
     sort_response: bool = True
-    """Whether or not to sort BatchGetItem response."""
+    """Deprecated: BatchGetItem responses are always returned in the order of the entity keys."""
 
     table_name_template: StrictStr = "{project}.{table_name}"
     """DynamoDB table name template"""
 
+    max_pool_connections: PositiveInt = 10
+    """Maximum number of connections in the connection pool of the DynamoDB client."""
+
+    connect_timeout: Optional[PositiveFloat] = None
+    """(Optional) Timeout (in seconds) of connecting to DynamoDB, 60 seconds by default."""
+
+    read_timeout: Optional[PositiveFloat] = None
+    """(Optional) Timeout (in seconds) of reading from a connection, 60 seconds by default."""
+
+    tcp_keepalive: Optional[bool] = None
+    """(Optional) Whether to enable TCP keepalive on the connections, which requires botocore 1.27.84 or newer."""
+
+    write_concurrency: PositiveInt = 1
+    """Number of threads writing items in parallel BatchWriteItem calls, which should not exceed
+     max_pool_connections."""
+
+    max_write_retries: NonNegativeInt = 8
+    """Number of times items which DynamoDB did not process, e.g. because of throttling, are written again
+     with exponential backoff."""
+
 
 class DynamoDBOnlineStore(OnlineStore):
     """
     Online feature store for AWS DynamoDB.
 
     Attributes:
-        _dynamodb_client: Boto3 DynamoDB client.
         _dynamodb_resource: Boto3 DynamoDB resource.
+        _dynamodb_resource_pid: The process in which the resource was created.
     """
 
-    _dynamodb_client = None
     _dynamodb_resource = None
+    _dynamodb_resource_pid: Optional[int] = None
 
     @log_exceptions_and_usage(online_store="dynamodb")
     def update(
@@ -98,12 +129,8 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_client = self._get_dynamodb_client(
-            online_config.region, online_config.endpoint_url
-        )
-        dynamodb_resource = self._get_dynamodb_resource(
-            online_config.region, online_config.endpoint_url
-        )
+        dynamodb_client = self._get_dynamodb_client(online_config)
+        dynamodb_resource = self._get_dynamodb_resource(online_config)
 
         for table_instance in tables_to_keep:
             try:
@@ -148,9 +175,7 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_resource = self._get_dynamodb_resource(
-            online_config.region, online_config.endpoint_url
-        )
+        dynamodb_resource = self._get_dynamodb_resource(online_config)
 
         for table in tables:
             _delete_table_idempotent(
@@ -170,8 +195,9 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         Write a batch of feature rows to online DynamoDB store.
 
-        Note: This method applies a ``batch_writer`` to automatically handle any unprocessed items
-        and resend them as needed, this is useful if you're loading a lot of data at a time.
+        Note: Only the latest row of each entity key is written. The rows are written by
+        ``write_concurrency`` threads in BatchWriteItem calls, and the items which DynamoDB did not
+        process are written again, which is useful if you're loading a lot of data at a time.
 
         Args:
             config: The RepoConfig for the current FeatureStore.
@@ -184,14 +210,12 @@ class DynamoDBOnlineStore(OnlineStore):
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_resource = self._get_dynamodb_resource(
-            online_config.region, online_config.endpoint_url
-        )
+        dynamodb_resource = self._get_dynamodb_resource(online_config)
 
         table_instance = dynamodb_resource.Table(
             _get_table_name(online_config, config, table)
         )
-        self._write_batch_non_duplicates(table_instance, data, progress)
+        self._write_batch_non_duplicates(table_instance, data, progress, online_config)
 
     @log_exceptions_and_usage(online_store="dynamodb")
     def online_read(
@@ -211,21 +235,22 @@ class DynamoDBOnlineStore(OnlineStore):
             config: The RepoConfig for the current FeatureStore.
             table: Feast FeatureView.
             entity_keys: a list of entity keys that should be read from the FeatureStore.
+            requested_features: The names of the features to read. If not provided, all
+                features are read.
         """
         online_config = config.online_store
         assert isinstance(online_config, DynamoDBOnlineStoreConfig)
-        dynamodb_resource = self._get_dynamodb_resource(
-            online_config.region, online_config.endpoint_url
-        )
+        dynamodb_resource = self._get_dynamodb_resource(online_config)
         table_instance = dynamodb_resource.Table(
             _get_table_name(online_config, config, table)
         )
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
         entity_ids = [compute_entity_id(entity_key) for entity_key in entity_keys]
         batch_size = online_config.batch_size
-        sort_response = online_config.sort_response
-        entity_ids_iter = iter(entity_ids)
+        projection = _get_projection(requested_features)
+        rows = []
+        # BatchGetItem rejects duplicate keys, which are only read once.
+        entity_ids_iter = iter(dict.fromkeys(entity_ids))
         while True:
             batch = list(itertools.islice(entity_ids_iter, batch_size))
             # No more items to insert
@@ -233,7 +258,8 @@ class DynamoDBOnlineStore(OnlineStore):
                 break
             batch_entity_ids = {
                 table_instance.name: {
-                    "Keys": [{"entity_id": entity_id} for entity_id in batch]
+                    "Keys": [{"entity_id": entity_id} for entity_id in batch],
+                    **projection,
                 }
             }
             with tracing_span(name="remote_call"):
@@ -241,50 +267,54 @@ class DynamoDBOnlineStore(OnlineStore):
                     RequestItems=batch_entity_ids
                 )
             response = response.get("Responses")
-            table_responses = response.get(table_instance.name)
-            if table_responses:
-                if sort_response:
-                    table_responses = self._sort_dynamodb_response(
-                        table_responses, entity_ids
+            for tbl_res in response.get(table_instance.name, []):
+                res = {}
+                # Items without any of the requested features have no values.
+                for feature_name, value_bin in tbl_res.get("values", {}).items():
+                    val = ValueProto()
+                    val.ParseFromString(value_bin.value)
+                    res[feature_name] = val
+                rows.append(
+                    (
+                        tbl_res["entity_id"],
+                        (datetime.fromisoformat(tbl_res["event_ts"]), res),
                     )
-                for tbl_res in table_responses:
-                    res = {}
-                    for feature_name, value_bin in tbl_res["values"].items():
-                        val = ValueProto()
-                        val.ParseFromString(value_bin.value)
-                        res[feature_name] = val
-                    result.append((datetime.fromisoformat(tbl_res["event_ts"]), res))
-            else:
-                batch_size_nones = ((None, None),) * len(batch)
-                result.extend(batch_size_nones)
-        return result
+                )
+        # DynamoDB Batch Get Item doesn't return items in a particular order, and doesn't
+        # return the missing ones.
+        return assemble_online_read_result(entity_ids, rows)
 
-    def _get_dynamodb_client(self, region: str, endpoint_url: Optional[str] = None):
-        if self._dynamodb_client is None:
-            self._dynamodb_client = _initialize_dynamodb_client(region, endpoint_url)
-        return self._dynamodb_client
+    def warm_up(self, config: RepoConfig, tables: Sequence[FeatureView]) -> None:
+        online_config = config.online_store
+        assert isinstance(online_config, DynamoDBOnlineStoreConfig)
+        dynamodb_client = self._get_dynamodb_client(online_config)
+        if not tables:
+            return
 
-    def _get_dynamodb_resource(self, region: str, endpoint_url: Optional[str] = None):
-        if self._dynamodb_resource is None:
+        # A single request opens a connection, whichever table it is for.
+        table_name = _get_table_name(online_config, config, tables[0])
+        try:
+            dynamodb_client.describe_table(TableName=table_name)
+        except ClientError as ce:
+            # Any response, even an error, means that the connection is open.
+            logger.debug(f"Failed to describe table {table_name}: {ce}")
+
+    def _get_dynamodb_client(self, online_config: DynamoDBOnlineStoreConfig):
+        # The client shares the connection pool of the resource.
+        return self._get_dynamodb_resource(online_config).meta.client
+
+    def _get_dynamodb_resource(self, online_config: DynamoDBOnlineStoreConfig):
+        if self._dynamodb_resource is None or created_in_another_process(
+            self._dynamodb_resource_pid
+        ):
             self._dynamodb_resource = _initialize_dynamodb_resource(
-                region, endpoint_url
+                online_config.region,
+                online_config.endpoint_url,
+                _get_client_config(online_config),
             )
+            self._dynamodb_resource_pid = os.getpid()
         return self._dynamodb_resource
 
-    def _sort_dynamodb_response(self, responses: list, order: list):
-        """DynamoDB Batch Get Item doesn't return items in a particular order."""
-        # Assign an index to order
-        order_with_index = {value: idx for idx, value in enumerate(order)}
-        # Sort table responses by index
-        table_responses_ordered = [
-            (order_with_index[tbl_res["entity_id"]], tbl_res) for tbl_res in responses
-        ]
-        table_responses_ordered = sorted(
-            table_responses_ordered, key=lambda tup: tup[0]
-        )
-        _, table_responses_ordered = zip(*table_responses_ordered)
-        return table_responses_ordered
-
     @log_exceptions_and_usage(online_store="dynamodb")
     def _write_batch_non_duplicates(
         self,
@@ -293,31 +323,166 @@ class DynamoDBOnlineStore(OnlineStore):
             Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
         ],
         progress: Optional[Callable[[int], Any]],
+        online_config: DynamoDBOnlineStoreConfig,
+    ):
+        """
+        Deduplicate write batch request items on ``entity_id`` primary key, keeping the latest
+        event timestamp, and write them in parallel.
+
+        The items are partitioned by ``entity_id`` between the writing threads, which share the
+        thread-safe client of the table, which also serializes the items.
+        """
+        latest_rows: Dict[str, Tuple[datetime, Dict[str, ValueProto]]] = {}
+        for entity_key, features, timestamp, _ in data:
+            entity_id = compute_entity_id(entity_key)
+            timestamp = utils.make_tzaware(timestamp)
+            if entity_id not in latest_rows or timestamp >= latest_rows[entity_id][0]:
+                latest_rows[entity_id] = (timestamp, features)
+
+        # The duplicate rows are not written, but are still reported.
+        if progress and len(data) > len(latest_rows):
+            progress(len(data) - len(latest_rows))
+
+        num_partitions = min(online_config.write_concurrency, len(latest_rows))
+        partitions: List[List[Dict[str, Any]]] = [[] for _ in range(num_partitions)]
+        for entity_id, (timestamp, features) in latest_rows.items():
+            partitions[int(entity_id, 16) % num_partitions].append(
+                {
+                    "entity_id": entity_id,  # PartitionKey
+                    "event_ts": str(timestamp),
+                    "values": {
+                        k: v.SerializeToString()
+                        for k, v in features.items()  # Serialized Features
+                    },
+                }
+            )
+
+        writer = _BatchWriter(
+            table_instance.meta.client,
+            table_instance.name,
+            progress,
+            online_config.max_write_retries,
+        )
+        if num_partitions == 1:
+            writer.write(partitions[0])
+        elif num_partitions > 1:
+            with ThreadPoolExecutor(max_workers=num_partitions) as executor:
+                # Consuming the results raises the errors of the threads.
+                list(executor.map(writer.write, partitions))
+
+
+# DynamoDB accepts at most this number of items in a BatchWriteItem call.
+MAX_BATCH_WRITE_ITEMS = 25
+# Bounds (in seconds) of the exponential backoff before writing unprocessed items again.
+BATCH_WRITE_BASE_BACKOFF = 0.05
+BATCH_WRITE_MAX_BACKOFF = 10
+
+
+class _BatchWriter:
+    """
+    Writes items in BatchWriteItem calls, and writes the items which DynamoDB did not process
+    again with exponential backoff and jitter. Progress is reported as items are processed.
+    """
+
+    def __init__(
+        self,
+        dynamodb_client,
+        table_name: str,
+        progress: Optional[Callable[[int], Any]],
+        max_retries: int,
     ):
-        """Deduplicate write batch request items on ``entity_id`` primary key."""
-        with table_instance.batch_writer(overwrite_by_pkeys=["entity_id"]) as batch:
-            for entity_key, features, timestamp, created_ts in data:
-                entity_id = compute_entity_id(entity_key)
-                batch.put_item(
-                    Item={
-                        "entity_id": entity_id,  # PartitionKey
-                        "event_ts": str(utils.make_tzaware(timestamp)),
-                        "values": {
-                            k: v.SerializeToString()
-                            for k, v in features.items()  # Serialized Features
-                        },
-                    }
+        self.dynamodb_client = dynamodb_client
+        self.table_name = table_name
+        self.progress = progress
+        self.max_retries = max_retries
+        # Progress is reported from several threads.
+        self._progress_lock = threading.Lock()
+
+    def write(self, items: List[Dict[str, Any]]):
+        for start in range(0, len(items), MAX_BATCH_WRITE_ITEMS):
+            requests = [
+                {"PutRequest": {"Item": item}}
+                for item in items[start : start + MAX_BATCH_WRITE_ITEMS]
+            ]
+            for attempt in itertools.count():
+                with tracing_span(name="remote_call"):
+                    response = self.dynamodb_client.batch_write_item(
+                        RequestItems={self.table_name: requests}
+                    )
+                unprocessed = response.get("UnprocessedItems", {}).get(
+                    self.table_name, []
+                )
+                if self.progress and len(requests) > len(unprocessed):
+                    with self._progress_lock:
+                        self.progress(len(requests) - len(unprocessed))
+                if not unprocessed:
+                    break
+                if attempt >= self.max_retries:
+                    raise DynamoDBUnprocessedItems(self.table_name, len(unprocessed))
+
+                requests = unprocessed
+                time.sleep(
+                    random.uniform(
+                        0,
+                        min(
+                            BATCH_WRITE_MAX_BACKOFF,
+                            BATCH_WRITE_BASE_BACKOFF * 2 ** attempt,
+                        ),
+                    )
                 )
-                if progress:
-                    progress(1)
 
 
-def _initialize_dynamodb_client(region: str, endpoint_url: Optional[str] = None):
-    return boto3.client("dynamodb", region_name=region, endpoint_url=endpoint_url)
+def _initialize_dynamodb_client(
+    region: str, endpoint_url: Optional[str] = None, config: Optional[Config] = None
+):
+    return boto3.client(
+        "dynamodb", region_name=region, endpoint_url=endpoint_url, config=config
+    )
+
 
+def _initialize_dynamodb_resource(
+    region: str, endpoint_url: Optional[str] = None, config: Optional[Config] = None
+):
+    return boto3.resource(
+        "dynamodb", region_name=region, endpoint_url=endpoint_url, config=config
+    )
 
-def _initialize_dynamodb_resource(region: str, endpoint_url: Optional[str] = None):
-    return boto3.resource("dynamodb", region_name=region, endpoint_url=endpoint_url)
+
+def _get_client_config(online_config: DynamoDBOnlineStoreConfig) -> Config:
+    kwargs: Dict[str, Any] = {
+        "max_pool_connections": online_config.max_pool_connections
+    }
+    # Only the options which are set are passed, since older versions of botocore don't support all of them.
+    for option in ("connect_timeout", "read_timeout", "tcp_keepalive"):
+        value = getattr(online_config, option)
+        if value is not None:
+            kwargs[option] = value
+    return Config(**kwargs)
+
+
+# DynamoDB rejects expressions which are longer than this.
+MAX_EXPRESSION_LENGTH = 4096
+
+
+def _get_projection(requested_features: Optional[List[str]]) -> Dict[str, Any]:
+    """
+    Returns the arguments of a BatchGetItem request which only read the requested features, or
+    no arguments if all features should be read. Names are passed as expression attribute names,
+    since "values" is a reserved word and feature names may contain characters like dots.
+    """
+    if requested_features is None:
+        return {}
+    paths = [f"#values.#f{i}" for i in range(len(requested_features))]
+    projection_expression = ", ".join(["entity_id", "event_ts", *paths])
+    if len(projection_expression) > MAX_EXPRESSION_LENGTH:
+        return {}
+    return {
+        "ProjectionExpression": projection_expression,
+        "ExpressionAttributeNames": {
+            "#values": "values",
+            **{f"#f{i}": name for i, name in enumerate(requested_features)},
+        },
+    }
 
 
 # TODO(achals): This form of user-facing templating is experimental.
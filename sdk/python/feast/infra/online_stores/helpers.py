@@ -1,5 +1,7 @@
+import os
 import struct
-from typing import Any, List
+from datetime import datetime
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
 
 import mmh3
 
@@ -10,6 +12,10 @@ from feast.infra.key_encoding_utils import (
 )
 from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+# The result of online_read for an entity key which is not found in the online store.
+NOT_FOUND: Tuple[None, None] = (None, None)
 
 
 def get_online_store_from_config(online_store_config: Any) -> OnlineStore:
@@ -21,6 +27,15 @@ def get_online_store_from_config(online_store_config: Any) -> OnlineStore:
     return online_store_class()
 
 
+def created_in_another_process(pid: Optional[int]) -> bool:
+    """
+    Returns whether a client created in the process with the given pid, if any, has to be created again in
+    this process. Connections can't be shared with forked processes, e.g. the workers of pre-fork servers,
+    which create their own clients.
+    """
+    return pid != os.getpid()
+
+
 def _redis_key(project: str, entity_key: EntityKeyProto) -> bytes:
     key: List[bytes] = [serialize_entity_key(entity_key), project.encode("utf-8")]
     return b"".join(key)
@@ -30,6 +45,22 @@ def _redis_key_prefix(entity_keys: List[str]) -> bytes:
     return serialize_entity_key_prefix(entity_keys)
 
 
+def _redis_feature_view_key_prefix(project: str, feature_view: str) -> bytes:
+    """
+    Returns the prefix of the keys of a feature view in the feature_view key layout of Redis: a
+    64 bits hash of the project and the name of the feature view.
+    """
+    return mmh3.hash_bytes(f"{project}:{feature_view}")[:8]
+
+
+def _redis_feature_view_key(key_prefix: bytes, entity_key: EntityKeyProto) -> bytes:
+    """
+    Returns the key of an entity in the feature_view key layout of Redis: the prefix of the feature
+    view, followed by a 96 bits hash of the entity key.
+    """
+    return key_prefix + mmh3.hash_bytes(serialize_entity_key(entity_key))[:12]
+
+
 def _mmh3(key: str):
     """
     Calculate murmur3_32 hash which is equal to scala version which is using little endian:
@@ -47,3 +78,25 @@ def compute_entity_id(entity_key: EntityKeyProto) -> str:
     It has nothing to do with the Entity concept we have in Feast.
     """
     return mmh3.hash_bytes(serialize_entity_key(entity_key)).hex()
+
+
+def assemble_online_read_result(
+    keys: Sequence[Hashable],
+    rows: Iterable[
+        Tuple[Hashable, Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]
+    ],
+) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+    """
+    Returns the result of online_read, in the order of the requested keys, given the rows read by
+    key in any order.
+
+    The rows are mapped back to the positions of their keys without sorting. The keys which are
+    not read are NOT_FOUND, so that the result is always aligned with the requested keys.
+
+    Args:
+        keys: The keys of the requested entities, in the order of the request. Keys may be
+            requested several times.
+        rows: The keys which are read, and their event timestamps and feature values.
+    """
+    rows_by_key = dict(rows)
+    return [rows_by_key.get(key, NOT_FOUND) for key in keys]
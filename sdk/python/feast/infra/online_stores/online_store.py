@@ -14,7 +14,7 @@
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 from feast import Entity
 from feast.feature_view import FeatureView
@@ -58,6 +58,33 @@ class OnlineStore(ABC):
         """
         ...
 
+    def online_write_batches(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        batches: Iterable[
+            List[
+                Tuple[
+                    EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]
+                ]
+            ]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        """
+        Write several batches of feature rows to the online store, e.g. all the rows materialized for a
+        feature view. By default, every batch is written by online_write_batch.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            table: Feast FeatureView
+            batches: batches of quadruplets containing Feature data, see online_write_batch.
+            progress: Optional function to be called once every mini-batch of rows is written to
+            the online store. Can be used to display progress.
+        """
+        for data in batches:
+            self.online_write_batch(config, table, data, progress)
+
     @abstractmethod
     def online_read(
         self,
@@ -94,6 +121,16 @@ class OnlineStore(ABC):
     ):
         ...
 
+    def warm_up(self, config: RepoConfig, tables: Sequence[FeatureView]) -> None:
+        """
+        Opens the connections to the online store ahead of the first reads. By default, does nothing.
+
+        Args:
+            config: The RepoConfig for the current FeatureStore.
+            tables: The feature views which will be read.
+        """
+        pass
+
     def plan(
         self, config: RepoConfig, desired_registry_proto: RegistryProto
     ) -> List[InfraObject]:
@@ -13,6 +13,8 @@
 # limitations under the License.
 import json
 import logging
+import os
+import re
 from datetime import datetime
 from enum import Enum
 from typing import (
@@ -20,6 +22,7 @@ from typing import (
     ByteString,
     Callable,
     Dict,
+    Iterator,
     List,
     Optional,
     Sequence,
@@ -29,12 +32,25 @@ from typing import (
 
 import pytz
 from google.protobuf.timestamp_pb2 import Timestamp
-from pydantic import StrictStr
+from pydantic import PositiveFloat, PositiveInt, StrictStr
 from pydantic.typing import Literal
 
 from feast import Entity, FeatureView, RepoConfig, utils
-from feast.infra.online_stores.helpers import _mmh3, _redis_key, _redis_key_prefix
+from feast.infra.online_stores.helpers import (
+    NOT_FOUND,
+    _mmh3,
+    _redis_feature_view_key,
+    _redis_feature_view_key_prefix,
+    _redis_key,
+    _redis_key_prefix,
+    created_in_another_process,
+)
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.value_encoding_utils import (
+    deserialize_values,
+    get_value_types,
+    serialize_value,
+)
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import FeastConfigBaseModel
@@ -56,6 +72,11 @@ class RedisType(str, Enum):
     redis_cluster = "redis_cluster"
 
 
+class RedisKeyLayout(str, Enum):
+    entity = "entity"
+    feature_view = "feature_view"
+
+
 class RedisOnlineStoreConfig(FeastConfigBaseModel):
     """Online store config for Redis store"""
 
@@ -72,9 +93,39 @@ class RedisOnlineStoreConfig(FeastConfigBaseModel):
     key_ttl_seconds: Optional[int] = None
     """(Optional) redis key bin ttl (in seconds) for expiring entities"""
 
+    max_connections: Optional[PositiveInt] = None
+    """(Optional) Maximum number of connections in the connection pool, unlimited by default"""
+
+    socket_timeout: Optional[PositiveFloat] = None
+    """(Optional) Timeout (in seconds) of the commands sent to Redis"""
+
+    socket_connect_timeout: Optional[PositiveFloat] = None
+    """(Optional) Timeout (in seconds) of connecting to Redis"""
+
+    socket_keepalive: bool = False
+    """Whether to enable TCP keepalive on the connections"""
+
+    value_encoding: Literal["proto", "typed"] = "proto"
+    """Encoding of the stored feature values: proto or typed"""
+
+    key_layout: RedisKeyLayout = RedisKeyLayout.entity
+    """Layout of the keys: entity, one hash per entity key holding the features of all feature views, or
+     feature_view, one hash per feature view and entity key, whose keys are short hashes prefixed by a hash of
+     the feature view, which use less memory and can be deleted per feature view. Changing the layout requires
+     materializing the features again."""
+
 
 class RedisOnlineStore(OnlineStore):
+    """
+    Online feature store for Redis.
+
+    Attributes:
+        _client: Redis connection.
+        _client_pid: The process in which the client was created.
+    """
+
     _client: Optional[Union[Redis, RedisCluster]] = None
+    _client_pid: Optional[int] = None
 
     def delete_entity_values(self, config: RepoConfig, join_keys: List[str]):
         client = self._get_client(config.online_store)
@@ -91,6 +142,22 @@ class RedisOnlineStore(OnlineStore):
 
         logger.debug(f"Deleted {deleted_count} rows for entity {', '.join(join_keys)}")
 
+    def delete_feature_view_values(self, config: RepoConfig, table: FeatureView):
+        """Deletes the keys of a feature view in the feature_view key layout."""
+        client = self._get_client(config.online_store)
+        deleted_count = 0
+        pipeline = client.pipeline(transaction=False)
+        prefix = _redis_feature_view_key_prefix(config.project, table.name)
+
+        # The prefix is binary, so its characters that are special in glob-style patterns are escaped.
+        pattern = re.sub(rb"([*?\[\]\\])", rb"\\\1", prefix) + b"*"
+        for _k in client.scan_iter(pattern):
+            pipeline.delete(_k)
+            deleted_count += 1
+        pipeline.execute()
+
+        logger.debug(f"Deleted {deleted_count} rows for feature view {table.name}")
+
     @log_exceptions_and_usage(online_store="redis")
     def update(
         self,
@@ -105,7 +172,13 @@ class RedisOnlineStore(OnlineStore):
         Look for join_keys (list of entities) that are not in use anymore
         (usually this happens when the last feature view that was using specific compound key is deleted)
         and remove all features attached to this "join_keys".
+        In the feature_view key layout, the keys of the deleted feature views are removed instead.
         """
+        if config.online_store.key_layout == RedisKeyLayout.feature_view:
+            for table in tables_to_delete:
+                self.delete_feature_view_values(config, table)
+            return
+
         join_keys_to_keep = set(tuple(table.entities) for table in tables_to_keep)
 
         join_keys_to_delete = set(tuple(table.entities) for table in tables_to_delete)
@@ -122,6 +195,11 @@ class RedisOnlineStore(OnlineStore):
         """
         We delete the keys in redis for tables/views being removed.
         """
+        if config.online_store.key_layout == RedisKeyLayout.feature_view:
+            for table in tables:
+                self.delete_feature_view_values(config, table)
+            return
+
         join_keys_to_delete = set(tuple(table.entities) for table in tables)
 
         for join_keys in join_keys_to_delete:
@@ -159,10 +237,17 @@ class RedisOnlineStore(OnlineStore):
         """
         Creates the Redis client RedisCluster or Redis depending on configuration
         """
-        if not self._client:
-            startup_nodes, kwargs = self._parse_connection_string(
+        if not self._client or created_in_another_process(self._client_pid):
+            startup_nodes, connection_string_kwargs = self._parse_connection_string(
                 online_store_config.connection_string
             )
+            kwargs: Dict[str, Any] = {
+                "max_connections": online_store_config.max_connections,
+                "socket_timeout": online_store_config.socket_timeout,
+                "socket_connect_timeout": online_store_config.socket_connect_timeout,
+                "socket_keepalive": online_store_config.socket_keepalive,
+            }
+            kwargs.update(connection_string_kwargs)
             if online_store_config.redis_type == RedisType.redis_cluster:
                 kwargs["startup_nodes"] = startup_nodes
                 self._client = RedisCluster(**kwargs)
@@ -170,8 +255,34 @@ class RedisOnlineStore(OnlineStore):
                 kwargs["host"] = startup_nodes[0]["host"]
                 kwargs["port"] = startup_nodes[0]["port"]
                 self._client = Redis(**kwargs)
+            self._client_pid = os.getpid()
         return self._client
 
+    def warm_up(self, config: RepoConfig, tables: Sequence[FeatureView]) -> None:
+        online_store_config = config.online_store
+        assert isinstance(online_store_config, RedisOnlineStoreConfig)
+
+        self._get_client(online_store_config).ping()
+
+    @staticmethod
+    def _get_keys(
+        config: RepoConfig, table: FeatureView, entity_keys: List[EntityKeyProto]
+    ) -> Tuple[List[bytes], str]:
+        """
+        Returns the Redis keys of the given entities for a feature view, and the field of their
+        event timestamp, in the configured key layout.
+        """
+        if config.online_store.key_layout == RedisKeyLayout.feature_view:
+            prefix = _redis_feature_view_key_prefix(config.project, table.name)
+            keys = [
+                _redis_feature_view_key(prefix, entity_key)
+                for entity_key in entity_keys
+            ]
+            return keys, "_ts"
+
+        keys = [_redis_key(config.project, entity_key) for entity_key in entity_keys]
+        return keys, f"_ts:{table.name}"
+
     @log_exceptions_and_usage(online_store="redis")
     def online_write_batch(
         self,
@@ -186,19 +297,18 @@ class RedisOnlineStore(OnlineStore):
         assert isinstance(online_store_config, RedisOnlineStoreConfig)
 
         client = self._get_client(online_store_config)
-        project = config.project
 
         feature_view = table.name
-        ts_key = f"_ts:{feature_view}"
-        keys = []
+        keys, ts_key = self._get_keys(
+            config, table, [entity_key for entity_key, _, _, _ in data]
+        )
+        value_types = get_value_types(table)
         # redis pipelining optimization: send multiple commands to redis server without waiting for every reply
         with client.pipeline(transaction=False) as pipe:
             # check if a previous record under the key bin exists
             # TODO: investigate if check and set is a better approach rather than pulling all entity ts and then setting
             # it may be significantly slower but avoids potential (rare) race conditions
-            for entity_key, _, _, _ in data:
-                redis_key_bin = _redis_key(project, entity_key)
-                keys.append(redis_key_bin)
+            for redis_key_bin in keys:
                 pipe.hmget(redis_key_bin, ts_key)
             prev_event_timestamps = pipe.execute()
             # flattening the list of lists. `hmget` does the lookup assuming a list of keys in the key bin
@@ -226,7 +336,11 @@ class RedisOnlineStore(OnlineStore):
 
                 for feature_name, val in values.items():
                     f_key = _mmh3(f"{feature_view}:{feature_name}")
-                    entity_hset[f_key] = val.SerializeToString()
+                    entity_hset[f_key] = serialize_value(
+                        val,
+                        value_types.get(feature_name),
+                        online_store_config.value_encoding,
+                    )
 
                 pipe.hset(redis_key_bin, mapping=entity_hset)
 
@@ -251,7 +365,6 @@ class RedisOnlineStore(OnlineStore):
 
         client = self._get_client(online_store_config)
         feature_view = table.name
-        project = config.project
 
         result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
 
@@ -260,22 +373,28 @@ class RedisOnlineStore(OnlineStore):
 
         hset_keys = [_mmh3(f"{feature_view}:{k}") for k in requested_features]
 
-        ts_key = f"_ts:{feature_view}"
+        keys, ts_key = self._get_keys(config, table, entity_keys)
         hset_keys.append(ts_key)
         requested_features.append(ts_key)
 
-        keys = []
-        for entity_key in entity_keys:
-            redis_key_bin = _redis_key(project, entity_key)
-            keys.append(redis_key_bin)
         with client.pipeline(transaction=False) as pipe:
             for redis_key_bin in keys:
                 pipe.hmget(redis_key_bin, hset_keys)
             with tracing_span(name="remote_call"):
                 redis_values = pipe.execute()
+        # The values of missing features are empty.
+        vals = iter(
+            deserialize_values(
+                [
+                    bytes(val_bin) if val_bin else b""
+                    for values in redis_values
+                    for val_bin in values[:-1]
+                ]
+            )
+        )
         for values in redis_values:
             features = self._get_features_for_entity(
-                values, feature_view, requested_features
+                values, vals, feature_view, requested_features
             )
             result.append(features)
         return result
@@ -283,25 +402,26 @@ class RedisOnlineStore(OnlineStore):
     def _get_features_for_entity(
         self,
         values: List[ByteString],
+        vals: Iterator[ValueProto],
         feature_view: str,
         requested_features: List[str],
     ) -> Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]:
-        res_val = dict(zip(requested_features, values))
-
+        """
+        Returns the features of an entity, given the values read from Redis, whose last one is
+        the event timestamp, and the deserialized values of all entities from the current one.
+        """
         res_ts = Timestamp()
-        ts_val = res_val.pop(f"_ts:{feature_view}")
+        ts_val = values[-1]
         if ts_val:
             res_ts.ParseFromString(bytes(ts_val))
 
         res = {}
-        for feature_name, val_bin in res_val.items():
-            val = ValueProto()
-            if val_bin:
-                val.ParseFromString(bytes(val_bin))
-            res[feature_name] = val
-
-        if not res:
-            return None, None
+        for feature_name in requested_features[:-1]:
+            res[feature_name] = next(vals)
+
+        # Entities whose features were never written have no event timestamp.
+        if not res or not ts_val:
+            return NOT_FOUND
         else:
             timestamp = datetime.fromtimestamp(res_ts.seconds, tz=pytz.utc)
             return timestamp, res
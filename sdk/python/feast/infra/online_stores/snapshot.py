@@ -0,0 +1,469 @@
+# Copyright 2022 The Feast Authors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import json
+import mmap
+import os
+import struct
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import mmh3
+import numpy as np
+from pydantic import StrictStr
+from pydantic.schema import Literal
+
+from feast import Entity
+from feast.feature_view import FeatureView
+from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import NOT_FOUND
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.value_encoding_utils import (
+    deserialize_values,
+    get_value_types,
+    serialize_value,
+)
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.repo_config import FeastConfigBaseModel, RepoConfig
+from feast.usage import log_exceptions_and_usage, tracing_span
+from feast.utils import to_naive_utc
+
+
+class SnapshotOnlineStoreConfig(FeastConfigBaseModel):
+    """Online store config for read-only snapshot files"""
+
+    type: Literal[
+        "snapshot", "feast.infra.online_stores.snapshot.SnapshotOnlineStore"
+    ] = "snapshot"
+    """ Online store type selector"""
+
+    path: StrictStr = "data/online_snapshot"
+    """ (optional) Path to the directory with the snapshot files """
+
+    value_encoding: Literal["proto", "typed"] = "proto"
+    """ (optional) Encoding of the stored feature values: proto or typed """
+
+
+class SnapshotOnlineStore(OnlineStore):
+    """
+    Snapshot implementation of the online store interface. The features of every feature view are stored
+    in an immutable file, which is memory-mapped to serve them.
+
+    Every write rewrites the file of the feature view, so the snapshots are meant to be built by
+    materialization and served read-only, e.g. by copying them to the machines that serve the features.
+    Snapshots which are replaced while they are served are picked up by the next read.
+
+    Attributes:
+        _snapshots: Open snapshots, by path.
+    """
+
+    _snapshots: Dict[str, "_Snapshot"]
+
+    def __init__(self):
+        self._snapshots = {}
+
+    @staticmethod
+    def _get_snapshot_path(config: RepoConfig, table: FeatureView) -> str:
+        assert (
+            config.online_store.type == "snapshot"
+            or config.online_store.type.endswith("SnapshotOnlineStore")
+        )
+
+        if config.repo_path and not Path(config.online_store.path).is_absolute():
+            dir_path = str(config.repo_path / config.online_store.path)
+        else:
+            dir_path = config.online_store.path
+        return os.path.join(dir_path, f"{config.project}_{table.name}.snapshot")
+
+    def _get_snapshot(self, path: str) -> Optional["_Snapshot"]:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+
+        snapshot = self._snapshots.get(path)
+        if snapshot is None or snapshot.version != _file_version(stat):
+            snapshot = _Snapshot(path)
+            self._snapshots[path] = snapshot
+        return snapshot
+
+    @log_exceptions_and_usage(online_store="snapshot")
+    def online_write_batch(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        data: List[
+            Tuple[EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        self.online_write_batches(config, table, [data], progress)
+
+    @log_exceptions_and_usage(online_store="snapshot")
+    def online_write_batches(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        batches: Iterable[
+            List[
+                Tuple[
+                    EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]
+                ]
+            ]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        path = self._get_snapshot_path(config, table)
+        value_types = get_value_types(table)
+        value_encoding = config.online_store.value_encoding
+
+        rows: Dict[bytes, _Row] = {}
+        snapshot = self._get_snapshot(path)
+        if snapshot is not None:
+            rows.update(snapshot.rows())
+
+        # The snapshot is only rewritten once for all batches.
+        for data in batches:
+            for entity_key, values, timestamp, created_ts in data:
+                rows[serialize_entity_key(entity_key)] = (
+                    _to_micros(timestamp),
+                    _to_micros(created_ts)
+                    if created_ts is not None
+                    else NULL_TIMESTAMP,
+                    {
+                        feature_name: serialize_value(
+                            val, value_types.get(feature_name), value_encoding
+                        )
+                        for feature_name, val in values.items()
+                    },
+                )
+            if progress:
+                progress(len(data))
+
+        _write_snapshot(path, rows)
+
+    @log_exceptions_and_usage(online_store="snapshot")
+    def online_read(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        snapshot = self._get_snapshot(self._get_snapshot_path(config, table))
+        if snapshot is None:
+            return [NOT_FOUND] * len(entity_keys)
+
+        with tracing_span(name="remote_call"):
+            return snapshot.read(
+                [serialize_entity_key(entity_key) for entity_key in entity_keys],
+                requested_features,
+            )
+
+    @log_exceptions_and_usage(online_store="snapshot")
+    def update(
+        self,
+        config: RepoConfig,
+        tables_to_delete: Sequence[FeatureView],
+        tables_to_keep: Sequence[FeatureView],
+        entities_to_delete: Sequence[Entity],
+        entities_to_keep: Sequence[Entity],
+        partial: bool,
+    ):
+        # The snapshots of the feature views to keep are created by the first write.
+        self.teardown(config, tables_to_delete, entities_to_delete)
+
+    def teardown(
+        self,
+        config: RepoConfig,
+        tables: Sequence[FeatureView],
+        entities: Sequence[Entity],
+    ):
+        for table in tables:
+            try:
+                os.unlink(self._get_snapshot_path(config, table))
+            except FileNotFoundError:
+                pass
+
+
+# The event timestamp, created timestamp and serialized feature values of an entity.
+_Row = Tuple[int, int, Dict[str, bytes]]
+
+MAGIC = b"FEASTSNP"
+FORMAT_VERSION = 1
+NULL_TIMESTAMP = -(2 ** 63)
+
+_EPOCH = datetime(1970, 1, 1)
+_HEADER_LENGTH = struct.Struct("<Q")
+_ALIGNMENT = 8
+
+
+def _to_micros(timestamp: datetime) -> int:
+    return (to_naive_utc(timestamp) - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(micros: int) -> Optional[datetime]:
+    if micros == NULL_TIMESTAMP:
+        return None
+    return _EPOCH + timedelta(microseconds=micros)
+
+
+def _hash(entity_key_bin: bytes) -> int:
+    return mmh3.hash64(entity_key_bin, signed=False)[0]
+
+
+def _file_version(stat: os.stat_result) -> Tuple[int, int]:
+    return stat.st_ino, stat.st_mtime_ns
+
+
+def _pack_column(values: List[bytes]) -> Tuple[np.ndarray, bytes]:
+    """Returns the offsets of the values, followed by their end, and the concatenated values."""
+    offsets = np.zeros(len(values) + 1, dtype="<u8")
+    offsets[1:] = np.cumsum([len(value) for value in values])
+    return offsets, b"".join(values)
+
+
+def _write_snapshot(path: str, rows: Dict[bytes, _Row]):
+    """
+    Writes a snapshot file, which consists of a header followed by sections. The sections hold:
+      - the hashes of the serialized entity keys, in ascending order, which index the rows,
+      - the offsets and the serialized entity keys of the rows,
+      - the event and created timestamps of the rows, in microseconds,
+      - for every feature, whether the rows have a value, and the offsets and the serialized values.
+    """
+    entity_keys_bin = sorted(
+        rows, key=lambda entity_key_bin: (_hash(entity_key_bin), entity_key_bin)
+    )
+    ordered_rows = [rows[entity_key_bin] for entity_key_bin in entity_keys_bin]
+    feature_names = sorted({name for row in ordered_rows for name in row[2]})
+
+    key_offsets, keys = _pack_column(entity_keys_bin)
+    sections: Dict[str, Any] = {
+        "hashes": np.array([_hash(k) for k in entity_keys_bin], dtype="<u8"),
+        "key_offsets": key_offsets,
+        "keys": keys,
+        "event_ts": np.array([row[0] for row in ordered_rows], dtype="<i8"),
+        "created_ts": np.array([row[1] for row in ordered_rows], dtype="<i8"),
+    }
+    for feature_name in feature_names:
+        sections[f"{feature_name}.present"] = np.array(
+            [feature_name in row[2] for row in ordered_rows], dtype=np.uint8
+        )
+        offsets, values = _pack_column(
+            [row[2].get(feature_name, b"") for row in ordered_rows]
+        )
+        sections[f"{feature_name}.offsets"] = offsets
+        sections[f"{feature_name}.values"] = values
+
+    section_bytes = {
+        name: section.tobytes() if isinstance(section, np.ndarray) else section
+        for name, section in sections.items()
+    }
+    # The header records the positions of the sections, which depend on the length of the header.
+    header: Dict[str, Any] = {
+        "version": FORMAT_VERSION,
+        "num_entities": len(entity_keys_bin),
+        "features": feature_names,
+        "sections": {name: [0, len(data)] for name, data in section_bytes.items()},
+    }
+    header_length = len(json.dumps(header)) + 32 * len(section_bytes)
+    offset = _aligned(len(MAGIC) + _HEADER_LENGTH.size + header_length)
+    for name, data in section_bytes.items():
+        header["sections"][name][0] = offset
+        offset = _aligned(offset + len(data))
+    header_bin = json.dumps(header).encode("utf8")
+    assert len(header_bin) <= header_length
+    header_bin = header_bin.ljust(header_length)
+
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    # Snapshots are replaced atomically, so that they can be read while they are rewritten.
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(_HEADER_LENGTH.pack(len(header_bin)))
+            f.write(header_bin)
+            for name, data in section_bytes.items():
+                _pad(f, header["sections"][name][0])
+                f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+        raise
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // _ALIGNMENT) * _ALIGNMENT
+
+
+def _pad(f: BinaryIO, offset: int):
+    f.write(b"\0" * (offset - f.tell()))
+
+
+class _Snapshot:
+    """
+    A memory-mapped snapshot file written by _write_snapshot.
+
+    The arrays of the snapshot are views of the memory map, so opening a snapshot doesn't read it, and
+    the pages which are read are shared by all processes which serve the snapshot.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            self.version = _file_version(os.fstat(f.fileno()))
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a Feast online store snapshot")
+        (header_length,) = _HEADER_LENGTH.unpack_from(self._mmap, len(MAGIC))
+        header_offset = len(MAGIC) + _HEADER_LENGTH.size
+        header = json.loads(self._mmap[header_offset : header_offset + header_length])
+        if header["version"] != FORMAT_VERSION:
+            raise ValueError(
+                f"{path} has version {header['version']} of the snapshot format, "
+                f"only version {FORMAT_VERSION} is supported"
+            )
+
+        self._sections: Dict[str, Tuple[int, int]] = {
+            name: (offset, length)
+            for name, (offset, length) in header["sections"].items()
+        }
+        self.num_entities = header["num_entities"]
+        self.feature_names: List[str] = header["features"]
+        self._hashes = self._array("hashes", "<u8")
+        self._key_offsets = self._array("key_offsets", "<u8")
+        self._event_ts = self._array("event_ts", "<i8")
+        self._created_ts = self._array("created_ts", "<i8")
+
+    def _array(self, name: str, dtype: str) -> np.ndarray:
+        offset, length = self._sections[name]
+        return np.frombuffer(
+            self._mmap,
+            dtype=dtype,
+            count=length // np.dtype(dtype).itemsize,
+            offset=offset,
+        )
+
+    def _bytes(self, name: str, start: int, end: int) -> bytes:
+        offset = self._sections[name][0]
+        return self._mmap[offset + start : offset + end]
+
+    def find(self, entity_keys_bin: List[bytes]) -> np.ndarray:
+        """Returns the rows of the entity keys, or -1 for entity keys which aren't in the snapshot."""
+        hashes = np.fromiter(
+            (_hash(k) for k in entity_keys_bin), dtype="<u8", count=len(entity_keys_bin)
+        )
+        positions = np.searchsorted(self._hashes, hashes)
+
+        rows = np.full(len(entity_keys_bin), -1, dtype=np.int64)
+        if self.num_entities == 0:
+            return rows
+
+        hashes_at_positions = self._hashes[np.minimum(positions, self.num_entities - 1)]
+        for i in np.flatnonzero(hashes_at_positions == hashes).tolist():
+            # Entity keys with the same hash are next to each other.
+            position = int(positions[i])
+            while position < self.num_entities and self._hashes[position] == hashes[i]:
+                start, end = self._key_offsets[position : position + 2].tolist()
+                if self._bytes("keys", start, end) == entity_keys_bin[i]:
+                    rows[i] = position
+                    break
+                position += 1
+        return rows
+
+    def read(
+        self, entity_keys_bin: List[bytes], requested_features: Optional[List[str]]
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        rows = self.find(entity_keys_bin)
+        found = rows >= 0
+        found_rows = rows[found]
+
+        feature_names = [
+            feature_name
+            for feature_name in (
+                requested_features
+                if requested_features is not None
+                else self.feature_names
+            )
+            if f"{feature_name}.present" in self._sections
+        ]
+        values: List[Dict[str, ValueProto]] = [{} for _ in range(len(found_rows))]
+        for feature_name in feature_names:
+            present = self._array(f"{feature_name}.present", "u1")[found_rows]
+            rows_with_values = found_rows[present != 0]
+            # The offsets of the values in the file.
+            offsets = (
+                self._array(f"{feature_name}.offsets", "<u8")
+                + self._sections[f"{feature_name}.values"][0]
+            )
+            vals_bin = [
+                self._mmap[start:end]
+                for start, end in zip(
+                    offsets[rows_with_values].tolist(),
+                    offsets[rows_with_values + 1].tolist(),
+                )
+            ]
+            for i, val in zip(
+                np.flatnonzero(present).tolist(), deserialize_values(vals_bin)
+            ):
+                values[i][feature_name] = val
+
+        found_values = iter(zip(self._event_ts[found_rows].tolist(), values))
+        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        for is_found in found.tolist():
+            if is_found:
+                event_ts, res = next(found_values)
+                result.append((_from_micros(event_ts), res))
+            else:
+                result.append(NOT_FOUND)
+        return result
+
+    def rows(self) -> Iterator[Tuple[bytes, _Row]]:
+        """Yields the serialized entity keys and the rows of the snapshot."""
+        key_offsets = self._key_offsets.tolist()
+        event_ts = self._event_ts.tolist()
+        created_ts = self._created_ts.tolist()
+        features = [
+            (
+                feature_name,
+                self._array(f"{feature_name}.present", "u1").tolist(),
+                self._array(f"{feature_name}.offsets", "<u8").tolist(),
+            )
+            for feature_name in self.feature_names
+        ]
+        for row in range(self.num_entities):
+            yield self._bytes("keys", key_offsets[row], key_offsets[row + 1]), (
+                event_ts[row],
+                created_ts[row],
+                {
+                    feature_name: self._bytes(
+                        f"{feature_name}.values", offsets[row], offsets[row + 1]
+                    )
+                    for feature_name, present, offsets in features
+                    if present[row]
+                },
+            )
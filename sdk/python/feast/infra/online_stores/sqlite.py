@@ -14,9 +14,20 @@
 import itertools
 import os
 import sqlite3
+import struct
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
 from pydantic import StrictStr
 from pydantic.schema import Literal
@@ -25,7 +36,13 @@ from feast import Entity
 from feast.feature_view import FeatureView
 from feast.infra.infra_object import SQLITE_INFRA_OBJECT_CLASS_TYPE, InfraObject
 from feast.infra.key_encoding_utils import serialize_entity_key
+from feast.infra.online_stores.helpers import assemble_online_read_result
 from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.value_encoding_utils import (
+    deserialize_values,
+    get_value_types,
+    serialize_value,
+)
 from feast.protos.feast.core.InfraObject_pb2 import InfraObject as InfraObjectProto
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.protos.feast.core.SqliteTable_pb2 import SqliteTable as SqliteTableProto
@@ -47,6 +64,14 @@ class SqliteOnlineStoreConfig(FeastConfigBaseModel):
     path: StrictStr = "data/online.db"
     """ (optional) Path to sqlite db """
 
+    table_layout: Literal["row_per_feature", "row_per_entity"] = "row_per_feature"
+    """ (optional) Layout of the tables: a row for every feature of an entity, or a single row for every entity
+     with the values of all its features packed together. Existing tables are migrated by `feast apply` when
+     the layout changes. """
+
+    value_encoding: Literal["proto", "typed"] = "proto"
+    """ (optional) Encoding of the stored feature values: proto or typed """
+
 
 class SqliteOnlineStore(OnlineStore):
     """
@@ -92,6 +117,40 @@ class SqliteOnlineStore(OnlineStore):
         conn = self._get_conn(config)
 
         project = config.project
+        value_types = get_value_types(table)
+        value_encoding = config.online_store.value_encoding
+
+        if config.online_store.table_layout == ROW_PER_ENTITY:
+            with conn:
+                for entity_key, values, timestamp, created_ts in data:
+                    # Every write replaces all features of the entity, which are always written
+                    # together.
+                    conn.execute(
+                        f"""INSERT OR REPLACE INTO {_table_id(project, table)}
+                            (entity_key, feature_values, event_ts, created_ts)
+                            VALUES (?, ?, ?, ?)""",
+                        (
+                            serialize_entity_key(entity_key),
+                            _pack_values(
+                                (
+                                    feature_name,
+                                    serialize_value(
+                                        val,
+                                        value_types.get(feature_name),
+                                        value_encoding,
+                                    ),
+                                )
+                                for feature_name, val in values.items()
+                            ),
+                            to_naive_utc(timestamp),
+                            to_naive_utc(created_ts)
+                            if created_ts is not None
+                            else None,
+                        ),
+                    )
+                    if progress:
+                        progress(1)
+            return
 
         with conn:
             for entity_key, values, timestamp, created_ts in data:
@@ -101,6 +160,9 @@ class SqliteOnlineStore(OnlineStore):
                     created_ts = to_naive_utc(created_ts)
 
                 for feature_name, val in values.items():
+                    val_bin = serialize_value(
+                        val, value_types.get(feature_name), value_encoding
+                    )
                     conn.execute(
                         f"""
                             UPDATE {_table_id(project, table)}
@@ -109,7 +171,7 @@ class SqliteOnlineStore(OnlineStore):
                         """,
                         (
                             # SET
-                            val.SerializeToString(),
+                            val_bin,
                             timestamp,
                             created_ts,
                             # WHERE
@@ -122,13 +184,7 @@ class SqliteOnlineStore(OnlineStore):
                         f"""INSERT OR IGNORE INTO {_table_id(project, table)}
                             (entity_key, feature_name, value, event_ts, created_ts)
                             VALUES (?, ?, ?, ?, ?)""",
-                        (
-                            entity_key_bin,
-                            feature_name,
-                            val.SerializeToString(),
-                            timestamp,
-                            created_ts,
-                        ),
+                        (entity_key_bin, feature_name, val_bin, timestamp, created_ts,),
                     )
                 if progress:
                     progress(1)
@@ -141,10 +197,25 @@ class SqliteOnlineStore(OnlineStore):
         entity_keys: List[EntityKeyProto],
         requested_features: Optional[List[str]] = None,
     ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        if config.online_store.table_layout == ROW_PER_ENTITY:
+            return self._online_read_rows_per_entity(
+                config, table, entity_keys, requested_features
+            )
+
         conn = self._get_conn(config)
         cur = conn.cursor()
 
-        result: List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]] = []
+        entity_keys_bin = [
+            serialize_entity_key(entity_key) for entity_key in entity_keys
+        ]
+        query_params: List[Any] = list(entity_keys_bin)
+        feature_name_filter = ""
+        if requested_features is not None:
+            # Only the requested features are read and deserialized.
+            feature_name_filter = (
+                f"AND feature_name IN ({','.join('?' * len(requested_features))}) "
+            )
+            query_params.extend(requested_features)
 
         with tracing_span(name="remote_call"):
             # Fetch all entities in one go
@@ -152,29 +223,76 @@ class SqliteOnlineStore(OnlineStore):
                 f"SELECT entity_key, feature_name, value, event_ts "
                 f"FROM {_table_id(config.project, table)} "
                 f"WHERE entity_key IN ({','.join('?' * len(entity_keys))}) "
+                f"{feature_name_filter}"
                 f"ORDER BY entity_key",
-                [serialize_entity_key(entity_key) for entity_key in entity_keys],
+                query_params,
             )
             rows = cur.fetchall()
 
-        rows = {
-            k: list(group) for k, group in itertools.groupby(rows, key=lambda r: r[0])
-        }
-        for entity_key in entity_keys:
-            entity_key_bin = serialize_entity_key(entity_key)
+        rows_with_values = zip(rows, deserialize_values([row[2] for row in rows]))
+        entity_rows = []
+        for entity_key_bin, group in itertools.groupby(
+            rows_with_values, key=lambda r: r[0][0]
+        ):
             res = {}
             res_ts = None
-            for _, feature_name, val_bin, ts in rows.get(entity_key_bin, []):
-                val = ValueProto()
-                val.ParseFromString(val_bin)
+            for (_, feature_name, _, ts), val in group:
                 res[feature_name] = val
                 res_ts = ts
+            entity_rows.append((entity_key_bin, (res_ts, res)))
+        return assemble_online_read_result(entity_keys_bin, entity_rows)
 
-            if not res:
-                result.append((None, None))
-            else:
-                result.append((res_ts, res))
-        return result
+    def _online_read_rows_per_entity(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        entity_keys: List[EntityKeyProto],
+        requested_features: Optional[List[str]] = None,
+    ) -> List[Tuple[Optional[datetime], Optional[Dict[str, ValueProto]]]]:
+        conn = self._get_conn(config)
+        entity_keys_bin = [
+            serialize_entity_key(entity_key) for entity_key in entity_keys
+        ]
+
+        with tracing_span(name="remote_call"):
+            rows = conn.execute(
+                f"SELECT entity_key, feature_values, event_ts "
+                f"FROM {_table_id(config.project, table)} "
+                f"WHERE entity_key IN ({','.join('?' * len(entity_keys))})",
+                entity_keys_bin,
+            ).fetchall()
+
+        requested = set(requested_features) if requested_features is not None else None
+
+        # The names of the features of the entities which are found, in the order of the rows.
+        row_feature_names: List[List[str]] = []
+        vals_bin = []
+        for row in rows:
+            feature_names = []
+            for feature_name, val_bin in _unpack_values(row[1]):
+                # Only the requested features are deserialized.
+                if requested is None or feature_name in requested:
+                    feature_names.append(feature_name)
+                    vals_bin.append(val_bin)
+            row_feature_names.append(feature_names)
+
+        # Like in the row-per-feature layout, entities without any of the requested features
+        # aren't found.
+        vals = iter(deserialize_values(vals_bin))
+        entity_rows = [
+            (
+                entity_key_bin,
+                (
+                    event_ts,
+                    {feature_name: next(vals) for feature_name in feature_names},
+                ),
+            )
+            for (entity_key_bin, _, event_ts), feature_names in zip(
+                rows, row_feature_names
+            )
+            if feature_names
+        ]
+        return assemble_online_read_result(entity_keys_bin, entity_rows)
 
     @log_exceptions_and_usage(online_store="sqlite")
     def update(
@@ -190,11 +308,8 @@ class SqliteOnlineStore(OnlineStore):
         project = config.project
 
         for table in tables_to_keep:
-            conn.execute(
-                f"CREATE TABLE IF NOT EXISTS {_table_id(project, table)} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
-            )
-            conn.execute(
-                f"CREATE INDEX IF NOT EXISTS {_table_id(project, table)}_ek ON {_table_id(project, table)} (entity_key);"
+            _create_table(
+                conn, _table_id(project, table), config.online_store.table_layout
             )
 
         for table in tables_to_delete:
@@ -210,6 +325,7 @@ class SqliteOnlineStore(OnlineStore):
             SqliteTable(
                 path=self._get_db_path(config),
                 name=_table_id(project, FeatureView.from_proto(view)),
+                table_layout=config.online_store.table_layout,
             )
             for view in desired_registry_proto.feature_views
         ]
@@ -238,6 +354,103 @@ def _table_id(project: str, table: FeatureView) -> str:
     return f"{project}_{table.name}"
 
 
+ROW_PER_FEATURE = "row_per_feature"
+ROW_PER_ENTITY = "row_per_entity"
+
+_CREATE_TABLE_STATEMENTS = {
+    ROW_PER_FEATURE: "CREATE TABLE IF NOT EXISTS {} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))",
+    ROW_PER_ENTITY: "CREATE TABLE IF NOT EXISTS {} (entity_key BLOB PRIMARY KEY, feature_values BLOB, event_ts timestamp, created_ts timestamp)",
+}
+
+
+def _create_table(conn: sqlite3.Connection, name: str, table_layout: str):
+    """Creates the table with the given layout, or migrates it if it has another layout."""
+    columns = [row[1] for row in conn.execute(f"PRAGMA table_info({name})")]
+    if not columns:
+        conn.execute(_CREATE_TABLE_STATEMENTS[table_layout].format(name))
+    elif ("feature_name" in columns) != (table_layout == ROW_PER_FEATURE):
+        _migrate_table(conn, name, table_layout)
+
+    if table_layout == ROW_PER_FEATURE:
+        # Older versions created an index which is redundant with the primary key.
+        conn.execute(f"DROP INDEX IF EXISTS {name}_ek")
+
+
+def _migrate_table(conn: sqlite3.Connection, name: str, table_layout: str):
+    migration_name = f"{name}_migration"
+    # DDL statements don't start transactions implicitly, so the migration is made atomic explicitly.
+    conn.execute("BEGIN")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {migration_name}")
+        conn.execute(_CREATE_TABLE_STATEMENTS[table_layout].format(migration_name))
+
+        if table_layout == ROW_PER_ENTITY:
+            rows = conn.execute(
+                f"SELECT entity_key, feature_name, value, event_ts, created_ts "
+                f"FROM {name} ORDER BY entity_key"
+            )
+            for entity_key_bin, group in itertools.groupby(rows, key=lambda r: r[0]):
+                feature_rows = list(group)
+                conn.execute(
+                    f"INSERT INTO {migration_name} VALUES (?, ?, ?, ?)",
+                    (
+                        entity_key_bin,
+                        _pack_values((r[1], r[2]) for r in feature_rows),
+                        max(r[3] for r in feature_rows),
+                        max(
+                            (r[4] for r in feature_rows if r[4] is not None),
+                            default=None,
+                        ),
+                    ),
+                )
+        else:
+            rows = conn.execute(
+                f"SELECT entity_key, feature_values, event_ts, created_ts FROM {name}"
+            )
+            for entity_key_bin, values_bin, event_ts, created_ts in rows.fetchall():
+                conn.executemany(
+                    f"INSERT INTO {migration_name} VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (entity_key_bin, feature_name, val_bin, event_ts, created_ts)
+                        for feature_name, val_bin in _unpack_values(values_bin)
+                    ],
+                )
+
+        conn.execute(f"DROP TABLE {name}")
+        conn.execute(f"ALTER TABLE {migration_name} RENAME TO {name}")
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+# Lengths of the name and the serialized value of a feature in a packed row.
+_PACKED_LENGTHS = struct.Struct("<II")
+
+
+def _pack_values(values: Iterable[Tuple[str, bytes]]) -> bytes:
+    """Packs the serialized values of the features of an entity into a single blob."""
+    parts = []
+    for feature_name, val_bin in values:
+        name_bin = feature_name.encode("utf8")
+        parts.append(_PACKED_LENGTHS.pack(len(name_bin), len(val_bin)))
+        parts.append(name_bin)
+        parts.append(val_bin)
+    return b"".join(parts)
+
+
+def _unpack_values(packed: bytes) -> Iterator[Tuple[str, bytes]]:
+    """Yields the names and serialized values of the features in a blob packed by _pack_values."""
+    offset = 0
+    while offset < len(packed):
+        name_length, val_length = _PACKED_LENGTHS.unpack_from(packed, offset)
+        offset += _PACKED_LENGTHS.size
+        feature_name = packed[offset : offset + name_length].decode("utf8")
+        offset += name_length
+        yield feature_name, packed[offset : offset + val_length]
+        offset += val_length
+
+
 class SqliteTable(InfraObject):
     """
     A Sqlite table managed by Feast.
@@ -245,15 +458,18 @@ class SqliteTable(InfraObject):
     Attributes:
         path: The absolute path of the Sqlite file.
         name: The name of the table.
+        table_layout: The layout of the table, see SqliteOnlineStoreConfig.
         conn: SQLite connection.
     """
 
     path: str
+    table_layout: str
     conn: sqlite3.Connection
 
-    def __init__(self, path: str, name: str):
+    def __init__(self, path: str, name: str, table_layout: str = ROW_PER_FEATURE):
         super().__init__(name)
         self.path = path
+        self.table_layout = table_layout
         self.conn = _initialize_conn(path)
 
     def to_infra_object_proto(self) -> InfraObjectProto:
@@ -267,26 +483,25 @@ class SqliteTable(InfraObject):
         sqlite_table_proto = SqliteTableProto()
         sqlite_table_proto.path = self.path
         sqlite_table_proto.name = self.name
+        # The default layout is left empty, so that it matches the tables of older versions.
+        if self.table_layout != ROW_PER_FEATURE:
+            sqlite_table_proto.table_layout = self.table_layout
         return sqlite_table_proto
 
     @staticmethod
     def from_infra_object_proto(infra_object_proto: InfraObjectProto) -> Any:
-        return SqliteTable(
-            path=infra_object_proto.sqlite_table.path,
-            name=infra_object_proto.sqlite_table.name,
-        )
+        return SqliteTable.from_proto(infra_object_proto.sqlite_table)
 
     @staticmethod
     def from_proto(sqlite_table_proto: SqliteTableProto) -> Any:
-        return SqliteTable(path=sqlite_table_proto.path, name=sqlite_table_proto.name,)
+        return SqliteTable(
+            path=sqlite_table_proto.path,
+            name=sqlite_table_proto.name,
+            table_layout=sqlite_table_proto.table_layout or ROW_PER_FEATURE,
+        )
 
     def update(self):
-        self.conn.execute(
-            f"CREATE TABLE IF NOT EXISTS {self.name} (entity_key BLOB, feature_name TEXT, value BLOB, event_ts timestamp, created_ts timestamp,  PRIMARY KEY(entity_key, feature_name))"
-        )
-        self.conn.execute(
-            f"CREATE INDEX IF NOT EXISTS {self.name}_ek ON {self.name} (entity_key);"
-        )
+        _create_table(self.conn, self.name, self.table_layout)
 
     def teardown(self):
         self.conn.execute(f"DROP TABLE IF EXISTS {self.name}")
@@ -1,5 +1,6 @@
+import logging
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import pandas
 import pyarrow as pa
@@ -10,6 +11,7 @@ from feast.feature_view import FeatureView
 from feast.infra.offline_stores.offline_store import RetrievalJob
 from feast.infra.offline_stores.offline_utils import get_offline_store_from_config
 from feast.infra.online_stores.helpers import get_online_store_from_config
+from feast.infra.online_stores.online_store import OnlineStore
 from feast.infra.provider import (
     Provider,
     _convert_arrow_to_proto,
@@ -26,6 +28,8 @@ from feast.utils import make_tzaware
 
 DEFAULT_BATCH_SIZE = 10_000
 
+logger = logging.getLogger(__name__)
+
 
 class PassthroughProvider(Provider):
     """
@@ -85,6 +89,46 @@ class PassthroughProvider(Provider):
         if self.online_store:
             self.online_store.online_write_batch(config, table, data, progress)
 
+    def online_write_batches(
+        self,
+        config: RepoConfig,
+        table: FeatureView,
+        batches: Iterable[
+            List[
+                Tuple[
+                    EntityKeyProto, Dict[str, ValueProto], datetime, Optional[datetime]
+                ]
+            ]
+        ],
+        progress: Optional[Callable[[int], Any]],
+    ) -> None:
+        set_usage_attribute("provider", self.__class__.__name__)
+        if not self.online_store:
+            return
+
+        # Every batch is written with online_write_batch, which providers may override, unless
+        # the online store writes several batches at once.
+        if (
+            type(self.online_store).online_write_batches
+            is OnlineStore.online_write_batches
+        ):
+            for data in batches:
+                self.online_write_batch(config, table, data, progress)
+        else:
+            self.online_store.online_write_batches(config, table, batches, progress)
+
+    def warm_up_online_store(
+        self, config: RepoConfig, tables: Sequence[FeatureView]
+    ) -> None:
+        set_usage_attribute("provider", self.__class__.__name__)
+        if not self.online_store:
+            return
+        # Warming up is best-effort, since the first reads open the connections otherwise.
+        try:
+            self.online_store.warm_up(config, tables)
+        except Exception:
+            logger.warning("Failed to warm up the online store.", exc_info=True)
+
     @log_exceptions_and_usage(sampler=RatioSampler(ratio=0.001))
     def online_read(
         self,
@@ -125,7 +169,7 @@ class PassthroughProvider(Provider):
         end_date: datetime,
         registry: Registry,
         project: str,
-        tqdm_builder: Callable[[int], tqdm],
+        tqdm_builder: Callable[[Optional[int]], tqdm],
     ) -> None:
         set_usage_attribute("provider", self.__class__.__name__)
 
@@ -151,22 +195,28 @@ class PassthroughProvider(Provider):
             end_date=end_date,
         )
 
-        table = offline_job.to_arrow()
-
-        if feature_view.batch_source.field_mapping is not None:
-            table = _run_field_mapping(table, feature_view.batch_source.field_mapping)
-
         join_keys = {entity.join_key: entity.value_type for entity in entities}
 
-        with tqdm_builder(table.num_rows) as pbar:
-            for batch in table.to_batches(DEFAULT_BATCH_SIZE):
-                rows_to_write = _convert_arrow_to_proto(batch, feature_view, join_keys)
-                self.online_write_batch(
-                    self.repo_config,
-                    feature_view,
-                    rows_to_write,
-                    lambda x: pbar.update(x),
-                )
+        def convert_batches():
+            # The rows are retrieved and written batch by batch, so that only a batch at a time is
+            # held in memory, instead of the whole table.
+            for batch in offline_job.to_arrow_batches():
+                table = pa.Table.from_batches([batch])
+                if feature_view.batch_source.field_mapping is not None:
+                    table = _run_field_mapping(
+                        table, feature_view.batch_source.field_mapping
+                    )
+                for rows in table.to_batches(DEFAULT_BATCH_SIZE):
+                    yield _convert_arrow_to_proto(rows, feature_view, join_keys)
+
+        # The number of rows isn't known before they have all been retrieved.
+        with tqdm_builder(None) as pbar:
+            self.online_write_batches(
+                self.repo_config,
+                feature_view,
+                convert_batches(),
+                lambda x: pbar.update(x),
+            )
 
     def get_historical_features(
         self,
@@ -23,6 +23,7 @@ from feast.registry import Registry
 from feast.repo_config import RepoConfig
 from feast.saved_dataset import SavedDataset
 from feast.type_map import python_values_to_proto_values
+from feast.utils import to_naive_utc_datetimes
 from feast.value_type import ValueType
 
 PROVIDERS_CLASS_FOR_TYPE = {
@@ -126,6 +127,14 @@ class Provider(abc.ABC):
         """
         pass
 
+    def warm_up_online_store(
+        self, config: RepoConfig, tables: Sequence[FeatureView]
+    ) -> None:
+        """
+        Opens the connections to the online store ahead of the first reads.
+        """
+        pass
+
     @abc.abstractmethod
     def materialize_single_feature_view(
         self,
@@ -135,7 +144,7 @@ class Provider(abc.ABC):
         end_date: datetime,
         registry: Registry,
         project: str,
-        tqdm_builder: Callable[[int], tqdm],
+        tqdm_builder: Callable[[Optional[int]], tqdm],
     ) -> None:
         pass
 
@@ -328,21 +337,6 @@ def _run_dask_field_mapping(
     return table
 
 
-def _coerce_datetime(ts):
-    """
-    Depending on underlying time resolution, arrow to_pydict() sometimes returns pandas
-    timestamp type (for nanosecond resolution), and sometimes you get standard python datetime
-    (for microsecond resolution).
-    While pandas timestamp class is a subclass of python datetime, it doesn't always behave the
-    same way. We convert it to normal datetime so that consumers downstream don't have to deal
-    with these quirks.
-    """
-    if isinstance(ts, pandas.Timestamp):
-        return ts.to_pydatetime()
-    else:
-        return ts
-
-
 def _convert_arrow_to_proto(
     table: Union[pyarrow.Table, pyarrow.RecordBatch],
     feature_view: FeatureView,
@@ -379,25 +373,16 @@ def _convert_arrow_to_proto(
     features = [dict(zip(feature_dict, vars)) for vars in zip(*feature_dict.values())]
 
     # Convert event_timestamps
-    event_timestamps = [
-        _coerce_datetime(val)
-        for val in pandas.to_datetime(
-            table.column(feature_view.batch_source.timestamp_field).to_numpy(
-                zero_copy_only=False
-            )
-        )
-    ]
+    event_timestamps = to_naive_utc_datetimes(
+        table.column(feature_view.batch_source.timestamp_field)
+    )
 
     # Convert created_timestamps if they exist
+    created_timestamps: Sequence[Optional[datetime]]
     if feature_view.batch_source.created_timestamp_column:
-        created_timestamps = [
-            _coerce_datetime(val)
-            for val in pandas.to_datetime(
-                table.column(
-                    feature_view.batch_source.created_timestamp_column
-                ).to_numpy(zero_copy_only=False)
-            )
-        ]
+        created_timestamps = to_naive_utc_datetimes(
+            table.column(feature_view.batch_source.created_timestamp_column)
+        )
     else:
         created_timestamps = [None] * table.num_rows
 
@@ -0,0 +1,205 @@
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from feast.feature_view import FeatureView
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.value_type import ValueType
+
+# Encodings of the feature values stored in online stores: serialized Value protos, or the raw
+# values of the declared types of the features, which are faster to read. Values in both encodings
+# can be read, whichever encoding the online store writes.
+PROTO_ENCODING = "proto"
+TYPED_ENCODING = "typed"
+
+# Values in the typed encoding start with a byte holding their type and the wire type 7, which
+# is invalid and therefore never starts a serialized Value proto.
+_INVALID_WIRE_TYPE = 7
+_HEADER_LENGTH = 1
+
+# The numpy types of the values of fixed width, and of the items of the lists of values of fixed
+# width. Integers are stored in the narrowest of these widths which holds them.
+_INTEGER_WIDTHS = (1, 2, 4, 8)
+_INTEGER_TYPES = {ValueType.INT32, ValueType.INT64, ValueType.UNIX_TIMESTAMP}
+_INTEGER_LIST_TYPES = {
+    ValueType.INT32_LIST,
+    ValueType.INT64_LIST,
+    ValueType.UNIX_TIMESTAMP_LIST,
+}
+_FIXED_WIDTH_DTYPES: Dict[ValueType, np.dtype] = {
+    ValueType.DOUBLE: np.dtype("<f8"),
+    ValueType.FLOAT: np.dtype("<f4"),
+    ValueType.BOOL: np.dtype("?"),
+}
+_FIXED_WIDTH_LIST_DTYPES: Dict[ValueType, np.dtype] = {
+    ValueType.DOUBLE_LIST: np.dtype("<f8"),
+    ValueType.FLOAT_LIST: np.dtype("<f4"),
+    ValueType.BOOL_LIST: np.dtype("?"),
+}
+_BINARY_TYPES = {ValueType.BYTES, ValueType.STRING}
+_BINARY_LIST_TYPES = {ValueType.BYTES_LIST, ValueType.STRING_LIST}
+_TYPED_VALUE_TYPES = {
+    *_INTEGER_TYPES,
+    *_INTEGER_LIST_TYPES,
+    *_FIXED_WIDTH_DTYPES,
+    *_FIXED_WIDTH_LIST_DTYPES,
+    *_BINARY_TYPES,
+    *_BINARY_LIST_TYPES,
+}
+
+
+def _field_name(value_type: ValueType) -> str:
+    """Returns the name of the field of Value protos which holds values of the given type."""
+    return f"{value_type.name.lower()}_val"
+
+
+def _narrowest_width(values: np.ndarray, kind: str) -> int:
+    """Returns the narrowest width of the signed ("i") or unsigned ("u") integers which hold the values."""
+    low, high = (values.min(), values.max()) if values.size else (0, 0)
+    for width in _INTEGER_WIDTHS:
+        info = np.iinfo(f"{kind}{width}")
+        if info.min <= low and high <= info.max:
+            return width
+    return _INTEGER_WIDTHS[-1]
+
+
+def get_value_types(table: FeatureView) -> Dict[str, ValueType]:
+    """Returns the declared types of the features of a feature view, by feature name."""
+    return {feature.name: feature.dtype for feature in table.features}
+
+
+def serialize_value(
+    val: ValueProto, value_type: Optional[ValueType], value_encoding: str
+) -> bytes:
+    """
+    Serializes a feature value in the given encoding.
+
+    In the typed encoding, values of the declared type of their feature are stored as their raw
+    little-endian bytes, with integers narrowed to the smallest width which holds them, and lists
+    of strings or bytes as the number of items, their lengths and their concatenated bytes. Values
+    of other types, such as nulls, and values whose typed encoding would be larger, such as large
+    integers which protobuf stores as shorter varints, are still stored as Value protos.
+    """
+    val_bin = val.SerializeToString()
+    if (
+        value_encoding != TYPED_ENCODING
+        or value_type not in _TYPED_VALUE_TYPES
+        or val.WhichOneof("val") != _field_name(value_type)
+    ):
+        return val_bin
+
+    typed_val_bin = _encode_typed_value(
+        value_type, getattr(val, _field_name(value_type))
+    )
+    return typed_val_bin if len(typed_val_bin) <= len(val_bin) else val_bin
+
+
+def _encode_typed_value(value_type: ValueType, field: Any) -> bytes:
+    if value_type in _INTEGER_TYPES:
+        values = np.array([field], dtype="<i8")
+        payload = values.astype(f"<i{_narrowest_width(values, 'i')}").tobytes()
+    elif value_type in _INTEGER_LIST_TYPES:
+        values = np.array(field.val, dtype="<i8")
+        width = _narrowest_width(values, "i")
+        payload = bytes((width,)) + values.astype(f"<i{width}").tobytes()
+    elif value_type in _FIXED_WIDTH_DTYPES:
+        payload = np.array(field, dtype=_FIXED_WIDTH_DTYPES[value_type]).tobytes()
+    elif value_type in _FIXED_WIDTH_LIST_DTYPES:
+        payload = np.array(
+            field.val, dtype=_FIXED_WIDTH_LIST_DTYPES[value_type]
+        ).tobytes()
+    elif value_type == ValueType.STRING:
+        payload = field.encode("utf8")
+    elif value_type == ValueType.BYTES:
+        payload = field
+    else:
+        items = [
+            item.encode("utf8") if value_type == ValueType.STRING_LIST else item
+            for item in field.val
+        ]
+        # The number of items and their lengths, in the narrowest width which holds them.
+        lengths = np.array([len(items), *(len(item) for item in items)], dtype="<u8")
+        width = _narrowest_width(lengths, "u")
+        payload = b"".join(
+            [bytes((width,)), lengths.astype(f"<u{width}").tobytes(), *items]
+        )
+    return bytes(((value_type.value << 3) | _INVALID_WIRE_TYPE,)) + payload
+
+
+def deserialize_value(val_bin: bytes) -> ValueProto:
+    """Deserializes a feature value serialized by serialize_value, in either encoding."""
+    return deserialize_values([val_bin])[0]
+
+
+def deserialize_values(vals_bin: Sequence[bytes]) -> List[ValueProto]:
+    """
+    Deserializes feature values serialized by serialize_value, in either encoding.
+
+    The scalar numbers in the typed encoding are decoded in bulk, one numpy call per type and
+    width, so online stores should deserialize all the values they read at once.
+    """
+    result: List[Optional[ValueProto]] = [None] * len(vals_bin)
+    scalar_positions: Dict[Tuple[ValueType, np.dtype], List[int]] = {}
+    for i, val_bin in enumerate(vals_bin):
+        if not val_bin or val_bin[0] & 7 != _INVALID_WIRE_TYPE:
+            result[i] = ValueProto.FromString(val_bin)
+            continue
+
+        value_type = ValueType(val_bin[0] >> 3)
+        if value_type in _INTEGER_TYPES:
+            dtype = np.dtype(f"<i{len(val_bin) - _HEADER_LENGTH}")
+            scalar_positions.setdefault((value_type, dtype), []).append(i)
+        elif value_type in _FIXED_WIDTH_DTYPES:
+            dtype = _FIXED_WIDTH_DTYPES[value_type]
+            scalar_positions.setdefault((value_type, dtype), []).append(i)
+        else:
+            result[i] = _decode_typed_value(value_type, val_bin)
+
+    for (value_type, dtype), positions in scalar_positions.items():
+        field_name = _field_name(value_type)
+        values = np.frombuffer(
+            b"".join(vals_bin[i][_HEADER_LENGTH:] for i in positions), dtype=dtype
+        )
+        for i, value in zip(positions, values.tolist()):
+            result[i] = ValueProto(**{field_name: value})
+
+    return result  # type: ignore
+
+
+def _decode_typed_value(value_type: ValueType, val_bin: bytes) -> ValueProto:
+    val = ValueProto()
+    if value_type == ValueType.STRING:
+        val.string_val = val_bin[_HEADER_LENGTH:].decode("utf8")
+    elif value_type == ValueType.BYTES:
+        val.bytes_val = val_bin[_HEADER_LENGTH:]
+    elif value_type in _FIXED_WIDTH_LIST_DTYPES or value_type in _INTEGER_LIST_TYPES:
+        field = getattr(val, _field_name(value_type))
+        # Empty lists are set explicitly, like in the original value.
+        field.SetInParent()
+        if value_type in _INTEGER_LIST_TYPES:
+            dtype = np.dtype(f"<i{val_bin[_HEADER_LENGTH]}")
+            offset = _HEADER_LENGTH + 1
+        else:
+            dtype = _FIXED_WIDTH_LIST_DTYPES[value_type]
+            offset = _HEADER_LENGTH
+        field.val.extend(np.frombuffer(val_bin, dtype=dtype, offset=offset).tolist())
+    elif value_type in _BINARY_LIST_TYPES:
+        field = getattr(val, _field_name(value_type))
+        field.SetInParent()
+        dtype = np.dtype(f"<u{val_bin[_HEADER_LENGTH]}")
+        offset = _HEADER_LENGTH + 1
+        (num_items,) = np.frombuffer(val_bin, dtype=dtype, count=1, offset=offset)
+        offset += dtype.itemsize
+        lengths = np.frombuffer(val_bin, dtype=dtype, count=num_items, offset=offset)
+        offset += lengths.nbytes
+        items = []
+        for length in lengths.tolist():
+            items.append(val_bin[offset : offset + length])
+            offset += length
+        if value_type == ValueType.STRING_LIST:
+            field.val.extend(item.decode("utf8") for item in items)
+        else:
+            field.val.extend(items)
+    else:
+        raise ValueError(f"Values of type {value_type} have no typed encoding")
+    return val
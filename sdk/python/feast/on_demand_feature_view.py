@@ -1,8 +1,12 @@
 import copy
 import functools
+import hashlib
+import threading
 import warnings
+from collections import OrderedDict
+from datetime import datetime
 from types import MethodType
-from typing import Dict, List, Optional, Type, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
 
 import dill
 import pandas as pd
@@ -27,12 +31,28 @@ from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
 from feast.type_map import (
     feast_value_type_to_pandas_type,
     python_type_to_feast_value_type,
+    python_values_to_feast_value_type,
 )
 from feast.usage import log_exceptions
 from feast.value_type import ValueType
 
 warnings.simplefilter("once", DeprecationWarning)
 
+# The udf takes and returns pandas dataframes.
+PANDAS_MODE = "pandas"
+# The udf takes and returns dictionaries mapping column names to lists (or numpy arrays)
+# of values. This avoids constructing dataframes, which dominates the latency of online
+# requests for a small number of entities.
+PYTHON_MODE = "python"
+ON_DEMAND_FEATURE_VIEW_MODES = (PANDAS_MODE, PYTHON_MODE)
+
+# Deserialized udfs keyed by the sha256 hash of their serialized body. Registry reads
+# rebuild on demand feature views from protos, and unpickling the udf dominates that cost.
+# Only the most recently used udfs are kept, since every version of a udf has its own hash.
+_UDF_CACHE_SIZE = 256
+_udf_cache: "OrderedDict[str, MethodType]" = OrderedDict()
+_udf_cache_lock = threading.Lock()
+
 
 class OnDemandFeatureView(BaseFeatureView):
     """
@@ -48,11 +68,12 @@ class OnDemandFeatureView(BaseFeatureView):
         source_request_sources: A map from input source names to the actual input
             sources with type RequestSource.
         udf: The user defined transformation function, which must take pandas dataframes
-            as inputs.
+            as inputs, or dictionaries of lists if the mode is "python".
         description: A human-readable description.
         tags: A dictionary of key-value pairs to store arbitrary metadata.
         owner: The owner of the on demand feature view, typically the email of the primary
             maintainer.
+        mode: The input/output format of the udf, either "pandas" or "python".
     """
 
     # TODO(adchia): remove inputs from proto and declaration
@@ -64,6 +85,7 @@ class OnDemandFeatureView(BaseFeatureView):
     description: str
     tags: Dict[str, str]
     owner: str
+    mode: str
 
     @log_exceptions
     def __init__(
@@ -80,6 +102,7 @@ class OnDemandFeatureView(BaseFeatureView):
         description: str = "",
         tags: Optional[Dict[str, str]] = None,
         owner: str = "",
+        mode: str = PANDAS_MODE,
     ):
         """
         Creates an OnDemandFeatureView object.
@@ -92,7 +115,7 @@ class OnDemandFeatureView(BaseFeatureView):
                 which may be feature views, feature view projections, or request data sources.
                 These sources serve as inputs to the udf, which will refer to them by name.
             udf (optional): The user defined transformation function, which must take pandas
-                dataframes as inputs.
+                dataframes as inputs, or dictionaries of lists if the mode is "python".
             inputs (optional): A map from input source names to the actual input sources,
                 which may be feature views, feature view projections, or request data sources.
                 These sources serve as inputs to the udf, which will refer to them by name.
@@ -100,6 +123,10 @@ class OnDemandFeatureView(BaseFeatureView):
             tags (optional): A dictionary of key-value pairs to store arbitrary metadata.
             owner (optional): The owner of the on demand feature view, typically the email
                 of the primary maintainer.
+            mode (optional): The input/output format of the udf. In "pandas" mode (the
+                default) the udf takes and returns pandas dataframes. In "python" mode the
+                udf takes and returns dictionaries mapping column names to lists of values,
+                which avoids dataframe construction when serving online requests.
         """
         super().__init__(
             name=name,
@@ -140,6 +167,23 @@ class OnDemandFeatureView(BaseFeatureView):
         assert udf
         self.udf = udf
 
+        if mode not in ON_DEMAND_FEATURE_VIEW_MODES:
+            raise ValueError(
+                f"Unknown mode '{mode}' for on demand feature view '{name}'. "
+                f"Supported modes are {ON_DEMAND_FEATURE_VIEW_MODES}."
+            )
+        self.mode = mode
+
+        # Metadata derived from the definition, which is computed lazily and then reused
+        # for every transformation. See `_reset_derived_metadata`.
+        self._reset_derived_metadata()
+
+    def _reset_derived_metadata(self):
+        self._request_data_schema: Optional[Dict[str, ValueType]] = None
+        self._source_feature_aliases: Optional[List[Tuple[str, str]]] = None
+        # Keyed by the name of the projection, since copies may use a different one.
+        self._output_feature_names: Dict[str, List[Tuple[str, str]]] = {}
+
     @property
     def proto_class(self) -> Type[OnDemandFeatureViewProto]:
         return OnDemandFeatureViewProto
@@ -155,8 +199,16 @@ class OnDemandFeatureView(BaseFeatureView):
             description=self.description,
             tags=self.tags,
             owner=self.owner,
+            mode=self.mode,
         )
         fv.projection = copy.copy(self.projection)
+        fv.created_timestamp = self.created_timestamp
+        fv.last_updated_timestamp = self.last_updated_timestamp
+
+        # The copy has the same definition, so the derived metadata can be shared.
+        fv._request_data_schema = self._request_data_schema
+        fv._source_feature_aliases = self._source_feature_aliases
+        fv._output_feature_names = self._output_feature_names
         return fv
 
     def __eq__(self, other):
@@ -168,6 +220,7 @@ class OnDemandFeatureView(BaseFeatureView):
             == other.source_feature_view_projections
             or not self.source_request_sources == other.source_request_sources
             or not self.udf.__code__.co_code == other.udf.__code__.co_code
+            or not self.mode == other.mode
         ):
             return False
 
@@ -208,6 +261,7 @@ class OnDemandFeatureView(BaseFeatureView):
             description=self.description,
             tags=self.tags,
             owner=self.owner,
+            mode=self.mode,
         )
 
         return OnDemandFeatureViewProto(spec=spec, meta=meta)
@@ -251,12 +305,14 @@ class OnDemandFeatureView(BaseFeatureView):
                 for feature in on_demand_feature_view_proto.spec.features
             ],
             sources=sources,
-            udf=dill.loads(
+            udf=_deserialize_udf(
                 on_demand_feature_view_proto.spec.user_defined_function.body
             ),
             description=on_demand_feature_view_proto.spec.description,
             tags=dict(on_demand_feature_view_proto.spec.tags),
             owner=on_demand_feature_view_proto.spec.owner,
+            # ODFVs registered before modes were introduced have an empty mode.
+            mode=on_demand_feature_view_proto.spec.mode or PANDAS_MODE,
         )
 
         # FeatureViewProjections are not saved in the OnDemandFeatureView proto.
@@ -277,36 +333,62 @@ class OnDemandFeatureView(BaseFeatureView):
         return on_demand_feature_view_obj
 
     def get_request_data_schema(self) -> Dict[str, ValueType]:
-        schema: Dict[str, ValueType] = {}
-        for request_source in self.source_request_sources.values():
-            schema.update(request_source.schema)
-        return schema
+        if self._request_data_schema is None:
+            schema: Dict[str, ValueType] = {}
+            for request_source in self.source_request_sources.values():
+                schema.update(request_source.schema)
+            self._request_data_schema = schema
+        return self._request_data_schema
+
+    def _get_source_feature_aliases(self) -> List[Tuple[str, str]]:
+        """Returns the (full name, short name) pairs of all source features."""
+        if self._source_feature_aliases is None:
+            self._source_feature_aliases = [
+                (f"{source_fv_projection.name}__{feature.name}", feature.name)
+                for source_fv_projection in self.source_feature_view_projections.values()
+                for feature in source_fv_projection.features
+            ]
+        return self._source_feature_aliases
+
+    def _get_output_feature_names(self) -> List[Tuple[str, str]]:
+        """Returns the (short name, full name) pairs of all output features."""
+        projection_name = self.projection.name_to_use()
+        if projection_name not in self._output_feature_names:
+            self._output_feature_names[projection_name] = [
+                (feature.name, f"{projection_name}__{feature.name}")
+                for feature in self.features
+            ]
+        return self._output_feature_names[projection_name]
 
     def get_transformed_features_df(
         self, df_with_features: pd.DataFrame, full_feature_names: bool = False,
     ) -> pd.DataFrame:
+        if self.mode == PYTHON_MODE:
+            # Python mode udfs operate on dictionaries of lists, so the same definition
+            # can be used for historical retrieval.
+            transformed_features = self.get_transformed_features_dict(
+                df_with_features.to_dict(orient="list"), full_feature_names
+            )
+            return pd.DataFrame(transformed_features, index=df_with_features.index)
+
         # Apply on demand transformations
         columns_to_cleanup = []
-        for source_fv_projection in self.source_feature_view_projections.values():
-            for feature in source_fv_projection.features:
-                full_feature_ref = f"{source_fv_projection.name}__{feature.name}"
-                if full_feature_ref in df_with_features.keys():
-                    # Make sure the partial feature name is always present
-                    df_with_features[feature.name] = df_with_features[full_feature_ref]
-                    columns_to_cleanup.append(feature.name)
-                elif feature.name in df_with_features.keys():
-                    # Make sure the full feature name is always present
-                    df_with_features[full_feature_ref] = df_with_features[feature.name]
-                    columns_to_cleanup.append(full_feature_ref)
+        for full_feature_ref, short_name in self._get_source_feature_aliases():
+            if full_feature_ref in df_with_features.keys():
+                # Make sure the partial feature name is always present
+                df_with_features[short_name] = df_with_features[full_feature_ref]
+                columns_to_cleanup.append(short_name)
+            elif short_name in df_with_features.keys():
+                # Make sure the full feature name is always present
+                df_with_features[full_feature_ref] = df_with_features[short_name]
+                columns_to_cleanup.append(full_feature_ref)
 
         # Compute transformed values and apply to each result row
         df_with_transformed_features = self.udf.__call__(df_with_features)
 
         # Work out whether the correct columns names are used.
         rename_columns: Dict[str, str] = {}
-        for feature in self.features:
-            short_name = feature.name
-            long_name = f"{self.projection.name_to_use()}__{feature.name}"
+        for short_name, long_name in self._get_output_feature_names():
             if (
                 short_name in df_with_transformed_features.columns
                 and full_feature_names
@@ -320,6 +402,51 @@ class OnDemandFeatureView(BaseFeatureView):
         df_with_features.drop(columns=columns_to_cleanup, inplace=True)
         return df_with_transformed_features.rename(columns=rename_columns)
 
+    def get_transformed_features_dict(
+        self, features: Dict[str, List[Any]], full_feature_names: bool = False,
+    ) -> Dict[str, List[Any]]:
+        """
+        Applies the udf of a "python" mode on demand feature view to columnar values.
+
+        Args:
+            features: A map from column names to lists (or numpy arrays) of values. This
+                map is not modified.
+            full_feature_names: Whether the output columns should use full feature names.
+
+        Returns:
+            A map from output feature names to lists of transformed values.
+        """
+        if self.mode != PYTHON_MODE:
+            raise ValueError(
+                f"On demand feature view '{self.name}' has mode '{self.mode}', "
+                f"dictionary inputs are only supported in '{PYTHON_MODE}' mode."
+            )
+
+        # Make sure both the partial and full feature names are present. The aliases
+        # reference the same lists, so no values are copied.
+        features_with_aliases = dict(features)
+        for full_feature_ref, short_name in self._get_source_feature_aliases():
+            if full_feature_ref in features:
+                features_with_aliases[short_name] = features[full_feature_ref]
+            elif short_name in features:
+                features_with_aliases[full_feature_ref] = features[short_name]
+
+        transformed_features = self.udf.__call__(features_with_aliases)
+
+        renamed_features: Dict[str, List[Any]] = {}
+        for short_name, long_name in self._get_output_feature_names():
+            if full_feature_names:
+                if short_name in transformed_features:
+                    renamed_features[long_name] = transformed_features[short_name]
+                elif long_name in transformed_features:
+                    renamed_features[long_name] = transformed_features[long_name]
+            else:
+                if long_name in transformed_features:
+                    renamed_features[short_name] = transformed_features[long_name]
+                elif short_name in transformed_features:
+                    renamed_features[short_name] = transformed_features[short_name]
+        return renamed_features
+
     def infer_features(self):
         """
         Infers the set of features associated to this feature view from the input source.
@@ -327,6 +454,31 @@ class OnDemandFeatureView(BaseFeatureView):
         Raises:
             RegistryInferenceFailure: The set of features could not be inferred.
         """
+        if self.mode == PYTHON_MODE:
+            inferred_features = self._infer_python_mode_features()
+        else:
+            inferred_features = self._infer_pandas_mode_features()
+
+        if self.features:
+            missing_features = []
+            for specified_features in self.features:
+                if specified_features not in inferred_features:
+                    missing_features.append(specified_features)
+            if missing_features:
+                raise SpecifiedFeaturesNotPresentError(
+                    [f.name for f in missing_features], self.name
+                )
+        else:
+            self.features = inferred_features
+            self._reset_derived_metadata()
+
+        if not self.features:
+            raise RegistryInferenceFailure(
+                "OnDemandFeatureView",
+                f"Could not infer Features for the feature view '{self.name}'.",
+            )
+
+    def _infer_pandas_mode_features(self) -> List[Feature]:
         df = pd.DataFrame()
         for feature_view_projection in self.source_feature_view_projections.values():
             for feature in feature_view_projection.features:
@@ -347,24 +499,27 @@ class OnDemandFeatureView(BaseFeatureView):
                     name=f, dtype=python_type_to_feast_value_type(f, type_name=str(dt))
                 )
             )
+        return inferred_features
 
-        if self.features:
-            missing_features = []
-            for specified_features in self.features:
-                if specified_features not in inferred_features:
-                    missing_features.append(specified_features)
-            if missing_features:
-                raise SpecifiedFeaturesNotPresentError(
-                    [f.name for f in missing_features], self.name
-                )
-        else:
-            self.features = inferred_features
-
-        if not self.features:
-            raise RegistryInferenceFailure(
-                "OnDemandFeatureView",
-                f"Could not infer Features for the feature view '{self.name}'.",
-            )
+    def _infer_python_mode_features(self) -> List[Feature]:
+        # Python values carry no dtype when empty, so the udf is called on a single row
+        # of sample values and the feature types are inferred from its output values.
+        features: Dict[str, List[Any]] = {}
+        for feature_view_projection in self.source_feature_view_projections.values():
+            for feature in feature_view_projection.features:
+                sample_values = [_get_sample_value(feature.dtype)]
+                features[
+                    f"{feature_view_projection.name}__{feature.name}"
+                ] = sample_values
+                features[f"{feature.name}"] = sample_values
+        for request_data in self.source_request_sources.values():
+            for feature_name, feature_type in request_data.schema.items():
+                features[f"{feature_name}"] = [_get_sample_value(feature_type)]
+        output: Dict[str, List[Any]] = self.udf.__call__(features)
+        return [
+            Feature(name=f, dtype=python_values_to_feast_value_type(f, values))
+            for f, values in output.items()
+        ]
 
     @staticmethod
     def get_requested_odfvs(feature_refs, project, registry):
@@ -380,14 +535,52 @@ class OnDemandFeatureView(BaseFeatureView):
         return requested_on_demand_feature_views
 
 
+def _deserialize_udf(udf_body: bytes) -> MethodType:
+    """Deserializes a udf, reusing the result for identical serialized bodies."""
+    udf_hash = hashlib.sha256(udf_body).hexdigest()
+    with _udf_cache_lock:
+        udf = _udf_cache.get(udf_hash)
+        if udf is not None:
+            _udf_cache.move_to_end(udf_hash)
+            return udf
+
+    udf = dill.loads(udf_body)
+    with _udf_cache_lock:
+        _udf_cache[udf_hash] = udf
+        if len(_udf_cache) > _UDF_CACHE_SIZE:
+            _udf_cache.popitem(last=False)
+    return udf
+
+
+def _get_sample_value(value_type: ValueType) -> Any:
+    sample_values: Dict[ValueType, Any] = {
+        ValueType.BYTES: b"hello world",
+        ValueType.STRING: "hello world",
+        ValueType.INT32: 1,
+        ValueType.INT64: 1,
+        ValueType.DOUBLE: 1.0,
+        ValueType.FLOAT: 1.0,
+        ValueType.BOOL: True,
+        ValueType.UNIX_TIMESTAMP: datetime.utcnow(),
+    }
+    if value_type.name.endswith("_LIST"):
+        return [sample_values[ValueType[value_type.name[: -len("_LIST")]]]]
+    if value_type in sample_values:
+        return sample_values[value_type]
+    raise TypeError(f"Sample values for type {value_type} are not supported.")
+
+
 def on_demand_feature_view(
-    features: List[Feature], sources: Dict[str, Union[FeatureView, RequestSource]]
+    features: List[Feature],
+    sources: Dict[str, Union[FeatureView, RequestSource]],
+    mode: str = PANDAS_MODE,
 ):
     """
     Declare an on-demand feature view
 
     :param features: Output schema with feature names
     :param sources: The sources passed into the transform.
+    :param mode: The input/output format of the transform, either "pandas" or "python".
     :return: An On Demand Feature View.
     """
 
@@ -397,6 +590,7 @@ def on_demand_feature_view(
             sources=sources,
             features=features,
             udf=user_function,
+            mode=mode,
         )
         functools.update_wrapper(
             wrapper=on_demand_feature_view_obj, wrapped=user_function
@@ -12,9 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 import pandas as pd
+import pyarrow as pa
 
 from feast.feature_view import DUMMY_ENTITY_ID
 from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
@@ -77,3 +78,106 @@ class OnlineResponse:
         """
 
         return pd.DataFrame(self.to_dict(include_event_timestamps))
+
+    def to_arrow(self, include_event_timestamps: bool = False) -> pa.Table:
+        """
+        Converts GetOnlineFeaturesResponse features into pyarrow Table form.
+
+        Args:
+        is_with_event_timestamps: bool Optionally include feature timestamps in the table
+        """
+        return pa.Table.from_pandas(self.to_df(include_event_timestamps))
+
+
+STATUS_SUFFIX: str = "__status"
+EVENT_TIMESTAMP_SUFFIX: str = "__timestamp"
+
+
+class ArrowOnlineResponse(OnlineResponse):
+    """
+    Online response backed by a pyarrow RecordBatch, as returned by the embedded Go feature server.
+
+    The record batch has three columns for every feature and entity: its values, its statuses
+    ("<name>__status") and its event timestamps in seconds ("<name>__timestamp"). The features are
+    converted into a GetOnlineFeaturesResponse proto only when the proto is accessed.
+    """
+
+    def __init__(
+        self,
+        record_batch: pa.RecordBatch,
+        to_proto: Callable[[pa.RecordBatch], GetOnlineFeaturesResponse],
+    ):
+        """
+        Args:
+        record_batch: RecordBatch with the features and their statuses and event timestamps.
+        to_proto: Function which converts the record batch into a GetOnlineFeaturesResponse proto.
+        """
+        dummy_entity_columns = {
+            DUMMY_ENTITY_ID,
+            DUMMY_ENTITY_ID + STATUS_SUFFIX,
+            DUMMY_ENTITY_ID + EVENT_TIMESTAMP_SUFFIX,
+        }
+        if dummy_entity_columns & set(record_batch.schema.names):
+            indices = [
+                i
+                for i, name in enumerate(record_batch.schema.names)
+                if name not in dummy_entity_columns
+            ]
+            record_batch = pa.RecordBatch.from_arrays(
+                [record_batch.column(i) for i in indices],
+                names=[record_batch.schema.names[i] for i in indices],
+            )
+        self.record_batch = record_batch
+        self._to_proto = to_proto
+        self._proto: Optional[GetOnlineFeaturesResponse] = None
+
+    @property
+    def proto(self) -> GetOnlineFeaturesResponse:  # type: ignore
+        if self._proto is None:
+            self._proto = self._to_proto(self.record_batch)
+        return self._proto
+
+    def to_dict(self, include_event_timestamps: bool = False) -> Dict[str, Any]:
+        return self.to_arrow(include_event_timestamps).to_pydict()
+
+    def to_df(self, include_event_timestamps: bool = False) -> pd.DataFrame:
+        return self.to_arrow(include_event_timestamps).to_pandas()
+
+    def to_arrow(
+        self, include_event_timestamps: bool = False, include_statuses: bool = False
+    ) -> pa.Table:
+        """
+        Converts the features into a pyarrow Table, in which unix timestamps are timestamps.
+
+        Args:
+        include_event_timestamps: Whether to include the event timestamps of the features.
+        include_statuses: Whether to include the FieldStatus of each value in "<name>__status" columns.
+        """
+        names = []
+        columns = []
+        for field, column in zip(self.record_batch.schema, self.record_batch.columns):
+            if field.name.endswith(STATUS_SUFFIX):
+                if include_statuses:
+                    names.append(field.name)
+                    columns.append(column)
+                continue
+            if field.name.endswith(EVENT_TIMESTAMP_SUFFIX):
+                if include_event_timestamps:
+                    feature_ref = field.name[: -len(EVENT_TIMESTAMP_SUFFIX)]
+                    names.append(feature_ref + TIMESTAMP_POSTFIX)
+                    columns.append(column)
+                continue
+
+            # Unix timestamps are passed as the number of seconds in a time64 column.
+            if field.type == pa.time64("ns"):
+                column = column.cast(pa.int64()).cast(pa.timestamp("s", tz="UTC"))
+            elif isinstance(
+                field.type, pa.ListType
+            ) and field.type.value_type == pa.time64("ns"):
+                column = column.cast(pa.list_(pa.int64())).cast(
+                    pa.list_(pa.timestamp("s", tz="UTC"))
+                )
+            names.append(field.name)
+            columns.append(column)
+
+        return pa.Table.from_arrays(columns, names=names)
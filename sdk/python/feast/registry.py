@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import copy
 import json
 import logging
 from collections import defaultdict
@@ -18,7 +19,7 @@ from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from threading import Lock
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 from urllib.parse import urlparse
 
 import dill
@@ -44,6 +45,9 @@ from feast.feature_view import FeatureView
 from feast.importer import import_class
 from feast.infra.infra_object import Infra
 from feast.on_demand_feature_view import OnDemandFeatureView
+from feast.protos.feast.core.OnDemandFeatureView_pb2 import (
+    OnDemandFeatureView as OnDemandFeatureViewProto,
+)
 from feast.protos.feast.core.Registry_pb2 import Registry as RegistryProto
 from feast.registry_store import NoopRegistryStore
 from feast.repo_config import RegistryConfig
@@ -163,6 +167,13 @@ class Registry:
 
         self._refresh_lock = Lock()
 
+        # On demand feature views deserialized from the registry proto, keyed by project
+        # and name. Every apply updates the last updated timestamp, which is used to
+        # detect stale entries.
+        self._on_demand_feature_view_cache: Dict[
+            Tuple[str, str], Tuple[Tuple[int, int], OnDemandFeatureView]
+        ] = {}
+
         if registry_config:
             registry_store_type = registry_config.registry_store_type
             registry_path = registry_config.path
@@ -528,7 +539,7 @@ class Registry:
         for on_demand_feature_view in registry.on_demand_feature_views:
             if on_demand_feature_view.spec.project == project:
                 on_demand_feature_views.append(
-                    OnDemandFeatureView.from_proto(on_demand_feature_view)
+                    self._on_demand_feature_view_from_proto(on_demand_feature_view)
                 )
         return on_demand_feature_views
 
@@ -554,9 +565,51 @@ class Registry:
                 on_demand_feature_view.spec.project == project
                 and on_demand_feature_view.spec.name == name
             ):
-                return OnDemandFeatureView.from_proto(on_demand_feature_view)
+                return self._on_demand_feature_view_from_proto(on_demand_feature_view)
         raise OnDemandFeatureViewNotFoundException(name, project=project)
 
+    def _on_demand_feature_view_from_proto(
+        self, on_demand_feature_view_proto: OnDemandFeatureViewProto
+    ) -> OnDemandFeatureView:
+        """
+        Returns a copy of the on demand feature view, which is only deserialized again
+        if the on demand feature view has been updated since it was last deserialized.
+        """
+        if not on_demand_feature_view_proto.meta.HasField("last_updated_timestamp"):
+            return OnDemandFeatureView.from_proto(on_demand_feature_view_proto)
+
+        key = (
+            on_demand_feature_view_proto.spec.project,
+            on_demand_feature_view_proto.spec.name,
+        )
+        last_updated_timestamp = (
+            on_demand_feature_view_proto.meta.last_updated_timestamp
+        )
+        version = (last_updated_timestamp.seconds, last_updated_timestamp.nanos)
+        cached = self._on_demand_feature_view_cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (
+                version,
+                OnDemandFeatureView.from_proto(on_demand_feature_view_proto),
+            )
+            self._on_demand_feature_view_cache[key] = cached
+
+        # The copy doesn't share mutable members with the cached on demand feature view,
+        # so that callers can modify it. Only the udf and the derived metadata are shared.
+        on_demand_feature_view = copy.copy(cached[1])
+        on_demand_feature_view.features = copy.deepcopy(on_demand_feature_view.features)
+        on_demand_feature_view.tags = copy.deepcopy(on_demand_feature_view.tags)
+        on_demand_feature_view.projection = copy.deepcopy(
+            on_demand_feature_view.projection
+        )
+        on_demand_feature_view.source_feature_view_projections = copy.deepcopy(
+            on_demand_feature_view.source_feature_view_projections
+        )
+        on_demand_feature_view.source_request_sources = copy.deepcopy(
+            on_demand_feature_view.source_request_sources
+        )
+        return on_demand_feature_view
+
     def get_data_source(
         self, name: str, project: str, allow_cache: bool = False
     ) -> DataSource:
@@ -34,6 +34,7 @@ ONLINE_STORE_CLASS_FOR_TYPE = {
     "datastore": "feast.infra.online_stores.datastore.DatastoreOnlineStore",
     "redis": "feast.infra.online_stores.redis.RedisOnlineStore",
     "dynamodb": "feast.infra.online_stores.dynamodb.DynamoDBOnlineStore",
+    "snapshot": "feast.infra.online_stores.snapshot.SnapshotOnlineStore",
     "snowflake.online": "feast.infra.online_stores.snowflake.SnowflakeOnlineStore",
 }
 
@@ -43,6 +44,7 @@ OFFLINE_STORE_CLASS_FOR_TYPE = {
     "redshift": "feast.infra.offline_stores.redshift.RedshiftOfflineStore",
     "snowflake.offline": "feast.infra.offline_stores.snowflake.SnowflakeOfflineStore",
     "spark": "feast.infra.offline_stores.contrib.spark_offline_store.spark.SparkOfflineStore",
+    "duckdb": "feast.infra.offline_stores.contrib.duckdb_offline_store.duckdb.DuckDBOfflineStore",
 }
 
 FEATURE_SERVER_CONFIG_CLASS_FOR_TYPE = {
@@ -88,6 +90,25 @@ class RegistryConfig(FeastBaseModel):
      expire. Users can manually refresh the cache by calling feature_store.refresh_registry() """
 
 
+class RetrievalCacheConfig(FeastConfigBaseModel):
+    """Configuration of the local cache of historical retrieval results."""
+
+    path: StrictStr = "data/retrieval_cache"
+    """ str: Local directory in which cached results are stored as Parquet files. Relative paths are resolved
+     against the repo path. """
+
+    max_size_mb: StrictInt = 1024
+    """ int: Maximum total size of the cached results. The least recently used results are evicted first. """
+
+
+class SchemaCacheConfig(FeastConfigBaseModel):
+    """Configuration of the local cache of data source schemas used for inference."""
+
+    path: StrictStr = "data/schema_cache.json"
+    """ str: Local file in which the column names and types of data sources are cached. Relative paths are
+     resolved against the repo path. """
+
+
 class RepoConfig(FeastBaseModel):
     """Repo config. Typically loaded from `feature_store.yaml`"""
 
@@ -119,6 +140,13 @@ class RepoConfig(FeastBaseModel):
 
     go_feature_server: Optional[bool] = False
 
+    retrieval_cache: Optional[RetrievalCacheConfig] = None
+    """ RetrievalCacheConfig: Caches the results of get_historical_features locally (optional) """
+
+    schema_cache: Optional[SchemaCacheConfig] = None
+    """ SchemaCacheConfig: Caches the schemas of local file sources used for inference during apply and plan
+     (optional) """
+
     def __init__(self, **data: Any):
         super().__init__(**data)
 
@@ -263,6 +291,38 @@ class RepoConfig(FeastBaseModel):
 
         return values
 
+    @root_validator(pre=True)
+    def _validate_go_feature_server_config(cls, values):
+        if not values.get("go_feature_server"):
+            return values
+
+        online_store = values.get("online_store")
+
+        def get_online_store_option(name: str) -> Any:
+            if isinstance(online_store, Dict):
+                return online_store.get(name)
+            return getattr(online_store, name, None)
+
+        # The Go feature server only reads feature values stored as Value protos.
+        if get_online_store_option("value_encoding") == "typed":
+            raise ValueError(
+                "The typed value encoding of the online store is not supported by the Go feature server."
+            )
+
+        # The Go feature server only reads SQLite tables with a row for every feature.
+        if get_online_store_option("table_layout") == "row_per_entity":
+            raise ValueError(
+                "The row_per_entity table layout of the online store is not supported by the Go feature server."
+            )
+
+        # The Go feature server only reads Redis hashes with the values of every entity.
+        if get_online_store_option("key_layout") == "feature_view":
+            raise ValueError(
+                "The feature_view key layout of the online store is not supported by the Go feature server."
+            )
+
+        return values
+
     @validator("project")
     def _validate_project_name(cls, v):
         from feast.repo_operations import is_valid_name
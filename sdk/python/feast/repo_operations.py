@@ -107,8 +107,7 @@ def parse_repo(repo_root: Path) -> RepoContents:
     for repo_file in get_repo_files(repo_root):
         module_path = py_path_to_module(repo_file, repo_root)
         module = importlib.import_module(module_path)
-        for attr_name in dir(module):
-            obj = getattr(module, attr_name)
+        for obj in list(vars(module).values()):
             if isinstance(obj, DataSource):
                 res.data_sources.add(obj)
             if isinstance(obj, FeatureView):
@@ -1,6 +1,8 @@
 import logging
+import multiprocessing
 import sys
 from concurrent import futures
+from typing import Optional
 
 import grpc
 import pyarrow as pa
@@ -8,6 +10,7 @@ from grpc_reflection.v1alpha import reflection
 
 from feast.errors import OnDemandFeatureViewNotFoundException
 from feast.feature_store import FeatureStore
+from feast.on_demand_feature_view import PYTHON_MODE, OnDemandFeatureView
 from feast.protos.feast.serving.TransformationService_pb2 import (
     DESCRIPTOR,
     TRANSFORMATION_SERVICE_TYPE_PYTHON,
@@ -23,11 +26,80 @@ from feast.version import get_version
 
 log = logging.getLogger(__name__)
 
+# Arrow IPC files start with this magic string, whereas IPC streams start with a schema
+# message. Responses use the same format as the corresponding request.
+ARROW_FILE_MAGIC = b"ARROW1"
+
+# The feature store of a transformation worker process.
+_worker_store: Optional[FeatureStore] = None
+
+
+def transform_arrow(odfv: OnDemandFeatureView, arrow_input: bytes) -> bytes:
+    """
+    Applies the transformation of an on demand feature view to serialized Arrow data.
+
+    Args:
+        odfv: The on demand feature view whose transformation is applied.
+        arrow_input: The input features, serialized in the Arrow IPC file or stream format.
+
+    Returns:
+        The transformed features, serialized in the same Arrow IPC format as the input.
+    """
+    # Wrapping the bytes in a buffer lets Arrow read the record batches without copying.
+    buffer = pa.py_buffer(arrow_input)
+    is_arrow_file = arrow_input[: len(ARROW_FILE_MAGIC)] == ARROW_FILE_MAGIC
+    if is_arrow_file:
+        table = pa.ipc.open_file(buffer).read_all()
+    else:
+        table = pa.ipc.open_stream(buffer).read_all()
+
+    if odfv.mode == PYTHON_MODE:
+        result = pa.Table.from_pydict(
+            odfv.get_transformed_features_dict(table.to_pydict(), True)
+        )
+    else:
+        result = pa.Table.from_pandas(
+            odfv.get_transformed_features_df(table.to_pandas(), True)
+        )
+
+    sink = pa.BufferOutputStream()
+    if is_arrow_file:
+        writer = pa.ipc.new_file(sink, result.schema)
+    else:
+        writer = pa.ipc.new_stream(sink, result.schema)
+    writer.write_table(result)
+    writer.close()
+
+    return sink.getvalue().to_pybytes()
+
+
+def _initialize_transformation_worker(repo_path: str):
+    global _worker_store
+    _worker_store = FeatureStore(repo_path=repo_path)
+
+
+def _transform_arrow_in_worker(odfv_name: str, arrow_input: bytes) -> bytes:
+    assert _worker_store is not None
+    odfv = _worker_store.get_on_demand_feature_view(
+        odfv_name, allow_registry_cache=True
+    )
+    return transform_arrow(odfv, arrow_input)
+
 
 class TransformationServer(TransformationServiceServicer):
-    def __init__(self, fs: FeatureStore) -> None:
+    def __init__(
+        self, fs: FeatureStore, executor: Optional[futures.Executor] = None
+    ) -> None:
+        """
+        Args:
+            fs: The feature store whose on demand feature views are served.
+            executor (optional): A process pool whose workers have been initialized with
+                `_initialize_transformation_worker`. If not specified, transformations
+                run in the server process.
+        """
         super().__init__()
         self.fs = fs
+        self.executor = executor
 
     def GetTransformationServiceInfo(self, request, context):
         response = GetTransformationServiceInfoResponse(
@@ -38,32 +110,57 @@ class TransformationServer(TransformationServiceServicer):
 
     def TransformFeatures(self, request, context):
         try:
+            # The registry only deserializes on demand feature views again after they
+            # have been updated, so this is cheap enough to do for every request.
             odfv = self.fs.get_on_demand_feature_view(
-                request.on_demand_feature_view_name
+                request.on_demand_feature_view_name, allow_registry_cache=True
             )
         except OnDemandFeatureViewNotFoundException:
             context.set_code(grpc.StatusCode.INVALID_ARGUMENT)
             raise
 
-        df = pa.ipc.open_file(request.transformation_input.arrow_value).read_pandas()
-
-        result_df = odfv.get_transformed_features_df(df, True)
-        result_arrow = pa.Table.from_pandas(result_df)
-        sink = pa.BufferOutputStream()
-        writer = pa.ipc.new_file(sink, result_arrow.schema)
-        writer.write_table(result_arrow)
-        writer.close()
-
-        buf = sink.getvalue().to_pybytes()
+        arrow_input = request.transformation_input.arrow_value
+        if self.executor is None:
+            buf = transform_arrow(odfv, arrow_input)
+        else:
+            buf = self.executor.submit(
+                _transform_arrow_in_worker, odfv.name, arrow_input
+            ).result()
 
         return TransformFeaturesResponse(
             transformation_output=ValueType(arrow_value=buf)
         )
 
 
-def start_server(store: FeatureStore, port: int):
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    add_TransformationServiceServicer_to_server(TransformationServer(store), server)
+def start_server(store: FeatureStore, port: int, transformation_workers: int = 0):
+    """
+    Starts the transformation server.
+
+    Args:
+        store: The feature store whose on demand feature views are served.
+        port: The port to listen on.
+        transformation_workers (optional): The number of processes that run the
+            transformations. Transformations hold the GIL, so CPU-bound transformations
+            only scale with cores if they run in separate processes. If 0, the
+            transformations run in the threads of the gRPC server.
+    """
+    executor: Optional[futures.Executor] = None
+    if transformation_workers > 0:
+        # gRPC does not support forking once the server is running, so the workers are
+        # spawned and load the feature repo themselves.
+        executor = futures.ProcessPoolExecutor(
+            max_workers=transformation_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_transformation_worker,
+            initargs=(str(store.repo_path),),
+        )
+
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=max(10, 2 * transformation_workers))
+    )
+    add_TransformationServiceServicer_to_server(
+        TransformationServer(store, executor), server
+    )
     service_names_available_for_reflection = (
         DESCRIPTOR.services_by_name["TransformationService"].full_name,
         reflection.SERVICE_NAME,
@@ -71,4 +168,8 @@ def start_server(store: FeatureStore, port: int):
     reflection.enable_server_reflection(service_names_available_for_reflection, server)
     server.add_insecure_port(f"[::]:{port}")
     server.start()
-    server.wait_for_termination()
+    try:
+        server.wait_for_termination()
+    finally:
+        if executor is not None:
+            executor.shutdown()
@@ -44,6 +44,7 @@ from feast.protos.feast.types.Value_pb2 import (
     StringList,
 )
 from feast.protos.feast.types.Value_pb2 import Value as ProtoValue
+from feast.utils import make_tzaware, to_epoch_seconds, to_naive_utc_datetime64
 from feast.value_type import ListType, ValueType
 
 
@@ -264,19 +265,30 @@ PYTHON_SCALAR_VALUE_TYPE_TO_PROTO_VALUE: Dict[
 }
 
 
+def _datetimes_to_int_timestamps(values: Any) -> Sequence[np.int_]:
+    datetime64s = to_naive_utc_datetime64(values)
+    if np.isnat(datetime64s).any():
+        raise ValueError(
+            "Missing timestamps (NaT) can't be converted to Unix timestamps."
+        )
+    return cast(Sequence[np.int_], to_epoch_seconds(datetime64s))
+
+
 def _python_datetime_to_int_timestamp(
     values: Sequence[Any],
 ) -> Sequence[Union[int, np.int_]]:
-    # Fast path for Numpy array.
-    if isinstance(values, np.ndarray) and isinstance(values.dtype, np.datetime64):
+    # Fast path for arrays and sequences of datetimes, which are converted all at once.
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
         if values.ndim != 1:
             raise ValueError("Only 1 dimensional arrays are supported.")
-        return cast(Sequence[np.int_], values.astype("datetime64[s]").astype(np.int_))
+        return _datetimes_to_int_timestamps(values)
+    if all(isinstance(value, (datetime, np.datetime64)) for value in values):
+        return _datetimes_to_int_timestamps(values)
 
     int_timestamps = []
     for value in values:
         if isinstance(value, datetime):
-            int_timestamps.append(int(value.timestamp()))
+            int_timestamps.append(int(make_tzaware(value).timestamp()))
         elif isinstance(value, Timestamp):
             int_timestamps.append(int(value.ToSeconds()))
         elif isinstance(value, np.datetime64):
@@ -1,5 +1,9 @@
 from datetime import datetime
+from typing import Any, List
 
+import numpy as np
+import pandas as pd
+import pyarrow
 from pytz import utc
 
 
@@ -16,3 +20,54 @@ def to_naive_utc(ts: datetime) -> datetime:
         return ts
     else:
         return ts.astimezone(utc).replace(tzinfo=None)
+
+
+def make_series_tzaware(series: Any) -> Any:
+    """
+    Converts a pandas or dask series of timestamps to tz-aware UTC timestamps.
+
+    Like make_tzaware, tz-naive timestamps are assumed to be UTC. Series that are already
+    stored as datetimes are converted without touching the individual values.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        if str(dtype.tz) == "UTC":
+            return series
+        return series.dt.tz_convert(utc)
+    if pd.api.types.is_datetime64_dtype(dtype):
+        return series.dt.tz_localize(utc)
+    if hasattr(series, "map_partitions"):
+        return series.map_partitions(
+            pd.to_datetime, utc=True, meta=(series.name, "datetime64[ns, UTC]")
+        )
+    return pd.to_datetime(series, utc=True)
+
+
+def to_naive_utc_datetime64(values: Any) -> np.ndarray:
+    """
+    Converts an Arrow, numpy or pandas array of timestamps to a datetime64[ns] numpy array
+    of tz-naive UTC timestamps.
+
+    Like make_tzaware, tz-naive timestamps are assumed to be UTC.
+    """
+    if isinstance(values, (pyarrow.Array, pyarrow.ChunkedArray)):
+        # Numpy has no time zones, so Arrow already returns the timestamps in UTC.
+        values = values.to_numpy(zero_copy_only=False)
+    if isinstance(values, np.ndarray) and values.dtype.kind == "M":
+        return values.astype("datetime64[ns]")
+    return pd.to_datetime(values, utc=True).tz_localize(None).to_numpy()
+
+
+def to_epoch_seconds(values: Any) -> np.ndarray:
+    """Converts an Arrow, numpy or pandas array of timestamps to int64 epoch seconds."""
+    return to_naive_utc_datetime64(values).astype("datetime64[s]").astype(np.int64)
+
+
+def to_naive_utc_datetimes(values: Any) -> List[datetime]:
+    """
+    Converts an Arrow, numpy or pandas array of timestamps to tz-naive UTC python
+    datetimes. Missing timestamps are returned as None.
+    """
+    return (
+        to_naive_utc_datetime64(values).astype("datetime64[us]").astype(object).tolist()
+    )
@@ -61,7 +61,7 @@ REQUIRED = [
     "tenacity>=7.*",
     "toml==0.10.*",
     "tqdm==4.*",
-    "fastapi>=0.68.0",
+    "fastapi>=0.69.0",
     "uvicorn[standard]>=0.14.0",
     "proto-plus<1.19.7",
     "tensorflow-metadata>=1.0.0,<2.0.0",
@@ -95,6 +95,10 @@ SPARK_REQUIRED = [
     "pyspark>=3.0.0",
 ]
 
+DUCKDB_REQUIRED = [
+    "duckdb>=1.1.0",
+]
+
 GE_REQUIRED = [
     "great_expectations>=0.14.0,<0.15.0"
 ]
@@ -147,6 +151,7 @@ CI_REQUIRED = (
         + AWS_REQUIRED
         + SNOWFLAKE_REQUIRED
         + SPARK_REQUIRED
+        + DUCKDB_REQUIRED
         + GE_REQUIRED
 )
 
@@ -404,6 +409,7 @@ setup(
         "redis": REDIS_REQUIRED,
         "snowflake": SNOWFLAKE_REQUIRED,
         "spark": SPARK_REQUIRED,
+        "duckdb": DUCKDB_REQUIRED,
         "ge": GE_REQUIRED,
     },
     include_package_data=True,
@@ -0,0 +1,82 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from google.protobuf.json_format import MessageToJson
+
+from feast import proto_json
+from feast.feature_server import (
+    ARROW_STREAM_MEDIA_TYPE,
+    PROTOBUF_MEDIA_TYPE,
+    parse_request,
+    serialize_response,
+)
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FieldStatus,
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+)
+from feast.protos.feast.types.Value_pb2 import RepeatedValue, Value
+
+NUM_ENTITIES = 100
+NUM_FEATURES = 50
+
+
+def _request() -> GetOnlineFeaturesRequest:
+    request = GetOnlineFeaturesRequest()
+    request.features.val.extend(
+        [f"driver_stats:feature_{i}" for i in range(NUM_FEATURES)]
+    )
+    request.entities["driver_id"].CopyFrom(
+        RepeatedValue(val=[Value(int64_val=i) for i in range(NUM_ENTITIES)])
+    )
+    return request
+
+
+def _response() -> GetOnlineFeaturesResponse:
+    response = GetOnlineFeaturesResponse()
+    response.metadata.feature_names.val.append("driver_id")
+    response.results.add(
+        values=[Value(int64_val=i) for i in range(NUM_ENTITIES)],
+        statuses=[FieldStatus.PRESENT] * NUM_ENTITIES,
+    )
+    for i in range(NUM_FEATURES):
+        response.metadata.feature_names.val.append(f"feature_{i}")
+        response.results.add(
+            values=[Value(double_val=i * 0.1 + j) for j in range(NUM_ENTITIES)],
+            statuses=[FieldStatus.PRESENT] * NUM_ENTITIES,
+        )
+    return response
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "media_type", ["application/json", PROTOBUF_MEDIA_TYPE, ARROW_STREAM_MEDIA_TYPE]
+)
+def test_feature_server_encodings(benchmark, media_type):
+    """
+    Measures the server-side cost of decoding a request and encoding a response of
+    100 entities with 50 features, and records the size of both payloads.
+    """
+    proto_json.patch()
+
+    if media_type == "application/json":
+        request_body = MessageToJson(_request()).encode()
+        content_type = "application/json"
+    else:
+        request_body = _request().SerializeToString()
+        content_type = PROTOBUF_MEDIA_TYPE
+    response = OnlineResponse(_response())
+
+    def encode_and_decode():
+        parse_request(request_body, content_type)
+        serialized_response = serialize_response(response, media_type)
+        if isinstance(serialized_response, dict):
+            # FastAPI serializes JSON responses like this after the handler returns.
+            return JSONResponse(jsonable_encoder(serialized_response)).body
+        return serialized_response.body
+
+    response_body = benchmark(encode_and_decode)
+
+    benchmark.extra_info["request_bytes"] = len(request_body)
+    benchmark.extra_info["response_bytes"] = len(response_body)
@@ -0,0 +1,117 @@
+from datetime import datetime
+
+import pytest
+
+from feast import Feature, FeatureView, RepoConfig, ValueType
+from feast.infra.offline_stores.file_source import FileSource
+from feast.infra.online_stores.online_store import OnlineStore
+from feast.infra.online_stores.snapshot import SnapshotOnlineStore
+from feast.infra.online_stores.sqlite import SqliteOnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+
+NUM_ENTITIES = 100
+NUM_FEATURES = 200
+NUM_REQUESTED_FEATURES = 10
+
+FEATURE_NAMES = [f"feature_{i}" for i in range(NUM_FEATURES)]
+FEATURE_VIEW = FeatureView(
+    name="wide_view",
+    entities=["driver_id"],
+    features=[Feature(name, ValueType.DOUBLE) for name in FEATURE_NAMES],
+    batch_source=FileSource(path="unused.parquet", timestamp_field="ts"),
+)
+ENTITY_KEYS = [
+    EntityKeyProto(join_keys=["driver_id"], entity_values=[ValueProto(int64_val=i)])
+    for i in range(NUM_ENTITIES)
+]
+
+
+def _benchmark_online_read(
+    benchmark, store: OnlineStore, config: RepoConfig, num_requested_features
+):
+    store.update(config, [], [FEATURE_VIEW], [], [], partial=False)
+    store.online_write_batch(
+        config,
+        FEATURE_VIEW,
+        [
+            (
+                entity_key,
+                {
+                    name: ValueProto(double_val=i)
+                    for i, name in enumerate(FEATURE_NAMES)
+                },
+                datetime.utcnow(),
+                None,
+            )
+            for entity_key in ENTITY_KEYS
+        ],
+        progress=None,
+    )
+
+    requested_features = (
+        FEATURE_NAMES[:num_requested_features] if num_requested_features else None
+    )
+    rows = benchmark(
+        store.online_read, config, FEATURE_VIEW, ENTITY_KEYS, requested_features
+    )
+
+    assert len(rows) == NUM_ENTITIES
+    assert len(rows[0][1]) == (num_requested_features or NUM_FEATURES)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("table_layout", ["row_per_feature", "row_per_entity"])
+@pytest.mark.parametrize(
+    "num_requested_features",
+    [NUM_REQUESTED_FEATURES, None],
+    ids=["requested_features", "all_features"],
+)
+def test_sqlite_online_read_wide_view(
+    benchmark, tmp_path, table_layout, num_requested_features
+):
+    """
+    Measures reading a few features of 100 entities from a feature view with 200 features,
+    compared to reading all of them, in both table layouts.
+    """
+    config = RepoConfig(
+        project="test",
+        provider="local",
+        registry=str(tmp_path / "registry.db"),
+        online_store={
+            "path": str(tmp_path / "online_store.db"),
+            "table_layout": table_layout,
+        },
+    )
+    _benchmark_online_read(
+        benchmark, SqliteOnlineStore(), config, num_requested_features
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("value_encoding", ["proto", "typed"])
+@pytest.mark.parametrize(
+    "num_requested_features",
+    [NUM_REQUESTED_FEATURES, None],
+    ids=["requested_features", "all_features"],
+)
+def test_snapshot_online_read_wide_view(
+    benchmark, tmp_path, value_encoding, num_requested_features
+):
+    """
+    Measures the same reads as test_sqlite_online_read_wide_view from a snapshot, in both
+    value encodings.
+    """
+    config = RepoConfig(
+        project="test",
+        provider="local",
+        registry=str(tmp_path / "registry.db"),
+        online_store={
+            "type": "snapshot",
+            "path": str(tmp_path / "snapshots"),
+            "value_encoding": value_encoding,
+        },
+    )
+    _benchmark_online_read(
+        benchmark, SnapshotOnlineStore(), config, num_requested_features
+    )
@@ -0,0 +1,95 @@
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from feast import FeatureStore, RepoConfig
+from feast.repo_config import SchemaCacheConfig
+from feast.repo_operations import parse_repo
+
+NUM_FILES = 10
+NUM_SOURCES = 100
+NUM_FEATURE_VIEWS = 1000
+
+REPO_FILE_HEADER = """
+from datetime import timedelta
+
+from feast import Entity, FeatureView, FileSource, ValueType
+
+driver = Entity(name="driver_id", value_type=ValueType.INT64)
+"""
+
+# Neither the features, nor the timestamp field or the type of the entity are specified, so
+# they are all inferred from the schemas of the sources.
+FEATURE_VIEW_TEMPLATE = """
+fv_{index} = FeatureView(
+    name="fv_{index}",
+    entities=["driver_id"],
+    ttl=timedelta(days=1),
+    batch_source=FileSource(path="{path}", name="source_{index}"),
+)
+"""
+
+
+def _create_repo(repo_path):
+    rows = 10
+    for source in range(NUM_SOURCES):
+        pd.DataFrame(
+            {
+                "driver_id": np.arange(rows),
+                "event_timestamp": pd.date_range("2021-01-01", periods=rows),
+                **{f"feature_{i}": np.random.rand(rows) for i in range(10)},
+            }
+        ).to_parquet(repo_path / f"source_{source}.parquet")
+
+    views_per_file = NUM_FEATURE_VIEWS // NUM_FILES
+    for file in range(NUM_FILES):
+        code = REPO_FILE_HEADER
+        for index in range(file * views_per_file, (file + 1) * views_per_file):
+            path = repo_path / f"source_{index % NUM_SOURCES}.parquet"
+            code += FEATURE_VIEW_TEMPLATE.format(index=index, path=path)
+        (repo_path / f"features_{file}.py").write_text(code)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("schema_cache", [False, True])
+def test_plan(benchmark, tmp_path, schema_cache):
+    """
+    Measures `feast plan` of a repo of 1000 feature views reading from 100 sources, including
+    parsing the repo and inferring the schemas of the feature views.
+    """
+    _create_repo(tmp_path)
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test",
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            online_store={"path": str(tmp_path / "online_store.db")},
+            repo_path=tmp_path,
+            schema_cache=SchemaCacheConfig() if schema_cache else None,
+        )
+    )
+    sys.path.insert(0, str(tmp_path))
+
+    def unload_repo():
+        # Every round parses and infers new objects.
+        for file in range(NUM_FILES):
+            sys.modules.pop(f"features_{file}", None)
+
+    def plan():
+        repo = parse_repo(tmp_path)
+        store._plan(repo)
+        return repo
+
+    try:
+        # The first plan fills the schema cache.
+        unload_repo()
+        plan()
+        repo = benchmark.pedantic(plan, setup=unload_repo, rounds=5)
+    finally:
+        sys.path.remove(str(tmp_path))
+        unload_repo()
+
+    assert len(repo.feature_views) == NUM_FEATURE_VIEWS
+    assert all(len(fv.features) == 10 for fv in repo.feature_views)
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+import pytest
+
+from feast import Feature, FeatureView, RepoConfig, ValueType
+from feast.infra.offline_stores.file_source import FileSource
+from feast.infra.online_stores.redis import RedisOnlineStore
+from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from tests.integration.feature_repos.universal.online_store.redis import (
+    RedisOnlineStoreCreator,
+)
+
+NUM_ENTITIES = 10_000
+NUM_FEATURES = 5
+
+ENTITY_KEYS = [
+    EntityKeyProto(
+        join_keys=["customer_id", "driver_id"],
+        entity_values=[ValueProto(string_val=f"customer_{i}"), ValueProto(int64_val=i)],
+    )
+    for i in range(NUM_ENTITIES)
+]
+
+
+def _feature_view(name: str) -> FeatureView:
+    return FeatureView(
+        name=name,
+        entities=["customer_id", "driver_id"],
+        features=[
+            Feature(f"feature_{i}", ValueType.DOUBLE) for i in range(NUM_FEATURES)
+        ],
+        batch_source=FileSource(path="unused.parquet", timestamp_field="ts"),
+    )
+
+
+@pytest.fixture(scope="module")
+def redis_online_store_config():
+    creator = RedisOnlineStoreCreator("benchmark")
+    yield creator.create_online_store()
+    creator.teardown()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("key_layout", ["entity", "feature_view"])
+@pytest.mark.parametrize("num_feature_views", [1, 3])
+def test_redis_memory_footprint(
+    benchmark, tmp_path, redis_online_store_config, key_layout, num_feature_views
+):
+    """
+    Measures the time to write 5 features of 10,000 entities with two join keys to each of 1 or 3
+    feature views, in both key layouts, and records the memory used by Redis afterwards.
+    """
+    config = RepoConfig(
+        project="benchmark",
+        provider="local",
+        registry=str(tmp_path / "registry.db"),
+        online_store={**redis_online_store_config, "key_layout": key_layout},
+    )
+    store = RedisOnlineStore()
+    client = store._get_client(config.online_store)
+    feature_views = [
+        _feature_view(f"driver_hourly_stats_{i}") for i in range(num_feature_views)
+    ]
+    data = [
+        (
+            entity_key,
+            {f"feature_{i}": ValueProto(double_val=i) for i in range(NUM_FEATURES)},
+            datetime.utcnow(),
+            None,
+        )
+        for entity_key in ENTITY_KEYS
+    ]
+
+    def flush():
+        client.flushdb()
+
+    def write():
+        for feature_view in feature_views:
+            store.online_write_batch(config, feature_view, data, progress=None)
+
+    flush()
+    used_memory_before = client.info("memory")["used_memory"]
+    benchmark.pedantic(write, setup=flush, rounds=3)
+    used_memory = client.info("memory")["used_memory"] - used_memory_before
+
+    benchmark.extra_info["used_memory_bytes"] = used_memory
+    benchmark.extra_info["used_memory_bytes_per_entity"] = used_memory / NUM_ENTITIES
+    assert client.dbsize() == (
+        NUM_ENTITIES * num_feature_views
+        if key_layout == "feature_view"
+        else NUM_ENTITIES
+    )
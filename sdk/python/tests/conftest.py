@@ -33,6 +33,7 @@ from tests.integration.feature_repos.repo_configuration import (
     GO_REPO_CONFIGS,
     REDIS_CLUSTER_CONFIG,
     REDIS_CONFIG,
+    REDIS_FEATURE_VIEW_KEY_LAYOUT_CONFIG,
     Environment,
     TestData,
     construct_test_environment,
@@ -206,9 +207,16 @@ def go_environment(request, worker_id: str):
 
 
 @pytest.fixture(
-    params=[REDIS_CONFIG, REDIS_CLUSTER_CONFIG],
+    params=[REDIS_CONFIG, REDIS_CLUSTER_CONFIG, REDIS_FEATURE_VIEW_KEY_LAYOUT_CONFIG],
     scope="session",
-    ids=[str(c) for c in [REDIS_CONFIG, REDIS_CLUSTER_CONFIG]],
+    ids=[
+        str(c)
+        for c in [
+            REDIS_CONFIG,
+            REDIS_CLUSTER_CONFIG,
+            REDIS_FEATURE_VIEW_KEY_LAYOUT_CONFIG,
+        ]
+    ],
 )
 def local_redis_environment(request, worker_id):
     e = construct_test_environment(
@@ -52,7 +52,7 @@ class FooProvider(Provider):
         end_date: datetime,
         registry: Registry,
         project: str,
-        tqdm_builder: Callable[[int], tqdm],
+        tqdm_builder: Callable[[Optional[int]], tqdm],
     ) -> None:
         pass
 
@@ -0,0 +1,12 @@
+from feast.infra.offline_stores.contrib.duckdb_offline_store.duckdb import (
+    DuckDBOfflineStoreConfig,
+)
+from feast.repo_config import FeastConfigBaseModel
+from tests.integration.feature_repos.universal.data_sources.file import (
+    FileDataSourceCreator,
+)
+
+
+class DuckDBDataSourceCreator(FileDataSourceCreator):
+    def create_offline_store_config(self) -> FeastConfigBaseModel:
+        return DuckDBOfflineStoreConfig()
@@ -21,6 +21,7 @@ from feast.errors import (
 )
 from feast.feature_view import FeatureView
 from feast.inference import (
+    DataSourceSchemas,
     update_data_sources_with_inferred_event_timestamp_col,
     update_entities_with_inferred_types_from_feature_views,
 )
@@ -28,6 +29,7 @@ from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import
     SparkSource,
 )
 from feast.on_demand_feature_view import on_demand_feature_view
+from feast.repo_config import SchemaCacheConfig
 from tests.utils.data_source_utils import (
     prep_file_source,
     simple_bq_source_using_query_arg,
@@ -76,6 +78,55 @@ def test_update_entities_with_inferred_types_from_feature_views(
             )
 
 
+def test_data_source_schemas(tmp_path, simple_dataset_1, monkeypatch):
+    lookups = []
+    get_table_column_names_and_types = FileSource.get_table_column_names_and_types
+
+    def counting_get_table_column_names_and_types(self, config):
+        lookups.append(self)
+        return get_table_column_names_and_types(self, config)
+
+    monkeypatch.setattr(
+        FileSource,
+        "get_table_column_names_and_types",
+        counting_get_table_column_names_and_types,
+    )
+
+    path = tmp_path / "data.parquet"
+    simple_dataset_1.to_parquet(path)
+    # Sources which only differ in how their columns are used share a schema.
+    sources = [
+        FileSource(path=str(path), name="source_1", timestamp_field="ts_1"),
+        FileSource(path=str(path), name="source_2"),
+    ]
+    config = RepoConfig(
+        provider="local",
+        project="test",
+        repo_path=tmp_path,
+        schema_cache=SchemaCacheConfig(path="schema_cache.json"),
+    )
+
+    schemas = DataSourceSchemas(config)
+    schemas.fetch(sources)
+    assert schemas.get(sources[1]) == list(
+        get_table_column_names_and_types(sources[0], config)
+    )
+    assert len(lookups) == 1
+
+    # The schema cache is used across runs, until the file changes.
+    DataSourceSchemas(config).get(sources[0])
+    assert len(lookups) == 1
+    simple_dataset_1.drop(columns=["float_col"]).to_parquet(path)
+    assert "float_col" not in dict(DataSourceSchemas(config).get(sources[0]))
+    assert len(lookups) == 2
+
+    # Errors are raised when the schema is used.
+    missing_source = FileSource(path=str(tmp_path / "missing.parquet"))
+    schemas.fetch([missing_source])
+    with pytest.raises(FileNotFoundError):
+        schemas.get(missing_source)
+
+
 def test_infer_datasource_names_file():
     file_path = "path/to/test.csv"
     data_source = FileSource(path=file_path)
@@ -14,6 +14,7 @@
 import time
 from datetime import timedelta
 from tempfile import mkstemp
+from unittest.mock import patch
 
 import pandas as pd
 import pytest
@@ -24,7 +25,11 @@ from feast.data_format import ParquetFormat
 from feast.entity import Entity
 from feast.feature import Feature
 from feast.feature_view import FeatureView
-from feast.on_demand_feature_view import RequestSource, on_demand_feature_view
+from feast.on_demand_feature_view import (
+    OnDemandFeatureView,
+    RequestSource,
+    on_demand_feature_view,
+)
 from feast.protos.feast.types import Value_pb2 as ValueProto
 from feast.registry import Registry
 from feast.repo_config import RegistryConfig
@@ -351,6 +356,68 @@ def test_modify_feature_views_success(test_registry):
         test_registry._get_registry_proto()
 
 
+@pytest.mark.parametrize(
+    "test_registry", [lazy_fixture("local_registry")],
+)
+def test_on_demand_feature_views_are_deserialized_once_per_version(test_registry):
+    request_source = RequestSource(
+        name="request_source", schema={"my_input_1": ValueType.INT32}
+    )
+
+    @on_demand_feature_view(
+        features=[Feature(name="odfv1_my_feature_1", dtype=ValueType.INT32)],
+        sources={"request_source": request_source},
+    )
+    def odfv1(feature_df: pd.DataFrame) -> pd.DataFrame:
+        data = pd.DataFrame()
+        data["odfv1_my_feature_1"] = feature_df["my_input_1"].astype("int32")
+        return data
+
+    project = "project"
+    test_registry.apply_feature_view(odfv1, project)
+
+    with patch.object(
+        OnDemandFeatureView, "from_proto", wraps=OnDemandFeatureView.from_proto
+    ) as from_proto:
+        first = test_registry.get_on_demand_feature_view("odfv1", project)
+        second = test_registry.list_on_demand_feature_views(project)[0]
+        assert from_proto.call_count == 1
+
+        # Callers get their own copies, which share the deserialized udf.
+        assert first is not second
+        assert first.udf is second.udf
+        assert first.last_updated_timestamp == second.last_updated_timestamp
+
+        # The copies don't share their mutable members.
+        first.features.append(Feature(name="odfv1_my_feature_2", dtype=ValueType.INT32))
+        first.tags["owner"] = "test"
+        first.projection.name_alias = "alias"
+        first.source_request_sources["request_source"].schema[
+            "my_input_2"
+        ] = ValueType.INT32
+        third = test_registry.get_on_demand_feature_view("odfv1", project)
+        assert len(third.features) == 1
+        assert third.tags == {}
+        assert third.projection.name_alias is None
+        assert third.source_request_sources == {"request_source": request_source}
+
+        # Re-applying a modified definition invalidates the cached copy.
+        @on_demand_feature_view(
+            features=[Feature(name="odfv1_my_feature_1", dtype=ValueType.FLOAT)],
+            sources={"request_source": request_source},
+        )
+        def odfv1(feature_df: pd.DataFrame) -> pd.DataFrame:
+            data = pd.DataFrame()
+            data["odfv1_my_feature_1"] = feature_df["my_input_1"].astype("float")
+            return data
+
+        test_registry.apply_feature_view(odfv1, project)
+        updated = test_registry.get_on_demand_feature_view("odfv1", project)
+        assert updated.features[0].dtype == ValueType.FLOAT
+
+    test_registry.teardown()
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize(
     "test_registry", [lazy_fixture("gcs_registry"), lazy_fixture("s3_registry")],
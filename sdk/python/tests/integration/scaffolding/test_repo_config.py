@@ -182,6 +182,58 @@ def test_bad_type():
     )
 
 
+def test_typed_value_encoding_with_go_feature_server():
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_store:
+            path: "online_store.db"
+            value_encoding: typed
+        go_feature_server: true
+        """
+        ),
+        expect_error="The typed value encoding of the online store is not supported by the Go feature server.",
+    )
+
+
+def test_row_per_entity_table_layout_with_go_feature_server():
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_store:
+            path: "online_store.db"
+            table_layout: row_per_entity
+        go_feature_server: true
+        """
+        ),
+        expect_error="The row_per_entity table layout of the online store is not supported by the Go feature server.",
+    )
+
+
+def test_feature_view_key_layout_with_go_feature_server():
+    _test_config(
+        dedent(
+            """
+        project: foo
+        registry: "registry.db"
+        provider: local
+        online_store:
+            type: redis
+            connection_string: "localhost:6379"
+            key_layout: feature_view
+        go_feature_server: true
+        """
+        ),
+        expect_error="The feature_view key layout of the online store is not supported by the Go feature server.",
+    )
+
+
 def test_no_project():
     _test_config(
         dedent(
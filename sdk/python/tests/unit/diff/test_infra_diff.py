@@ -1,6 +1,10 @@
+import sqlite3
+from datetime import datetime
+
 from google.protobuf import wrappers_pb2 as wrappers
 
 from feast.diff.infra_diff import (
+    InfraDiff,
     diff_between,
     diff_infra_protos,
     tag_infra_proto_objects_for_keep_delete_add,
@@ -8,6 +12,7 @@ from feast.diff.infra_diff import (
 from feast.diff.property_diff import TransitionType
 from feast.infra.online_stores.datastore import DatastoreTable
 from feast.infra.online_stores.dynamodb import DynamoDBTable
+from feast.infra.online_stores.sqlite import SqliteTable
 from feast.protos.feast.core.InfraObject_pb2 import Infra as InfraProto
 
 
@@ -152,3 +157,43 @@ def test_diff_infra_protos():
     assert updates[0].infra_object_property_diffs[
         1
     ].val_declared == wrappers.StringValue(value="post")
+
+
+def _table_names(path):
+    conn = sqlite3.connect(path)
+    return [row[0] for row in conn.execute("SELECT name FROM sqlite_master")]
+
+
+def test_infra_diff_update_sqlite_tables(tmp_path):
+    old_path = str(tmp_path / "old.db")
+    new_path = str(tmp_path / "new.db")
+    table = SqliteTable(path=old_path, name="driver_stats")
+    table.update()
+    table.conn.execute(
+        "INSERT INTO driver_stats VALUES (?, ?, ?, ?, ?)",
+        (b"key", "rating", b"value", datetime(2021, 1, 1), None),
+    )
+    table.conn.commit()
+
+    # Changes of the table layout are migrated in place.
+    migrated_table = SqliteTable(
+        path=old_path, name="driver_stats", table_layout="row_per_entity"
+    )
+    infra_diff = InfraDiff()
+    infra_diff.infra_object_diffs.append(
+        diff_between(table.to_proto(), migrated_table.to_proto(), "sqlite table")
+    )
+    infra_diff.update()
+    assert migrated_table.conn.execute(
+        "SELECT COUNT(*) FROM driver_stats"
+    ).fetchone() == (1,)
+
+    # Tables which moved are torn down at their old path.
+    moved_table = SqliteTable(path=new_path, name="driver_stats")
+    infra_diff = InfraDiff()
+    infra_diff.infra_object_diffs.append(
+        diff_between(migrated_table.to_proto(), moved_table.to_proto(), "sqlite table")
+    )
+    infra_diff.update()
+    assert "driver_stats" not in _table_names(old_path)
+    assert "driver_stats" in _table_names(new_path)
@@ -1,16 +1,22 @@
+import os
+import time
 from copy import deepcopy
 from dataclasses import dataclass
+from datetime import timedelta
 
 import boto3
 import pytest
 from moto import mock_dynamodb2
+from pydantic import ValidationError
 
+from feast.errors import DynamoDBUnprocessedItems
 from feast.infra.offline_stores.file import FileOfflineStoreConfig
 from feast.infra.online_stores.dynamodb import (
     DynamoDBOnlineStore,
     DynamoDBOnlineStoreConfig,
     DynamoDBTable,
 )
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 from feast.repo_config import RepoConfig
 from tests.utils.online_store_utils import (
     _create_n_customer_test_samples,
@@ -108,9 +114,7 @@ def test_online_store_config_dynamodb_client():
     dynamodb_store_config = DynamoDBOnlineStoreConfig(
         region=aws_region, endpoint_url=endpoint_url
     )
-    dynamodb_client = dynamodb_store._get_dynamodb_client(
-        dynamodb_store_config.region, dynamodb_store_config.endpoint_url
-    )
+    dynamodb_client = dynamodb_store._get_dynamodb_client(dynamodb_store_config)
     assert dynamodb_client.meta.region_name == aws_region
     assert dynamodb_client.meta.endpoint_url == endpoint_url
 
@@ -136,9 +140,7 @@ def test_online_store_config_dynamodb_resource():
     dynamodb_store_config = DynamoDBOnlineStoreConfig(
         region=aws_region, endpoint_url=endpoint_url
     )
-    dynamodb_resource = dynamodb_store._get_dynamodb_resource(
-        dynamodb_store_config.region, dynamodb_store_config.endpoint_url
-    )
+    dynamodb_resource = dynamodb_store._get_dynamodb_resource(dynamodb_store_config)
     assert dynamodb_resource.meta.client.meta.region_name == aws_region
     assert dynamodb_resource.meta.client.meta.endpoint_url == endpoint_url
 
@@ -156,6 +158,39 @@ def test_dynamodb_table_dynamodb_resource():
     assert dynamodb_resource.meta.client.meta.endpoint_url == endpoint_url
 
 
+def test_online_store_config_connection_pool(monkeypatch):
+    """Test DynamoDBOnlineStoreConfig configure the connection pool of the DynamoDB client."""
+    dynamodb_store = DynamoDBOnlineStore()
+    dynamodb_store_config = DynamoDBOnlineStoreConfig(
+        region=REGION, max_pool_connections=50, connect_timeout=1, read_timeout=2
+    )
+    dynamodb_client = dynamodb_store._get_dynamodb_client(dynamodb_store_config)
+    assert dynamodb_client.meta.config.max_pool_connections == 50
+    assert dynamodb_client.meta.config.connect_timeout == 1
+    assert dynamodb_client.meta.config.read_timeout == 2
+    # The client and the resource share their connections.
+    assert dynamodb_store._get_dynamodb_resource(dynamodb_store_config).meta.client is (
+        dynamodb_client
+    )
+
+    # Forked processes create their own client.
+    monkeypatch.setattr(os, "getpid", lambda: -1)
+    assert dynamodb_store._get_dynamodb_client(dynamodb_store_config) is not (
+        dynamodb_client
+    )
+
+
+@mock_dynamodb2
+def test_warm_up(repo_config):
+    """Test DynamoDBOnlineStore warm_up method opens a connection without failing."""
+    _create_test_table(PROJECT, TABLE_NAME, REGION)
+    dynamodb_store = DynamoDBOnlineStore()
+    dynamodb_store.warm_up(repo_config, [MockFeatureView(name=TABLE_NAME)])
+    # Missing tables are not an error.
+    dynamodb_store.warm_up(repo_config, [MockFeatureView(name="missing")])
+    assert dynamodb_store._dynamodb_resource is not None
+
+
 @mock_dynamodb2
 @pytest.mark.parametrize("n_samples", [5, 50, 100])
 def test_online_read(repo_config, n_samples):
@@ -176,21 +211,141 @@ def test_online_read(repo_config, n_samples):
 
 
 @mock_dynamodb2
-def test_write_batch_non_duplicates(repo_config):
+def test_online_read_partial_misses(repo_config):
+    """Test DynamoDBOnlineStore online_read method aligns the result with the entity keys."""
+    n_samples = 6
+    _create_test_table(PROJECT, f"{TABLE_NAME}_partial_misses", REGION)
+    data = _create_n_customer_test_samples(n=n_samples)
+    # Every other entity is missing, and the read entities are not in the order of the writes.
+    _insert_data_test_table(data[::2], PROJECT, f"{TABLE_NAME}_partial_misses", REGION)
+
+    entity_keys, features, *rest = zip(*data)
+    order = [5, 0, 3, 2, 1, 4, 0]
+    repo_config.online_store.batch_size = 2
+    dynamodb_store = DynamoDBOnlineStore()
+    returned_items = dynamodb_store.online_read(
+        config=repo_config,
+        table=MockFeatureView(name=f"{TABLE_NAME}_partial_misses"),
+        entity_keys=[entity_keys[i] for i in order],
+    )
+    assert [item[1] for item in returned_items] == [
+        None if i % 2 else features[i] for i in order
+    ]
+    assert [item[0] is None for item in returned_items] == [i % 2 == 1 for i in order]
+
+
+@mock_dynamodb2
+def test_online_read_requested_features(repo_config):
+    """Test DynamoDBOnlineStore online_read method only reads the requested features."""
+    n_samples = 5
+    _create_test_table(PROJECT, f"{TABLE_NAME}_{n_samples}", REGION)
+    data = _create_n_customer_test_samples(n=n_samples)
+    _insert_data_test_table(data, PROJECT, f"{TABLE_NAME}_{n_samples}", REGION)
+
+    entity_keys, features, *rest = zip(*data)
+    dynamodb_store = DynamoDBOnlineStore()
+    returned_items = dynamodb_store.online_read(
+        config=repo_config,
+        table=MockFeatureView(name=f"{TABLE_NAME}_{n_samples}"),
+        entity_keys=entity_keys,
+        requested_features=["name", "missing"],
+    )
+    assert [item[1] for item in returned_items] == [
+        {"name": f["name"]} for f in features
+    ]
+
+    returned_items = dynamodb_store.online_read(
+        config=repo_config,
+        table=MockFeatureView(name=f"{TABLE_NAME}_{n_samples}"),
+        entity_keys=entity_keys,
+        requested_features=["missing"],
+    )
+    assert [item[1] for item in returned_items] == [{}] * n_samples
+
+
+@mock_dynamodb2
+@pytest.mark.parametrize("write_concurrency", [1, 4])
+def test_write_batch_non_duplicates(repo_config, write_concurrency):
     """Test DynamoDBOnline Store deduplicate write batch request items."""
     dynamodb_tbl = f"{TABLE_NAME}_batch_non_duplicates"
     _create_test_table(PROJECT, dynamodb_tbl, REGION)
     data = _create_n_customer_test_samples()
     data_duplicate = deepcopy(data)
+    # The latest rows are kept, whatever their order.
+    for _, features, timestamp, _ in data:
+        features["age"] = ValueProto(int64_val=4)
+    for i, (entity_key, features, timestamp, created_ts) in enumerate(data_duplicate):
+        data_duplicate[i] = (entity_key, features, timestamp - timedelta(days=1), None)
     dynamodb_resource = boto3.resource("dynamodb", region_name=REGION)
     table_instance = dynamodb_resource.Table(f"{PROJECT}.{dynamodb_tbl}")
     dynamodb_store = DynamoDBOnlineStore()
+    progress = []
     # Insert duplicate data
     dynamodb_store._write_batch_non_duplicates(
-        table_instance, data + data_duplicate, progress=None
+        table_instance,
+        data + data_duplicate,
+        progress=progress.append,
+        online_config=DynamoDBOnlineStoreConfig(
+            region=REGION, write_concurrency=write_concurrency
+        ),
     )
+    assert sum(progress) == len(data) * 2
     # Request more items than inserted
     response = table_instance.scan(Limit=20)
     returned_items = response.get("Items", None)
     assert returned_items is not None
     assert len(returned_items) == len(data)
+    assert all(
+        ValueProto.FromString(item["values"]["age"].value).int64_val == 4
+        for item in returned_items
+    )
+
+
+@mock_dynamodb2
+def test_write_batch_unprocessed_items(repo_config, monkeypatch):
+    """Test DynamoDBOnlineStore writes again the items which DynamoDB did not process."""
+    dynamodb_tbl = f"{TABLE_NAME}_batch_unprocessed_items"
+    _create_test_table(PROJECT, dynamodb_tbl, REGION)
+    data = _create_n_customer_test_samples(n=60)
+    dynamodb_resource = boto3.resource("dynamodb", region_name=REGION)
+    table_instance = dynamodb_resource.Table(f"{PROJECT}.{dynamodb_tbl}")
+    dynamodb_client = table_instance.meta.client
+    batch_write_item = dynamodb_client.batch_write_item
+    calls = []
+
+    def throttled_batch_write_item(RequestItems):
+        """Only processes the first item of each call."""
+        requests = RequestItems[table_instance.name]
+        calls.append(len(requests))
+        batch_write_item(RequestItems={table_instance.name: requests[:1]})
+        return {"UnprocessedItems": {table_instance.name: requests[1:]}}
+
+    monkeypatch.setattr(dynamodb_client, "batch_write_item", throttled_batch_write_item)
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    dynamodb_store = DynamoDBOnlineStore()
+    progress = []
+    dynamodb_store._write_batch_non_duplicates(
+        table_instance,
+        data,
+        progress=progress.append,
+        online_config=DynamoDBOnlineStoreConfig(region=REGION, max_write_retries=25),
+    )
+    # Items are written in batches of at most 25 items.
+    assert calls[:3] == [25, 24, 23]
+    assert progress == [1] * len(data)
+    assert table_instance.scan()["Count"] == len(data)
+
+    with pytest.raises(DynamoDBUnprocessedItems):
+        dynamodb_store._write_batch_non_duplicates(
+            table_instance,
+            data,
+            progress=None,
+            online_config=DynamoDBOnlineStoreConfig(region=REGION, max_write_retries=3),
+        )
+
+
+def test_online_store_config_max_write_retries():
+    """Test DynamoDBOnlineStoreConfig rejects negative numbers of write retries."""
+    assert DynamoDBOnlineStoreConfig(region=REGION, max_write_retries=0)
+    with pytest.raises(ValidationError):
+        DynamoDBOnlineStoreConfig(region=REGION, max_write_retries=-1)
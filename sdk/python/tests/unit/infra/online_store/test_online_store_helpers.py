@@ -0,0 +1,57 @@
+import os
+from datetime import datetime
+
+from feast.infra.online_stores.helpers import (
+    NOT_FOUND,
+    _redis_feature_view_key,
+    _redis_feature_view_key_prefix,
+    assemble_online_read_result,
+    created_in_another_process,
+)
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from tests.utils.online_store_utils import _create_driver_entity_key
+
+
+def _row(i: int):
+    return datetime(2021, 1, i), {"trips": ValueProto(int64_val=i)}
+
+
+def test_assemble_online_read_result():
+    keys = [b"3", b"1", b"4", b"1", b"5"]
+    # Rows are read in any order, and missing keys are not read.
+    rows = [(b"1", _row(1)), (b"5", _row(5)), (b"3", _row(3))]
+
+    assert assemble_online_read_result(keys, rows) == [
+        _row(3),
+        _row(1),
+        NOT_FOUND,
+        _row(1),
+        _row(5),
+    ]
+    assert assemble_online_read_result(keys, []) == [NOT_FOUND] * len(keys)
+    assert assemble_online_read_result([], rows) == []
+
+
+def test_redis_feature_view_keys():
+    prefix = _redis_feature_view_key_prefix("test", "driver_stats")
+
+    # Prefixes are 64 bits hashes of the project and the feature view.
+    assert len(prefix) == 8
+    assert prefix == _redis_feature_view_key_prefix("test", "driver_stats")
+    assert prefix != _redis_feature_view_key_prefix("test", "customer_stats")
+    assert prefix != _redis_feature_view_key_prefix("other", "driver_stats")
+
+    # Keys are followed by a 96 bits hash of the entity key.
+    keys = [
+        _redis_feature_view_key(prefix, _create_driver_entity_key(driver_id))
+        for driver_id in (1, 2)
+    ]
+    assert all(len(key) == 20 and key.startswith(prefix) for key in keys)
+    assert keys[0] != keys[1]
+    assert keys[0] == _redis_feature_view_key(prefix, _create_driver_entity_key(1))
+
+
+def test_created_in_another_process():
+    assert created_in_another_process(None)
+    assert created_in_another_process(os.getpid() + 1)
+    assert not created_in_another_process(os.getpid())
@@ -0,0 +1,106 @@
+from unittest.mock import MagicMock, call, patch
+
+import pytest
+
+from feast import Feature, FeatureView, RepoConfig, ValueType
+from feast.infra.offline_stores.file_source import FileSource
+from feast.infra.online_stores.redis import (
+    RedisKeyLayout,
+    RedisOnlineStore,
+    RedisOnlineStoreConfig,
+)
+from tests.utils.online_store_utils import DRIVER_STATS_FEATURE_VIEW
+
+DRIVER_TRIPS_FEATURE_VIEW = FeatureView(
+    name="driver_trips",
+    entities=["driver_id"],
+    features=[Feature("trips", ValueType.INT64)],
+    batch_source=FileSource(path="unused.parquet", timestamp_field="ts"),
+)
+
+
+def _config(key_layout: RedisKeyLayout) -> RepoConfig:
+    return RepoConfig(
+        project="test",
+        provider="local",
+        registry="registry.db",
+        online_store=RedisOnlineStoreConfig(key_layout=key_layout),
+    )
+
+
+def _store(client: MagicMock) -> RedisOnlineStore:
+    store = RedisOnlineStore()
+    store._get_client = MagicMock(return_value=client)  # type: ignore
+    return store
+
+
+def test_delete_feature_view_values_escapes_the_key_prefix():
+    client = MagicMock()
+    client.scan_iter.return_value = [b"key1", b"key2"]
+    pipeline = client.pipeline.return_value
+    store = _store(client)
+
+    with patch(
+        "feast.infra.online_stores.redis._redis_feature_view_key_prefix",
+        return_value=b"a*b?[c]\\d",
+    ):
+        store.delete_feature_view_values(
+            _config(RedisKeyLayout.feature_view), DRIVER_STATS_FEATURE_VIEW
+        )
+
+    # Only the keys starting with the literal prefix are matched by the pattern.
+    client.scan_iter.assert_called_once_with(b"a\\*b\\?\\[c\\]\\\\d*")
+    assert pipeline.delete.call_args_list == [call(b"key1"), call(b"key2")]
+    pipeline.execute.assert_called_once_with()
+
+
+@pytest.mark.parametrize("key_layout", list(RedisKeyLayout))
+def test_update(key_layout):
+    config = _config(key_layout)
+    store = _store(MagicMock())
+    store.delete_feature_view_values = MagicMock()  # type: ignore
+    store.delete_entity_values = MagicMock()  # type: ignore
+
+    store.update(
+        config,
+        tables_to_delete=[DRIVER_STATS_FEATURE_VIEW],
+        tables_to_keep=[DRIVER_TRIPS_FEATURE_VIEW],
+        entities_to_delete=[],
+        entities_to_keep=[],
+        partial=False,
+    )
+
+    if key_layout == RedisKeyLayout.feature_view:
+        # The keys of the deleted feature view are removed, regardless of its entities.
+        store.delete_feature_view_values.assert_called_once_with(
+            config, DRIVER_STATS_FEATURE_VIEW
+        )
+        store.delete_entity_values.assert_not_called()
+    else:
+        # The entities are still used by the kept feature view.
+        store.delete_feature_view_values.assert_not_called()
+        store.delete_entity_values.assert_not_called()
+
+
+@pytest.mark.parametrize("key_layout", list(RedisKeyLayout))
+def test_teardown(key_layout):
+    config = _config(key_layout)
+    store = _store(MagicMock())
+    store.delete_feature_view_values = MagicMock()  # type: ignore
+    store.delete_entity_values = MagicMock()  # type: ignore
+
+    store.teardown(
+        config,
+        tables=[DRIVER_STATS_FEATURE_VIEW, DRIVER_TRIPS_FEATURE_VIEW],
+        entities=[],
+    )
+
+    if key_layout == RedisKeyLayout.feature_view:
+        assert store.delete_feature_view_values.call_args_list == [
+            call(config, DRIVER_STATS_FEATURE_VIEW),
+            call(config, DRIVER_TRIPS_FEATURE_VIEW),
+        ]
+        store.delete_entity_values.assert_not_called()
+    else:
+        store.delete_feature_view_values.assert_not_called()
+        store.delete_entity_values.assert_called_once_with(config, ["driver_id"])
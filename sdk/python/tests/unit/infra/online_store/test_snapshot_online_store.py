@@ -0,0 +1,90 @@
+from datetime import datetime
+
+import pytest
+
+from feast import RepoConfig
+from feast.infra.online_stores import snapshot
+from feast.infra.online_stores.snapshot import SnapshotOnlineStore
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from tests.utils.online_store_utils import (
+    DRIVER_STATS_FEATURE_VIEW,
+    _create_driver_stats_row,
+    _create_local_repo_config,
+    _read_driver_stats,
+)
+
+
+def _config(tmp_path, value_encoding: str = "proto") -> RepoConfig:
+    return _create_local_repo_config(
+        tmp_path,
+        {
+            "type": "snapshot",
+            "path": str(tmp_path / "snapshots"),
+            "value_encoding": value_encoding,
+        },
+    )
+
+
+@pytest.mark.parametrize("value_encoding", ["proto", "typed"])
+def test_online_write_and_read(tmp_path, value_encoding):
+    config = _config(tmp_path, value_encoding)
+    store = SnapshotOnlineStore()
+    store.update(config, [], [DRIVER_STATS_FEATURE_VIEW], [], [], partial=False)
+    assert _read_driver_stats(store, config) == [(None, None)] * 3
+
+    progress = []
+    store.online_write_batches(
+        config,
+        DRIVER_STATS_FEATURE_VIEW,
+        [[_create_driver_stats_row(1, 10)], [_create_driver_stats_row(2, 20)]],
+        progress.append,
+    )
+    assert progress == [1, 1]
+
+    assert _read_driver_stats(store, config) == [
+        (
+            datetime(2021, 1, 2),
+            {"rating": ValueProto(double_val=1), "trips": ValueProto(int64_val=20)},
+        ),
+        (None, None),
+        (
+            datetime(2021, 1, 1),
+            {"rating": ValueProto(double_val=0.5), "trips": ValueProto(int64_val=10)},
+        ),
+    ]
+    assert _read_driver_stats(store, config, ["trips"]) == [
+        (datetime(2021, 1, 2), {"trips": ValueProto(int64_val=20)}),
+        (None, None),
+        (datetime(2021, 1, 1), {"trips": ValueProto(int64_val=10)}),
+    ]
+
+    # Writes are merged into the snapshot, which is picked up by the other stores.
+    SnapshotOnlineStore().online_write_batch(
+        config,
+        DRIVER_STATS_FEATURE_VIEW,
+        [_create_driver_stats_row(2, 21), _create_driver_stats_row(3, 30)],
+        progress=None,
+    )
+    assert [
+        values["trips"].int64_val for _, values in _read_driver_stats(store, config)
+    ] == [21, 30, 10,]
+
+    store.teardown(config, [DRIVER_STATS_FEATURE_VIEW], [])
+    assert _read_driver_stats(store, config) == [(None, None)] * 3
+
+
+def test_hash_collisions(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "_hash", lambda entity_key_bin: 0)
+    config = _config(tmp_path)
+    store = SnapshotOnlineStore()
+    store.online_write_batch(
+        config,
+        DRIVER_STATS_FEATURE_VIEW,
+        [_create_driver_stats_row(1, 10), _create_driver_stats_row(2, 20)],
+        progress=None,
+    )
+
+    assert [
+        values["trips"].int64_val if values else None
+        for _, values in _read_driver_stats(store, config)
+    ] == [20, None, 10]
@@ -0,0 +1,120 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+from feast import RepoConfig
+from feast.infra.online_stores.sqlite import SqliteOnlineStore, SqliteTable
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from tests.utils.online_store_utils import (
+    DRIVER_STATS_FEATURE_VIEW,
+    _create_driver_stats_row,
+    _create_local_repo_config,
+    _read_driver_stats,
+)
+
+
+def _config(tmp_path, table_layout: str, value_encoding: str = "proto") -> RepoConfig:
+    return _create_local_repo_config(
+        tmp_path,
+        {
+            "path": str(tmp_path / "online_store.db"),
+            "table_layout": table_layout,
+            "value_encoding": value_encoding,
+        },
+    )
+
+
+def _write(store: SqliteOnlineStore, config: RepoConfig):
+    store.online_write_batch(
+        config,
+        DRIVER_STATS_FEATURE_VIEW,
+        [
+            _create_driver_stats_row(driver_id, trips=driver_id * 10)
+            for driver_id in (1, 2)
+        ],
+        progress=None,
+    )
+
+
+EXPECTED_ROWS = [
+    (
+        datetime(2021, 1, 2),
+        {"rating": ValueProto(double_val=1), "trips": ValueProto(int64_val=20)},
+    ),
+    (None, None),
+    (
+        datetime(2021, 1, 1),
+        {"rating": ValueProto(double_val=0.5), "trips": ValueProto(int64_val=10)},
+    ),
+]
+
+
+@pytest.mark.parametrize("value_encoding", ["proto", "typed"])
+@pytest.mark.parametrize("table_layout", ["row_per_feature", "row_per_entity"])
+def test_online_write_and_read(tmp_path, table_layout, value_encoding):
+    config = _config(tmp_path, table_layout, value_encoding)
+    store = SqliteOnlineStore()
+    store.update(config, [], [DRIVER_STATS_FEATURE_VIEW], [], [], partial=False)
+    _write(store, config)
+
+    assert _read_driver_stats(store, config) == EXPECTED_ROWS
+    assert _read_driver_stats(store, config, ["trips"]) == [
+        (ts, {"trips": values["trips"]} if values else None)
+        for ts, values in EXPECTED_ROWS
+    ]
+
+
+@pytest.mark.parametrize(
+    "table_layouts",
+    [("row_per_feature", "row_per_entity"), ("row_per_entity", "row_per_feature")],
+)
+def test_table_layout_migration(tmp_path, table_layouts):
+    old_layout, new_layout = table_layouts
+    store = SqliteOnlineStore()
+    old_config = _config(tmp_path, old_layout)
+    store.update(old_config, [], [DRIVER_STATS_FEATURE_VIEW], [], [], partial=False)
+    _write(store, old_config)
+
+    new_config = _config(tmp_path, new_layout)
+    store.update(new_config, [], [DRIVER_STATS_FEATURE_VIEW], [], [], partial=False)
+
+    assert _read_driver_stats(store, new_config) == EXPECTED_ROWS
+    conn = sqlite3.connect(tmp_path / "online_store.db")
+    table_names = [row[0] for row in conn.execute("SELECT name FROM sqlite_master")]
+    assert "test_driver_stats_migration" not in table_names
+    # The index on the entity keys is redundant with the primary key.
+    assert "test_driver_stats_ek" not in table_names
+
+
+def test_sqlite_table_proto_round_trip(tmp_path):
+    path = str(tmp_path / "online_store.db")
+
+    table = SqliteTable(path=path, name="test_driver_stats")
+    # The default layout is left empty, like in the tables of older versions.
+    assert table.to_proto().table_layout == ""
+    assert SqliteTable.from_proto(table.to_proto()).table_layout == "row_per_feature"
+
+    table = SqliteTable(
+        path=path, name="test_driver_stats", table_layout="row_per_entity"
+    )
+    assert (
+        SqliteTable.from_infra_object_proto(table.to_infra_object_proto()).table_layout
+        == "row_per_entity"
+    )
+
+
+@pytest.mark.parametrize("table_layout", ["row_per_feature", "row_per_entity"])
+def test_online_read_requested_features(tmp_path, table_layout):
+    config = _config(tmp_path, table_layout)
+    store = SqliteOnlineStore()
+    store.update(config, [], [DRIVER_STATS_FEATURE_VIEW], [], [], partial=False)
+    _write(store, config)
+
+    # Features which don't exist are left out of the results, and entities without any of
+    # the requested features aren't found.
+    assert _read_driver_stats(store, config, ["trips", "missing"]) == [
+        (ts, {"trips": values["trips"]} if values else None)
+        for ts, values in EXPECTED_ROWS
+    ]
+    assert _read_driver_stats(store, config, ["missing"]) == [(None, None)] * 3
@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+
+from feast import Entity, Feature, FeatureStore, FeatureView, FileSource, ValueType
+from feast.infra.offline_stores.offline_store import ChunkedRetrievalJob
+from feast.repo_config import RepoConfig
+
+
+@pytest.fixture
+def store(tmp_path) -> FeatureStore:
+    source_path = tmp_path / "driver_stats.parquet"
+    pd.DataFrame(
+        {
+            "driver_id": [1, 2, 1, 2],
+            "value": [10, 20, 11, 21],
+            "event_timestamp": [datetime(2021, 1, day) for day in (1, 1, 3, 5)],
+        }
+    ).to_parquet(source_path)
+
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test",
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            online_store={"path": str(tmp_path / "online_store.db")},
+            repo_path=tmp_path,
+        )
+    )
+    store.apply(
+        [
+            Entity(name="driver_id", value_type=ValueType.INT64),
+            FeatureView(
+                name="driver_stats",
+                entities=["driver_id"],
+                features=[Feature("value", ValueType.INT64)],
+                ttl=timedelta(days=1),
+                batch_source=FileSource(
+                    path=str(source_path), timestamp_field="event_timestamp"
+                ),
+            ),
+        ]
+    )
+    return store
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_chunked_retrieval(store, max_workers):
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [2, 1, 2, 1, 2],
+            "event_timestamp": [datetime(2021, 1, day) for day in (6, 2, 3, 4, 1)],
+        }
+    )
+
+    job = store.get_historical_features(
+        entity_df,
+        ["driver_stats:value"],
+        entity_df_chunk_size=2,
+        max_workers=max_workers,
+    )
+
+    assert isinstance(job, ChunkedRetrievalJob)
+    expected = (
+        store.get_historical_features(entity_df, ["driver_stats:value"])
+        .to_df()
+        .sort_values("event_timestamp")
+        .reset_index(drop=True)
+    )
+    # Only the chunk with a missing value has a float column, which pandas combines.
+    pd.testing.assert_frame_equal(
+        job.to_df().sort_values("event_timestamp").reset_index(drop=True),
+        expected,
+        check_dtype=False,
+    )
+    assert job.to_arrow().num_rows == len(expected)
+    # Every chunk covers a separate time range.
+    batches = list(job.to_arrow_batches())
+    assert len(batches) == 3
+    assert sum(batch.num_rows for batch in batches) == len(expected)
+    assert job.metadata.min_event_timestamp == datetime(2021, 1, 1)
+    assert job.metadata.max_event_timestamp == datetime(2021, 1, 6)
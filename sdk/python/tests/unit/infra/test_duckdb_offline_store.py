@@ -0,0 +1,109 @@
+from datetime import timedelta
+
+import pandas as pd
+import pytest
+from pytz import utc
+
+from feast import Entity, Feature, FeatureView, FileSource, ValueType
+from feast.infra.offline_stores.contrib.duckdb_offline_store.duckdb import (
+    DuckDBOfflineStore,
+    DuckDBOfflineStoreConfig,
+)
+from feast.infra.offline_stores.file import FileOfflineStore, FileOfflineStoreConfig
+from feast.registry import Registry
+from feast.repo_config import RegistryConfig, RepoConfig
+
+
+def ts(day: int, hour: int = 0) -> pd.Timestamp:
+    return pd.Timestamp(2021, 1, day, hour).tz_localize(utc)
+
+
+def _write_source(tmp_path) -> FileSource:
+    path = tmp_path / "driver_stats.parquet"
+    pd.DataFrame(
+        {
+            "driver_id": [1, 1, 1, 2, 2, 2],
+            "value": [10, 11, 12, 21, 21, 22],
+            "event_timestamp": [ts(1), ts(2, 1), ts(2, 1), ts(2, 2), ts(2, 2), ts(3)],
+            "created": [ts(1), ts(2, 1), ts(2, 3), ts(2, 2), ts(2, 2), ts(3)],
+        }
+    ).to_parquet(path)
+    return FileSource(
+        path=str(path),
+        timestamp_field="event_timestamp",
+        created_timestamp_column="created",
+    )
+
+
+@pytest.mark.parametrize("full_feature_names", [True, False])
+def test_point_in_time_join_matches_file_offline_store(tmp_path, full_feature_names):
+    project = "test"
+    entity = Entity(name="driver", join_key="driver_id", value_type=ValueType.INT64)
+    feature_view = FeatureView(
+        name="driver_stats",
+        entities=["driver"],
+        ttl=timedelta(days=1),
+        features=[Feature("value", ValueType.INT64)],
+        batch_source=_write_source(tmp_path),
+    )
+    registry = Registry(RegistryConfig(path=str(tmp_path / "registry.db")), None)
+    registry.apply_entity(entity, project)
+    registry.apply_feature_view(feature_view, project)
+
+    entity_df = pd.DataFrame(
+        {
+            "driver_id": [1, 2, 2, 1, 3, 1],
+            "event_timestamp": [
+                # Both rows of driver 1 share the event timestamp, the one created last wins.
+                ts(2, 4),
+                # Both rows of driver 2 are exact duplicates, of which a single one is joined.
+                ts(2, 4),
+                ts(3, 12),
+                # The last row of driver 1 is older than the ttl.
+                ts(4),
+                # Driver 3 has no features.
+                ts(2),
+                # There are no features yet.
+                ts(1) - timedelta(hours=1),
+            ],
+        }
+    )
+
+    def get_historical_features(offline_store, offline_store_config):
+        job = offline_store.get_historical_features(
+            config=RepoConfig(
+                project=project,
+                provider="local",
+                registry=str(tmp_path / "registry.db"),
+                offline_store=offline_store_config,
+            ),
+            feature_views=[feature_view],
+            feature_refs=["driver_stats:value"],
+            entity_df=entity_df,
+            registry=registry,
+            project=project,
+            full_feature_names=full_feature_names,
+        )
+        return (
+            job.to_df()
+            .sort_values(["driver_id", "event_timestamp"])
+            .reset_index(drop=True)
+        )
+
+    file_df = get_historical_features(FileOfflineStore, FileOfflineStoreConfig())
+    actual_df = get_historical_features(DuckDBOfflineStore, DuckDBOfflineStoreConfig())
+
+    # The file offline store drops the entity rows without features within the ttl,
+    # instead of returning them with missing values.
+    expected_df = entity_df.merge(
+        file_df, on=["driver_id", "event_timestamp"], how="left"
+    )
+    expected_df = expected_df.sort_values(["driver_id", "event_timestamp"]).reset_index(
+        drop=True
+    )
+
+    value_column = "driver_stats__value" if full_feature_names else "value"
+    assert expected_df[value_column].fillna(-1).tolist() == [-1, 12, -1, 21, 22, -1]
+    pd.testing.assert_frame_equal(
+        actual_df[expected_df.columns], expected_df, check_dtype=False
+    )
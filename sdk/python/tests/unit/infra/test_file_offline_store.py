@@ -0,0 +1,92 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+import pytest
+from pytz import utc
+
+from feast import FileSource
+from feast.infra.offline_stores.file import (
+    FileOfflineStore,
+    FileOfflineStoreConfig,
+    _get_time_range_filters,
+)
+from feast.repo_config import RepoConfig
+
+START = datetime(2021, 1, 2, tzinfo=utc)
+END = datetime(2021, 1, 4, tzinfo=utc)
+
+
+def _write_source(tmp_path, tz_aware: bool) -> FileSource:
+    def ts(day: int, hour: int = 0):
+        timestamp = pd.Timestamp(2021, 1, day, hour)
+        return timestamp.tz_localize(utc) if tz_aware else timestamp
+
+    source_dir = tmp_path / "source"
+    source_dir.mkdir()
+    # Each file covers a single day, so the first one is outside of the time range.
+    pd.DataFrame(
+        {
+            "driver_id": [1, 2],
+            "value": [10, 20],
+            "event_timestamp": [ts(1), ts(1)],
+            "created": [ts(1), ts(1)],
+        }
+    ).to_parquet(source_dir / "1.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [1, 1, 2],
+            "value": [11, 12, 21],
+            "event_timestamp": [ts(2, 1), ts(2, 1), ts(2, 2)],
+            "created": [ts(2, 1), ts(2, 3), ts(2, 2)],
+        }
+    ).to_parquet(source_dir / "2.parquet")
+    pd.DataFrame(
+        {
+            "driver_id": [2, 3],
+            "value": [22, 30],
+            "event_timestamp": [ts(3), ts(4)],
+            "created": [ts(3), ts(4)],
+        }
+    ).to_parquet(source_dir / "3.parquet")
+    return FileSource(path=str(source_dir), timestamp_field="event_timestamp")
+
+
+@pytest.mark.parametrize("tz_aware", [True, False])
+def test_pull_latest_from_table_or_query(tmp_path, tz_aware):
+    job = FileOfflineStore.pull_latest_from_table_or_query(
+        config=RepoConfig(
+            project="test",
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            offline_store=FileOfflineStoreConfig(),
+        ),
+        data_source=_write_source(tmp_path, tz_aware),
+        join_key_columns=["driver_id"],
+        feature_name_columns=["value"],
+        event_timestamp_column="event_timestamp",
+        created_timestamp_column="created",
+        start_date=START,
+        end_date=END,
+    )
+
+    df = job.to_df().sort_values("driver_id").reset_index(drop=True)
+
+    # Driver 1 has two rows with the same event timestamp, of which the one created last
+    # is kept, and driver 3 only has a row at the (exclusive) end of the time range.
+    assert df["driver_id"].tolist() == [1, 2]
+    assert df["value"].tolist() == [12, 22]
+    assert df["event_timestamp"].tolist() == [
+        START + timedelta(hours=1),
+        START + timedelta(days=1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "dtype,expected_tz", [("datetime64[ns]", None), ("datetime64[ns, UTC]", utc)]
+)
+def test_time_range_filters_match_timestamp_type(dtype, expected_tz):
+    filters = _get_time_range_filters(pd.Series(dtype=dtype).dtype, "ts", START, END)
+
+    assert [(column, op) for column, op, _ in filters] == [("ts", ">="), ("ts", "<")]
+    assert all(value.tzinfo == expected_tz for _, _, value in filters)
+    assert filters[0][2] == pd.Timestamp("2021-01-02", tz=expected_tz)
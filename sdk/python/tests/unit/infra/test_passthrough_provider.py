@@ -0,0 +1,97 @@
+from datetime import datetime
+from typing import List
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+
+from feast import Entity, RepoConfig, ValueType
+from feast.infra.passthrough_provider import PassthroughProvider
+from tests.utils.online_store_utils import (
+    DRIVER_STATS_FEATURE_VIEW,
+    _create_local_repo_config,
+    _read_driver_stats,
+)
+
+ENTITY = Entity(name="driver_id", value_type=ValueType.INT64)
+
+
+def _batch(driver_ids) -> pa.RecordBatch:
+    return pa.RecordBatch.from_pydict(
+        {
+            "driver_id": pa.array(driver_ids, pa.int64()),
+            "rating": pa.array([i / 2 for i in driver_ids], pa.float64()),
+            "trips": pa.array([i * 10 for i in driver_ids], pa.int64()),
+            "ts": pa.array(
+                [datetime(2021, 1, 1)] * len(driver_ids), pa.timestamp("us", "UTC")
+            ),
+        }
+    )
+
+
+def _config(tmp_path) -> RepoConfig:
+    return _create_local_repo_config(
+        tmp_path, {"path": str(tmp_path / "online_store.db")}
+    )
+
+
+def _mock_offline_store(provider: PassthroughProvider):
+    offline_job = MagicMock()
+    offline_job.to_arrow_batches.return_value = iter([_batch([1, 2]), _batch([3])])
+    offline_job.to_arrow.side_effect = AssertionError("The whole table was retrieved")
+    provider.offline_store = MagicMock()
+    provider.offline_store.pull_latest_from_table_or_query.return_value = offline_job
+
+
+def _materialize(provider: PassthroughProvider):
+    registry = MagicMock()
+    registry.get_entity.return_value = ENTITY
+    progress_bar = MagicMock()
+    provider.materialize_single_feature_view(
+        config=provider.repo_config,
+        feature_view=DRIVER_STATS_FEATURE_VIEW,
+        start_date=datetime(2021, 1, 1),
+        end_date=datetime(2021, 1, 2),
+        registry=registry,
+        project="test",
+        tqdm_builder=lambda length: progress_bar,
+    )
+
+
+def test_materialization_writes_batch_by_batch(tmp_path):
+    provider = PassthroughProvider(_config(tmp_path))
+    _mock_offline_store(provider)
+    provider.update_infra(
+        "test", [], [DRIVER_STATS_FEATURE_VIEW], [], [ENTITY], partial=False
+    )
+    online_write_batch = MagicMock(wraps=provider.online_write_batch)
+    provider.online_write_batch = online_write_batch  # type: ignore
+
+    _materialize(provider)
+
+    assert [len(c.args[2]) for c in online_write_batch.call_args_list] == [2, 1]
+    rows = _read_driver_stats(provider.online_store, provider.repo_config)
+    assert [values["trips"].int64_val for _, values in rows] == [20, 30, 10]
+
+
+def test_materialization_uses_online_write_batch_of_providers(tmp_path):
+    class CustomProvider(PassthroughProvider):
+        def online_write_batch(self, config, table, data, progress):
+            written_batches.append(data)
+
+    written_batches: List[list] = []
+    provider = CustomProvider(_config(tmp_path))
+    _mock_offline_store(provider)
+
+    _materialize(provider)
+
+    assert [len(rows) for rows in written_batches] == [2, 1]
+
+
+def test_warm_up_online_store_failures_are_logged(tmp_path, caplog):
+    provider = PassthroughProvider(_config(tmp_path))
+    provider.online_store = MagicMock()
+    provider.online_store.warm_up.side_effect = ConnectionError("Connection refused")
+
+    provider.warm_up_online_store(provider.repo_config, [DRIVER_STATS_FEATURE_VIEW])
+
+    assert "Failed to warm up the online store." in caplog.text
@@ -0,0 +1,95 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from feast import Entity, Feature, FeatureStore, FeatureView, FileSource, ValueType
+from feast.infra.offline_stores.file import FileRetrievalJob
+from feast.repo_config import RepoConfig, RetrievalCacheConfig
+
+ENTITY_DF = pd.DataFrame(
+    {"driver_id": [1, 2], "event_timestamp": [datetime(2021, 1, 2)] * 2}
+)
+
+
+def _write_source(path, value: int):
+    pd.DataFrame(
+        {
+            "driver_id": [1, 2],
+            "value": [value, value + 1],
+            "event_timestamp": [datetime(2021, 1, 1)] * 2,
+        }
+    ).to_parquet(path)
+
+
+def _feature_store(tmp_path, source_path) -> FeatureStore:
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test",
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            online_store={"path": str(tmp_path / "online_store.db")},
+            repo_path=tmp_path,
+            retrieval_cache=RetrievalCacheConfig(path="cache"),
+        )
+    )
+    store.apply(
+        [
+            Entity(name="driver_id", value_type=ValueType.INT64),
+            FeatureView(
+                name="driver_stats",
+                entities=["driver_id"],
+                features=[Feature("value", ValueType.INT64)],
+                ttl=timedelta(days=1),
+                batch_source=FileSource(
+                    path=str(source_path), timestamp_field="event_timestamp"
+                ),
+            ),
+        ]
+    )
+    return store
+
+
+def test_retrieval_cache(tmp_path, monkeypatch):
+    executions = []
+    to_arrow_internal = FileRetrievalJob._to_arrow_internal
+
+    def counting_to_arrow_internal(self):
+        executions.append(self)
+        return to_arrow_internal(self)
+
+    monkeypatch.setattr(
+        FileRetrievalJob, "_to_arrow_internal", counting_to_arrow_internal
+    )
+
+    source_path = tmp_path / "driver_stats.parquet"
+    _write_source(source_path, value=10)
+    store = _feature_store(tmp_path, source_path)
+
+    def get_values():
+        df = store.get_historical_features(ENTITY_DF, ["driver_stats:value"]).to_df()
+        return df.sort_values("driver_id")["value"].tolist()
+
+    assert get_values() == [10, 11]
+    assert get_values() == [10, 11]
+    assert len(executions) == 1
+    assert len(list((tmp_path / "cache").glob("*.parquet"))) == 1
+
+    # Changes to the source data invalidate the cached results.
+    _write_source(source_path, value=20)
+    assert get_values() == [20, 21]
+    assert len(executions) == 2
+
+    # So do different entity dataframes.
+    store.get_historical_features(ENTITY_DF[:1], ["driver_stats:value"]).to_arrow()
+    assert len(executions) == 3
+
+
+def test_retrieval_cache_eviction(tmp_path):
+    source_path = tmp_path / "driver_stats.parquet"
+    _write_source(source_path, value=10)
+    store = _feature_store(tmp_path, source_path)
+    store.config.retrieval_cache.max_size_mb = 0
+
+    store.get_historical_features(ENTITY_DF, ["driver_stats:value"]).to_df()
+
+    assert list((tmp_path / "cache").glob("*.parquet")) == []
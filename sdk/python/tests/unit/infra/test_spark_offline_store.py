@@ -0,0 +1,134 @@
+import shutil
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow
+import pytest
+from pyspark.sql import DataFrame, SparkSession
+
+from feast.infra.offline_stores.contrib.spark_offline_store.spark import (
+    SparkRetrievalJob,
+    _collect_as_arrow,
+)
+from feast.infra.offline_stores.contrib.spark_offline_store.spark_source import (
+    SavedDatasetSparkStorage,
+    SparkSource,
+)
+
+
+@pytest.mark.parametrize(
+    "storage, table, path, file_format",
+    [
+        (
+            SavedDatasetSparkStorage(path="data/dataset"),
+            None,
+            "data/dataset",
+            "parquet",
+        ),
+        (
+            SavedDatasetSparkStorage(path="data/dataset", file_format="csv"),
+            None,
+            "data/dataset",
+            "csv",
+        ),
+        (SavedDatasetSparkStorage(table_ref="dataset"), "dataset", None, None),
+    ],
+)
+def test_saved_dataset_storage_round_trip(storage, table, path, file_format):
+    storage = SavedDatasetSparkStorage.from_proto(storage.to_proto())
+
+    data_source = storage.to_data_source()
+
+    assert isinstance(data_source, SparkSource)
+    assert data_source.table == table
+    assert data_source.path == path
+    assert data_source.file_format == file_format
+
+
+@pytest.mark.parametrize("cache_results", [True, False])
+def test_retrieval_job_cache_results(cache_results):
+    spark_session = MagicMock()
+    job = SparkRetrievalJob(
+        spark_session=spark_session,
+        query="CREATE TEMP VIEW v AS SELECT 1---EOS---SELECT * FROM v",
+        full_feature_names=False,
+        cache_results=cache_results,
+    )
+    last = spark_session.sql.return_value
+
+    spark_df = job.to_spark_df()
+
+    # The statements are only run once per job.
+    assert job.to_spark_df() is spark_df
+    assert spark_session.sql.call_count == 2
+    assert last.persist.called == cache_results
+    assert spark_df is (last.persist.return_value if cache_results else last)
+
+
+def test_collect_as_arrow_without_private_api():
+    # Versions of pyspark without the private method are converted through pandas.
+    spark_df = MagicMock(spec=["toPandas"])
+    spark_df.toPandas.return_value = pd.DataFrame({"driver_id": [1, 2]})
+
+    batches = _collect_as_arrow(spark_df)
+
+    assert pyarrow.Table.from_batches(batches).to_pydict() == {"driver_id": [1, 2]}
+
+
+@pytest.fixture(scope="module")
+def spark_session():
+    if shutil.which("java") is None:
+        pytest.skip("Local-mode Spark requires Java")
+    spark_session = (
+        SparkSession.builder.master("local[2]")
+        .config("spark.ui.enabled", "false")
+        .config("spark.sql.session.timeZone", "UTC")
+        # Small batches, so that results are split in several batches.
+        .config("spark.sql.execution.arrow.maxRecordsPerBatch", "3")
+        .getOrCreate()
+    )
+    yield spark_session
+    spark_session.stop()
+
+
+def _retrieval_job(spark_session, num_rows: int) -> SparkRetrievalJob:
+    return SparkRetrievalJob(
+        spark_session=spark_session,
+        query=(
+            f"CREATE OR REPLACE TEMP VIEW numbers AS SELECT id FROM range({num_rows})"
+            "---EOS---"
+            "SELECT id AS driver_id, CAST(id AS DOUBLE) / 2 AS rating FROM numbers"
+        ),
+        full_feature_names=False,
+    )
+
+
+@pytest.mark.parametrize("num_rows", [0, 10])
+@pytest.mark.parametrize("private_api", [True, False], ids=["arrow", "pandas"])
+def test_retrieval_job_to_arrow(spark_session, monkeypatch, num_rows, private_api):
+    if not private_api:
+        monkeypatch.delattr(DataFrame, "_collect_as_arrow")
+
+    table = _retrieval_job(spark_session, num_rows).to_arrow()
+
+    assert table.num_rows == num_rows
+    assert table.column_names == ["driver_id", "rating"]
+    assert table["driver_id"].to_pylist() == list(range(num_rows))
+    assert table["rating"].to_pylist() == [i / 2 for i in range(num_rows)]
+
+
+@pytest.mark.parametrize("num_rows", [0, 10])
+@pytest.mark.parametrize("map_in_arrow", [True, False], ids=["map_in_arrow", "collect"])
+def test_retrieval_job_to_arrow_batches(
+    spark_session, monkeypatch, num_rows, map_in_arrow
+):
+    if not map_in_arrow:
+        monkeypatch.delattr(DataFrame, "mapInArrow")
+
+    batches = list(_retrieval_job(spark_session, num_rows).to_arrow_batches())
+
+    assert sum(batch.num_rows for batch in batches) == num_rows
+    assert all(batch.num_rows <= 3 for batch in batches)
+    if batches:
+        table = pyarrow.Table.from_batches(batches)
+        assert table["driver_id"].to_pylist() == list(range(num_rows))
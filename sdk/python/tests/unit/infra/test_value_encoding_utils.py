@@ -0,0 +1,123 @@
+import struct
+
+import pytest
+
+from feast.infra.value_encoding_utils import (
+    PROTO_ENCODING,
+    TYPED_ENCODING,
+    deserialize_value,
+    deserialize_values,
+    serialize_value,
+)
+from feast.protos.feast.types.Value_pb2 import (
+    BoolList,
+    BytesList,
+    DoubleList,
+    FloatList,
+    Int32List,
+    Int64List,
+    StringList,
+)
+from feast.protos.feast.types.Value_pb2 import Value as ValueProto
+from feast.value_type import ValueType
+
+VALUES = [
+    (ValueProto(bytes_val=b"\x00\x01"), ValueType.BYTES),
+    (ValueProto(string_val="naïve"), ValueType.STRING),
+    (ValueProto(int32_val=-5), ValueType.INT32),
+    (ValueProto(int64_val=2 ** 40), ValueType.INT64),
+    (ValueProto(double_val=1.5), ValueType.DOUBLE),
+    (ValueProto(float_val=0.25), ValueType.FLOAT),
+    (ValueProto(bool_val=True), ValueType.BOOL),
+    (ValueProto(unix_timestamp_val=1_600_000_000), ValueType.UNIX_TIMESTAMP),
+    (ValueProto(bytes_list_val=BytesList(val=[b"a", b""])), ValueType.BYTES_LIST),
+    (ValueProto(string_list_val=StringList(val=["a", "bcd"])), ValueType.STRING_LIST),
+    (ValueProto(int32_list_val=Int32List(val=[1, -2])), ValueType.INT32_LIST),
+    (ValueProto(int64_list_val=Int64List(val=[])), ValueType.INT64_LIST),
+    (ValueProto(double_list_val=DoubleList(val=[0.5, 2.0])), ValueType.DOUBLE_LIST),
+    (ValueProto(float_list_val=FloatList(val=[0.5])), ValueType.FLOAT_LIST),
+    (ValueProto(bool_list_val=BoolList(val=[True, False])), ValueType.BOOL_LIST),
+    (
+        ValueProto(unix_timestamp_list_val=Int64List(val=[1_600_000_000])),
+        ValueType.UNIX_TIMESTAMP_LIST,
+    ),
+    # Values which don't have the declared type of their feature, such as nulls, are kept as protos.
+    (ValueProto(), ValueType.DOUBLE),
+    (ValueProto(int64_val=3), ValueType.DOUBLE),
+]
+
+
+@pytest.mark.parametrize("value_encoding", [PROTO_ENCODING, TYPED_ENCODING])
+@pytest.mark.parametrize(
+    "value,value_type", VALUES, ids=[f"{i}" for i in range(len(VALUES))]
+)
+def test_value_encoding_round_trip(value, value_type, value_encoding):
+    assert (
+        deserialize_value(serialize_value(value, value_type, value_encoding)) == value
+    )
+
+
+def test_bulk_deserialization():
+    vals_bin = [
+        serialize_value(value, value_type, value_encoding)
+        for value_encoding in (PROTO_ENCODING, TYPED_ENCODING)
+        for value, value_type in VALUES
+    ]
+
+    assert deserialize_values(vals_bin) == [value for value, _ in VALUES] * 2
+
+
+def test_typed_encoding_of_numbers():
+    val_bin = serialize_value(
+        ValueProto(double_list_val=DoubleList(val=[0.5, 2.0])),
+        ValueType.DOUBLE_LIST,
+        TYPED_ENCODING,
+    )
+    # The values follow their type.
+    assert val_bin[1:] == struct.pack("<2d", 0.5, 2.0)
+
+    # Integers are stored in the narrowest width which holds them.
+    val_bin = serialize_value(
+        ValueProto(int64_list_val=Int64List(val=[1, -300])),
+        ValueType.INT64_LIST,
+        TYPED_ENCODING,
+    )
+    assert val_bin[1:] == b"\x02" + struct.pack("<2h", 1, -300)
+
+
+@pytest.mark.parametrize(
+    "value,value_type", VALUES, ids=[f"{i}" for i in range(len(VALUES))]
+)
+def test_typed_encoding_is_not_larger(value, value_type):
+    assert len(serialize_value(value, value_type, TYPED_ENCODING)) <= len(
+        serialize_value(value, value_type, PROTO_ENCODING)
+    )
+
+
+@pytest.mark.parametrize(
+    "value,value_type,size",
+    [
+        (ValueProto(int64_val=5), ValueType.INT64, 2),
+        (ValueProto(int64_val=-1), ValueType.INT64, 2),
+        (ValueProto(int32_val=1000), ValueType.INT32, 3),
+        (ValueProto(bool_val=True), ValueType.BOOL, 2),
+        (ValueProto(int64_list_val=Int64List(val=[1, 2, 3])), ValueType.INT64_LIST, 5),
+        (
+            ValueProto(string_list_val=StringList(val=["a", "b"])),
+            ValueType.STRING_LIST,
+            7,
+        ),
+    ],
+)
+def test_typed_encoding_size(value, value_type, size):
+    val_bin = serialize_value(value, value_type, TYPED_ENCODING)
+    assert len(val_bin) == size
+    assert val_bin != value.SerializeToString()
+
+
+def test_typed_encoding_falls_back_to_protos():
+    # Protobuf stores large positive integers in fewer bytes than their fixed width.
+    value = ValueProto(int64_val=2 ** 40)
+    assert serialize_value(value, ValueType.INT64, TYPED_ENCODING) == (
+        value.SerializeToString()
+    )
@@ -0,0 +1,139 @@
+import json
+from typing import Sequence
+from unittest.mock import MagicMock
+
+import pyarrow as pa
+import pytest
+from fastapi.testclient import TestClient
+
+from feast import FeatureStore, RepoConfig
+from feast.embedded_go.type_map import proto_to_arrow
+from feast.feature_server import get_app
+from feast.online_response import OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.protos.feast.types.Value_pb2 import (
+    BytesList,
+    Int64List,
+    RepeatedValue,
+    StringList,
+    Value,
+)
+from feast.value_type import ValueType
+
+
+def _repeated(*values: Value) -> Sequence[Value]:
+    return RepeatedValue(val=values).val
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        ([Value(int32_val=1), Value(int32_val=2)], pa.array([1, 2], pa.int32())),
+        ([Value(int64_val=1), Value(int64_val=2)], pa.array([1, 2], pa.int64())),
+        ([Value(float_val=0.5)], pa.array([0.5], pa.float32())),
+        ([Value(double_val=0.5)], pa.array([0.5], pa.float64())),
+        ([Value(bool_val=True)], pa.array([True], pa.bool_())),
+        ([Value(string_val="a")], pa.array(["a"], pa.string())),
+        ([Value(bytes_val=b"a")], pa.array([b"a"], pa.binary())),
+    ],
+)
+def testproto_to_arrow_scalar_types(values, expected):
+    assert proto_to_arrow(_repeated(*values)).equals(expected)
+
+
+def testproto_to_arrow_lists():
+    array = proto_to_arrow(
+        _repeated(
+            Value(int64_list_val=Int64List(val=[1, 2])),
+            Value(int64_list_val=Int64List(val=[])),
+        )
+    )
+    assert array.equals(pa.array([[1, 2], []], pa.list_(pa.int64())))
+
+    array = proto_to_arrow(
+        _repeated(
+            Value(string_list_val=StringList(val=["a"])),
+            Value(),
+            Value(string_list_val=StringList(val=["b", "c"])),
+        )
+    )
+    assert array.to_pylist() == [["a"], None, ["b", "c"]]
+
+    array = proto_to_arrow(_repeated(Value(bytes_list_val=BytesList(val=[b"a"]))))
+    assert array.type == pa.list_(pa.binary())
+
+
+def testproto_to_arrow_unix_timestamps():
+    array = proto_to_arrow(_repeated(Value(unix_timestamp_val=1_600_000_000)))
+    assert array.type == pa.time64("ns")
+    assert array.cast(pa.int64()).to_pylist() == [1_600_000_000]
+
+    array = proto_to_arrow(
+        _repeated(Value(unix_timestamp_list_val=Int64List(val=[1, 2])))
+    )
+    assert array.type == pa.list_(pa.time64("ns"))
+    assert array.cast(pa.list_(pa.int64())).to_pylist() == [[1, 2]]
+
+
+def testproto_to_arrow_nulls():
+    # Empty values and explicit nulls, e.g. JSON nulls, are both nulls.
+    array = proto_to_arrow(_repeated(Value(int64_val=1), Value(null_val=0), Value()))
+    assert array.equals(pa.array([1, None, None], pa.int64()))
+
+    array = proto_to_arrow(_repeated(Value(null_val=0), Value(null_val=0)))
+    assert array.equals(pa.nulls(2))
+
+    array = proto_to_arrow(_repeated(Value(null_val=0)), ValueType.STRING)
+    assert array.equals(pa.nulls(1, pa.string()))
+
+    with pytest.raises(TypeError):
+        proto_to_arrow(_repeated(Value(int64_val=1), Value(string_val="a")))
+
+
+def testproto_to_arrow_type_hint_casts():
+    # JSON requests always contain 64 bit integers.
+    array = proto_to_arrow(
+        _repeated(Value(int64_val=1), Value(null_val=0)), ValueType.INT32
+    )
+    assert array.equals(pa.array([1, None], pa.int32()))
+
+    array = proto_to_arrow(_repeated(Value(double_val=0.5)), ValueType.FLOAT)
+    assert array.equals(pa.array([0.5], pa.float32()))
+
+
+def test_http_requests_are_routed_to_go_server(tmp_path):
+    # The embedded Go feature server is only available when its library is built.
+    pytest.importorskip("feast.embedded_go.lib.embedded")
+
+    store = FeatureStore(
+        config=RepoConfig(
+            project="test",
+            provider="local",
+            registry=str(tmp_path / "registry.db"),
+            online_store={"path": str(tmp_path / "online_store.db")},
+            go_feature_server=True,
+        )
+    )
+    go_server = MagicMock()
+    go_server.get_online_features.return_value = OnlineResponse(
+        GetOnlineFeaturesResponse()
+    )
+    store._go_server = go_server
+    client = TestClient(get_app(store))
+
+    response = client.post(
+        "/get-online-features",
+        data=json.dumps(
+            {
+                "features": ["driver_stats:conv_rate"],
+                "entities": {"driver_id": [1001, None]},
+            }
+        ),
+    )
+
+    assert response.status_code == 200
+    kwargs = go_server.get_online_features.call_args.kwargs
+    assert kwargs["features_refs"] == ["driver_stats:conv_rate"]
+    driver_ids = kwargs["entities"]["driver_id"]
+    assert isinstance(driver_ids, RepeatedValue)
+    assert proto_to_arrow(driver_ids.val, ValueType.INT64).to_pylist() == [1001, None]
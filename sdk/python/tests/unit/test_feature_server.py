@@ -0,0 +1,156 @@
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+import pytest
+from anyio import to_thread
+from fastapi.testclient import TestClient
+
+from feast.feature_server import (
+    ARROW_STREAM_MEDIA_TYPE,
+    FEATURE_SERVER_REPO_PATH_ENV,
+    FEATURE_SERVER_THREADS_ENV,
+    PROTOBUF_MEDIA_TYPE,
+    get_app,
+    get_worker_app,
+)
+from feast.online_response import ArrowOnlineResponse, OnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import (
+    FieldStatus,
+    GetOnlineFeaturesRequest,
+    GetOnlineFeaturesResponse,
+)
+from feast.protos.feast.types.Value_pb2 import RepeatedValue, Value
+
+
+@pytest.fixture
+def client():
+    response = GetOnlineFeaturesResponse()
+    response.metadata.feature_names.val.extend(["driver_id", "conv_rate"])
+    response.results.add(
+        values=[Value(int64_val=1001), Value(int64_val=1002)],
+        statuses=[FieldStatus.PRESENT, FieldStatus.PRESENT],
+    )
+    response.results.add(
+        values=[Value(double_val=0.5), Value()],
+        statuses=[FieldStatus.PRESENT, FieldStatus.NOT_FOUND],
+    )
+    store = MagicMock()
+    store._get_online_features.return_value = OnlineResponse(response)
+    return TestClient(get_app(store))
+
+
+def _request_body() -> bytes:
+    request = GetOnlineFeaturesRequest()
+    request.features.val.append("driver_stats:conv_rate")
+    request.entities["driver_id"].CopyFrom(
+        RepeatedValue(val=[Value(int64_val=1001), Value(int64_val=1002)])
+    )
+    return request.SerializeToString()
+
+
+def test_protobuf_request_and_response(client):
+    response = client.post(
+        "/get-online-features",
+        data=_request_body(),
+        headers={"Content-Type": PROTOBUF_MEDIA_TYPE, "Accept": PROTOBUF_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == PROTOBUF_MEDIA_TYPE
+    response_proto = GetOnlineFeaturesResponse()
+    response_proto.ParseFromString(response.content)
+    assert list(response_proto.metadata.feature_names.val) == [
+        "driver_id",
+        "conv_rate",
+    ]
+    assert response_proto.results[1].values[0].double_val == 0.5
+
+
+def test_arrow_response(client):
+    response = client.post(
+        "/get-online-features",
+        data=_request_body(),
+        headers={
+            "Content-Type": PROTOBUF_MEDIA_TYPE,
+            "Accept": ARROW_STREAM_MEDIA_TYPE,
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    table = pa.ipc.open_stream(response.content).read_all()
+    # The statuses tell missing values apart from null values.
+    assert table.to_pydict() == {
+        "driver_id": [1001, 1002],
+        "driver_id__status": [FieldStatus.PRESENT, FieldStatus.PRESENT],
+        "conv_rate": [0.5, None],
+        "conv_rate__status": [FieldStatus.PRESENT, FieldStatus.NOT_FOUND],
+    }
+
+
+def test_arrow_response_of_go_feature_server():
+    record_batch = pa.RecordBatch.from_pydict(
+        {
+            "driver_id": pa.array([1001], pa.int64()),
+            "driver_id__status": pa.array([FieldStatus.PRESENT], pa.int32()),
+            "driver_id__timestamp": pa.array([0], pa.int64()),
+            "conv_rate": pa.array([None], pa.float64()),
+            "conv_rate__status": pa.array([FieldStatus.NOT_FOUND], pa.int32()),
+            "conv_rate__timestamp": pa.array([0], pa.int64()),
+        }
+    )
+    to_proto = MagicMock()
+    store = MagicMock()
+    store._get_online_features.return_value = ArrowOnlineResponse(
+        record_batch, to_proto
+    )
+    client = TestClient(get_app(store))
+
+    response = client.post(
+        "/get-online-features",
+        data=_request_body(),
+        headers={
+            "Content-Type": PROTOBUF_MEDIA_TYPE,
+            "Accept": ARROW_STREAM_MEDIA_TYPE,
+        },
+    )
+
+    assert response.status_code == 200
+    # The record batch of the Go feature server is served without converting it into protos.
+    to_proto.assert_not_called()
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.to_pydict() == {
+        "driver_id": [1001],
+        "driver_id__status": [FieldStatus.PRESENT],
+        "conv_rate": [None],
+        "conv_rate__status": [FieldStatus.NOT_FOUND],
+    }
+
+
+def test_thread_pool_size():
+    store = MagicMock()
+    with TestClient(get_app(store, threads=3)) as client:
+        assert (
+            client.portal.call(to_thread.current_default_thread_limiter).total_tokens
+            == 3
+        )
+
+
+def test_online_store_warm_up():
+    store = MagicMock()
+    with TestClient(get_app(store)):
+        store.warm_up_online_store.assert_called_once_with()
+
+
+def test_worker_app_loads_its_own_store(monkeypatch):
+    monkeypatch.setenv(FEATURE_SERVER_REPO_PATH_ENV, "/path/to/repo")
+    monkeypatch.setenv(FEATURE_SERVER_THREADS_ENV, "4")
+
+    with patch("feast.FeatureStore") as feature_store, patch(
+        "feast.feature_server.get_app"
+    ) as get_app_mock:
+        get_worker_app()
+
+    feature_store.assert_called_once_with(repo_path="/path/to/repo")
+    feature_store.return_value.refresh_registry.assert_called_once_with()
+    get_app_mock.assert_called_once_with(feature_store.return_value, 4)
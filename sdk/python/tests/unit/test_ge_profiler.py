@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from great_expectations.core import ExpectationSuite
+from great_expectations.dataset import PandasDataset
+
+from feast.dqm.profilers.ge_profiler import (
+    GEProfile,
+    GEProfiler,
+    _prepare_dataset,
+    _sample,
+    ge_profiler,
+)
+
+
+@ge_profiler(sample_size=100, stratify_by=["driver_id"])
+def max_trips_profiler(dataset: PandasDataset) -> ExpectationSuite:
+    dataset.expect_column_max_to_be_between("trips", 0, dataset["trips"].max())
+    return dataset.get_expectation_suite()
+
+
+def _dataset(rows: int) -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            # Driver 1 is far less common than driver 0.
+            "driver_id": (np.arange(rows) % 100 == 0).astype(int),
+            "trips": np.arange(rows),
+            "rate": np.ones(rows, dtype=np.float32),
+            "event_timestamp": pd.date_range(
+                "2021-01-01", periods=rows, freq="s", tz="UTC"
+            ),
+        }
+    )
+
+
+def test_prepare_dataset():
+    df = _dataset(3)
+    df["created"] = [datetime(2021, 1, 1) + timedelta(days=i) for i in range(3)]
+    df = df.astype({"created": object})
+    df.loc[1, "event_timestamp"] = pd.NaT
+
+    dataset = _prepare_dataset(df)
+
+    assert dataset["event_timestamp"].fillna("").tolist() == [
+        "2021-01-01T00:00:00",
+        "",
+        "2021-01-01T00:00:02",
+    ]
+    assert dataset["created"].tolist() == [
+        "2021-01-01T00:00:00",
+        "2021-01-02T00:00:00",
+        "2021-01-03T00:00:00",
+    ]
+    assert dataset["rate"].dtype == np.float64
+    # The original dataframe is not modified.
+    assert df["rate"].dtype == np.float32
+    assert str(df["event_timestamp"].dtype) == "datetime64[ns, UTC]"
+
+
+def test_stratified_sample():
+    df = _dataset(10_000)
+
+    assert _sample(df, None, None) is df
+    assert len(_sample(df, 100, None)) == 100
+
+    sample = _sample(df, 100, ["driver_id"])
+    assert sample["driver_id"].value_counts().to_dict() == {0: 99, 1: 1}
+    pd.testing.assert_frame_equal(sample, _sample(df, 100, ["driver_id"]))
+
+
+def test_sampled_profiling_and_validation():
+    df = _dataset(10_000)
+
+    profile = max_trips_profiler.analyze_dataset(df)
+    assert profile.sample_size == 100
+
+    report = profile.validate(df)
+    assert report.sample_size == 100
+    assert report.dataset_size == 10_000
+    assert '"sample_size": 100' in repr(report)
+
+
+def test_sampling_options_proto_round_trip():
+    profiler = GEProfiler.from_proto(max_trips_profiler.to_proto())
+    assert profiler.sample_size == 100
+    assert profiler.stratify_by == ["driver_id"]
+
+    profile = GEProfile.from_proto(
+        GEProfile(ExpectationSuite("suite"), sample_size=10).to_proto()
+    )
+    assert profile.sample_size == 10
+    assert profile.stratify_by is None
+
+
+@ge_profiler
+def batch_profiler(dataset: PandasDataset) -> ExpectationSuite:
+    dataset.expect_column_values_to_be_between("trips", 0, 9_600, mostly=0.95)
+    dataset.expect_column_values_to_not_be_null("trips")
+    dataset.expect_column_max_to_be_between("trips", 0, 10_000)
+    dataset.expect_column_mean_to_be_between("trips", 4_000, 5_000)
+    dataset.expect_table_row_count_to_be_between(5_000, 20_000)
+    dataset.expect_column_values_to_be_unique("trips")
+    return dataset.get_expectation_suite()
+
+
+def _validate_in_batches(profile: GEProfile, df: pd.DataFrame, batch_size: int):
+    validator = profile.batch_validator()
+    for start in range(0, len(df), batch_size):
+        validator.update(df.iloc[start : start + batch_size])
+    return validator.report()
+
+
+def test_batch_validation():
+    df = _dataset(10_000)
+    profile = batch_profiler.analyze_dataset(df)
+
+    full_report = profile.validate(df)
+    batch_report = _validate_in_batches(profile, df, batch_size=3_000)
+
+    assert batch_report.is_success
+    assert batch_report.dataset_size == 10_000
+    # GE runs the table expectations last.
+    full_results = {
+        r.expectation_config.expectation_type: r
+        for r in full_report._validation_result["results"]
+    }
+    for batch in batch_report._validation_result["results"]:
+        full = full_results[batch.expectation_config.expectation_type]
+        assert batch.success == full.success
+        for key in ("observed_value", "unexpected_count", "element_count"):
+            assert batch.result.get(key) == pytest.approx(full.result.get(key))
+
+    # Duplicates across batches are found, as are too many unexpected values and changes
+    # in the aggregates.
+    df = pd.concat([df, df.assign(trips=df["trips"] + 9_000)], ignore_index=True)
+    batch_report = _validate_in_batches(profile, df, batch_size=3_000)
+    failed = {e.check_name for e in batch_report.errors}
+    assert failed == {
+        "expect_column_values_to_be_between",
+        "expect_column_max_to_be_between",
+        "expect_column_mean_to_be_between",
+        "expect_column_values_to_be_unique",
+    }
@@ -0,0 +1,166 @@
+from collections import OrderedDict
+from datetime import timedelta
+from typing import Any, Dict, List
+
+import dill
+import pandas as pd
+import pytest
+
+from feast import Feature, FeatureView, FileSource, OnDemandFeatureView, ValueType
+from feast.data_source import RequestSource
+from feast.feature_store import FeatureStore
+from feast.on_demand_feature_view import PANDAS_MODE, PYTHON_MODE, _deserialize_udf
+from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+from feast.protos.feast.types.Value_pb2 import RepeatedValue, Value
+
+
+def _driver_stats_feature_view() -> FeatureView:
+    return FeatureView(
+        name="driver_stats",
+        entities=["driver"],
+        features=[Feature("conv_rate", ValueType.DOUBLE)],
+        ttl=timedelta(days=1),
+        batch_source=FileSource(path="driver_stats.parquet", timestamp_field="ts"),
+    )
+
+
+def _val_to_add_request_source() -> RequestSource:
+    return RequestSource(name="vals_to_add", schema={"val_to_add": ValueType.INT64})
+
+
+def conv_rate_plus_val_python(features: Dict[str, List[Any]]) -> Dict[str, List[Any]]:
+    return {
+        "conv_rate_plus_val": [
+            conv_rate + val
+            for conv_rate, val in zip(features["conv_rate"], features["val_to_add"])
+        ]
+    }
+
+
+def conv_rate_plus_val_pandas(features_df: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["conv_rate_plus_val"] = features_df["conv_rate"] + features_df["val_to_add"]
+    return df
+
+
+def _odfv(mode: str) -> OnDemandFeatureView:
+    return OnDemandFeatureView(
+        name="conv_rate_plus_val",
+        features=[Feature("conv_rate_plus_val", ValueType.DOUBLE)],
+        sources={
+            "driver_stats": _driver_stats_feature_view(),
+            "vals_to_add": _val_to_add_request_source(),
+        },
+        udf=conv_rate_plus_val_python
+        if mode == PYTHON_MODE
+        else conv_rate_plus_val_pandas,
+        mode=mode,
+    )
+
+
+def test_unknown_mode():
+    with pytest.raises(ValueError):
+        _odfv("spark")
+
+
+@pytest.mark.parametrize("mode", [PANDAS_MODE, PYTHON_MODE])
+def test_mode_proto_round_trip(mode):
+    odfv = _odfv(mode)
+    assert odfv.to_proto().spec.mode == mode
+
+    assert OnDemandFeatureView.from_proto(odfv.to_proto()).mode == mode
+
+
+def test_udf_is_deserialized_once_per_body():
+    proto = _odfv(PYTHON_MODE).to_proto()
+    first = OnDemandFeatureView.from_proto(proto)
+    second = OnDemandFeatureView.from_proto(proto)
+    assert first.udf is second.udf
+
+
+def test_udf_cache_is_bounded(monkeypatch):
+    udf_cache: OrderedDict = OrderedDict()
+    monkeypatch.setattr("feast.on_demand_feature_view._UDF_CACHE_SIZE", 2)
+    monkeypatch.setattr("feast.on_demand_feature_view._udf_cache", udf_cache)
+    udf_bodies = [dill.dumps(lambda x, i=i: x + i) for i in range(3)]
+
+    first = _deserialize_udf(udf_bodies[0])
+    _deserialize_udf(udf_bodies[1])
+    # Using the first udf again makes the second one the least recently used.
+    assert _deserialize_udf(udf_bodies[0]) is first
+    _deserialize_udf(udf_bodies[2])
+
+    assert len(udf_cache) == 2
+    assert _deserialize_udf(udf_bodies[0]) is first
+
+
+def test_empty_mode_in_proto_defaults_to_pandas():
+    proto = _odfv(PANDAS_MODE).to_proto()
+    proto.spec.ClearField("mode")
+    assert OnDemandFeatureView.from_proto(proto).mode == PANDAS_MODE
+
+
+@pytest.mark.parametrize("full_feature_names", [True, False])
+def test_python_mode_transformation(full_feature_names):
+    odfv = _odfv(PYTHON_MODE)
+    conv_rate_ref = "driver_stats__conv_rate" if full_feature_names else "conv_rate"
+    output_ref = (
+        "conv_rate_plus_val__conv_rate_plus_val"
+        if full_feature_names
+        else "conv_rate_plus_val"
+    )
+    features = {conv_rate_ref: [0.5, 1.5], "val_to_add": [1, 2]}
+
+    transformed = odfv.get_transformed_features_dict(features, full_feature_names)
+
+    assert transformed == {output_ref: [1.5, 3.5]}
+    # The input is not modified.
+    assert list(features.keys()) == [conv_rate_ref, "val_to_add"]
+
+    # Historical retrieval applies the same definition to dataframes.
+    df = pd.DataFrame(features, index=[3, 4])
+    transformed_df = odfv.get_transformed_features_df(df, full_feature_names)
+    pd.testing.assert_frame_equal(
+        transformed_df, pd.DataFrame({output_ref: [1.5, 3.5]}, index=[3, 4])
+    )
+
+
+def test_dict_transformation_requires_python_mode():
+    with pytest.raises(ValueError):
+        _odfv(PANDAS_MODE).get_transformed_features_dict(
+            {"conv_rate": [0.5], "val_to_add": [1]}
+        )
+
+
+@pytest.mark.parametrize("mode", [PANDAS_MODE, PYTHON_MODE])
+def test_infer_features(mode):
+    odfv = _odfv(mode)
+    odfv.features = []
+    odfv.infer_features()
+    assert odfv.features == [Feature("conv_rate_plus_val", ValueType.DOUBLE)]
+
+
+@pytest.mark.parametrize("mode", [PANDAS_MODE, PYTHON_MODE])
+def test_augment_online_response(mode):
+    response = GetOnlineFeaturesResponse(results=[])
+    response.metadata.feature_names.val.extend(["conv_rate", "val_to_add"])
+    response.results.append(
+        GetOnlineFeaturesResponse.FeatureVector(
+            values=RepeatedValue(val=[Value(double_val=0.5), Value(double_val=1.5)]).val
+        )
+    )
+    response.results.append(
+        GetOnlineFeaturesResponse.FeatureVector(
+            values=RepeatedValue(val=[Value(int64_val=1), Value(int64_val=2)]).val
+        )
+    )
+
+    FeatureStore._augment_response_with_on_demand_transforms(
+        response,
+        ["conv_rate_plus_val:conv_rate_plus_val"],
+        [_odfv(mode)],
+        full_feature_names=False,
+    )
+
+    assert response.metadata.feature_names.val[-1] == "conv_rate_plus_val"
+    assert [v.double_val for v in response.results[-1].values] == [1.5, 3.5]
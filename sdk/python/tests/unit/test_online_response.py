@@ -0,0 +1,58 @@
+from datetime import datetime, timezone
+
+import pyarrow as pa
+
+from feast.feature_view import DUMMY_ENTITY_ID
+from feast.online_response import ArrowOnlineResponse
+from feast.protos.feast.serving.ServingService_pb2 import GetOnlineFeaturesResponse
+
+TIMESTAMP = 1_600_000_000
+
+
+def _columns(name, values, type):
+    """Returns the columns of a feature, the way the embedded Go feature server does."""
+    return {
+        name: pa.array(values, type),
+        f"{name}__status": pa.array([1] * len(values), pa.int32()),
+        f"{name}__timestamp": pa.array([TIMESTAMP] * len(values), pa.int64()),
+    }
+
+
+def _record_batch() -> pa.RecordBatch:
+    columns = {
+        **_columns(DUMMY_ENTITY_ID, ["", ""], pa.string()),
+        **_columns("driver_id", [1, 2], pa.int64()),
+        **_columns("rating", [4.5, None], pa.float32()),
+        **_columns("last_trip", [TIMESTAMP, TIMESTAMP], pa.int64()),
+        **_columns("trip_ids", [[1, 2], []], pa.list_(pa.int64())),
+        **_columns("missing", [None, None], pa.null()),
+    }
+    columns["last_trip"] = columns["last_trip"].cast(pa.time64("ns"))
+    return pa.RecordBatch.from_arrays(list(columns.values()), names=list(columns))
+
+
+def test_arrow_online_response():
+    protos = []
+
+    def to_proto(record_batch):
+        protos.append(record_batch)
+        return GetOnlineFeaturesResponse()
+
+    response = ArrowOnlineResponse(_record_batch(), to_proto)
+
+    assert response.to_dict() == {
+        "driver_id": [1, 2],
+        "rating": [4.5, None],
+        "last_trip": [datetime.fromtimestamp(TIMESTAMP, tz=timezone.utc)] * 2,
+        "trip_ids": [[1, 2], []],
+        "missing": [None, None],
+    }
+    df = response.to_df(include_event_timestamps=True)
+    assert df["driver_id__ts"].tolist() == [TIMESTAMP] * 2
+    assert str(df["last_trip"].dtype) == "datetime64[ns, UTC]"
+    # The features are only converted into protos when the proto is accessed.
+    assert protos == []
+
+    assert response.proto == response.proto
+    assert len(protos) == 1
+    assert DUMMY_ENTITY_ID not in protos[0].schema.names
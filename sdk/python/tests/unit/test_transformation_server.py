@@ -0,0 +1,82 @@
+from unittest.mock import MagicMock
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from feast import Feature, OnDemandFeatureView, ValueType
+from feast.data_source import RequestSource
+from feast.on_demand_feature_view import PANDAS_MODE, PYTHON_MODE
+from feast.protos.feast.serving.TransformationService_pb2 import (
+    TransformFeaturesRequest,
+)
+from feast.protos.feast.serving.TransformationService_pb2 import (
+    ValueType as TransformationValueType,
+)
+from feast.transformation_server import TransformationServer, transform_arrow
+
+
+def plus_one_pandas(features_df: pd.DataFrame) -> pd.DataFrame:
+    df = pd.DataFrame()
+    df["val_plus_one"] = features_df["val"] + 1
+    return df
+
+
+def plus_one_python(features):
+    return {"val_plus_one": [val + 1 for val in features["val"]]}
+
+
+def _odfv(mode: str) -> OnDemandFeatureView:
+    return OnDemandFeatureView(
+        name="plus_one",
+        features=[Feature("val_plus_one", ValueType.INT64)],
+        sources={"vals": RequestSource(name="vals", schema={"val": ValueType.INT64})},
+        udf=plus_one_python if mode == PYTHON_MODE else plus_one_pandas,
+        mode=mode,
+    )
+
+
+def _serialize(table: pa.Table, use_stream: bool) -> bytes:
+    sink = pa.BufferOutputStream()
+    if use_stream:
+        writer = pa.ipc.new_stream(sink, table.schema)
+    else:
+        writer = pa.ipc.new_file(sink, table.schema)
+    writer.write_table(table)
+    writer.close()
+    return sink.getvalue().to_pybytes()
+
+
+@pytest.mark.parametrize("mode", [PANDAS_MODE, PYTHON_MODE])
+@pytest.mark.parametrize("use_stream", [True, False])
+def test_transform_arrow(mode, use_stream):
+    arrow_input = _serialize(pa.table({"val": [1, 2, 3]}), use_stream)
+
+    arrow_output = transform_arrow(_odfv(mode), arrow_input)
+
+    # The response uses the same IPC format as the request.
+    if use_stream:
+        result = pa.ipc.open_stream(arrow_output).read_all()
+    else:
+        result = pa.ipc.open_file(arrow_output).read_all()
+    assert result.to_pydict() == {"plus_one__val_plus_one": [2, 3, 4]}
+
+
+def test_transform_features_uses_registry_cache():
+    fs = MagicMock()
+    fs.get_on_demand_feature_view.return_value = _odfv(PYTHON_MODE)
+    server = TransformationServer(fs)
+
+    request = TransformFeaturesRequest(
+        on_demand_feature_view_name="plus_one",
+        transformation_input=TransformationValueType(
+            arrow_value=_serialize(pa.table({"val": [1]}), use_stream=True)
+        ),
+    )
+    response = server.TransformFeatures(request, MagicMock())
+
+    fs.get_on_demand_feature_view.assert_called_once_with(
+        "plus_one", allow_registry_cache=True
+    )
+    result = pa.ipc.open_stream(response.transformation_output.arrow_value).read_all()
+    assert result.to_pydict() == {"plus_one__val_plus_one": [2]}
@@ -0,0 +1,81 @@
+from datetime import datetime
+
+import dask.dataframe as dd
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+from pytz import timezone, utc
+
+from feast.type_map import python_values_to_proto_values
+from feast.utils import make_series_tzaware, to_epoch_seconds, to_naive_utc_datetimes
+from feast.value_type import ValueType
+
+NAIVE = datetime(2021, 1, 1, 12)
+EASTERN = timezone("US/Eastern").localize(datetime(2021, 1, 1, 7))
+
+
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([NAIVE, NAIVE]),
+        pd.Series([EASTERN, EASTERN]),
+        pd.Series([NAIVE, EASTERN], dtype=object),
+    ],
+    ids=["naive", "tz_aware", "mixed"],
+)
+@pytest.mark.parametrize("use_dask", [True, False])
+def test_make_series_tzaware(series, use_dask):
+    if use_dask:
+        series = dd.from_pandas(series, npartitions=1)
+
+    result = make_series_tzaware(series)
+    if use_dask:
+        result = result.compute()
+
+    assert str(result.dtype) == "datetime64[ns, UTC]"
+    assert result.tolist() == [pd.Timestamp(NAIVE, tz=utc)] * 2
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        pa.array([EASTERN, None], type=pa.timestamp("us", tz="US/Eastern")),
+        pa.array([NAIVE, None], type=pa.timestamp("ns")),
+        np.array([np.datetime64(NAIVE), np.datetime64("NaT")]),
+        [EASTERN, None],
+    ],
+    ids=["arrow_tz_aware", "arrow_naive", "numpy", "python"],
+)
+def test_timestamp_array_conversions(values):
+    assert to_naive_utc_datetimes(values) == [NAIVE, None]
+    assert to_epoch_seconds(values)[0] == int(utc.localize(NAIVE).timestamp())
+
+
+def test_unix_timestamp_proto_values():
+    # Tz-naive timestamps are assumed to be UTC, regardless of the local time zone.
+    for values in ([NAIVE, EASTERN], np.array([NAIVE, NAIVE], dtype="datetime64[ns]")):
+        protos = python_values_to_proto_values(values, ValueType.UNIX_TIMESTAMP)
+        assert [p.unix_timestamp_val for p in protos] == [1609502400] * 2
+
+
+def test_unix_timestamp_proto_values_of_mixed_types():
+    # The slow path for timestamps mixed with other types treats tz-naive timestamps the same.
+    protos = python_values_to_proto_values(
+        [NAIVE, 1609502400], ValueType.UNIX_TIMESTAMP
+    )
+    assert [p.unix_timestamp_val for p in protos] == [1609502400] * 2
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [NAIVE, pd.NaT],
+        np.array([np.datetime64(NAIVE), np.datetime64("NaT")]),
+        [NAIVE, pd.NaT, 1609502400],
+    ],
+    ids=["python", "numpy", "mixed"],
+)
+def test_unix_timestamp_proto_values_reject_nat(values):
+    with pytest.raises(ValueError):
+        python_values_to_proto_values(values, ValueType.UNIX_TIMESTAMP)
@@ -1,12 +1,22 @@
 from datetime import datetime
+from typing import Any, Dict, List, Optional
 
 import boto3
 
-from feast import utils
+from feast import Feature, FeatureView, RepoConfig, ValueType, utils
+from feast.infra.offline_stores.file_source import FileSource
 from feast.infra.online_stores.helpers import compute_entity_id
+from feast.infra.online_stores.online_store import OnlineStore
 from feast.protos.feast.types.EntityKey_pb2 import EntityKey as EntityKeyProto
 from feast.protos.feast.types.Value_pb2 import Value as ValueProto
 
+DRIVER_STATS_FEATURE_VIEW = FeatureView(
+    name="driver_stats",
+    entities=["driver_id"],
+    features=[Feature("rating", ValueType.DOUBLE), Feature("trips", ValueType.INT64),],
+    batch_source=FileSource(path="unused.parquet", timestamp_field="ts"),
+)
+
 
 def _create_n_customer_test_samples(n=10):
     return [
@@ -54,3 +64,44 @@ def _insert_data_test_table(data, project, tbl_name, region):
                     "values": {k: v.SerializeToString() for k, v in features.items()},
                 }
             )
+
+
+def _create_local_repo_config(tmp_path, online_store: Dict[str, Any]) -> RepoConfig:
+    return RepoConfig(
+        project="test",
+        provider="local",
+        registry=str(tmp_path / "registry.db"),
+        online_store=online_store,
+    )
+
+
+def _create_driver_entity_key(driver_id: int) -> EntityKeyProto:
+    return EntityKeyProto(
+        join_keys=["driver_id"], entity_values=[ValueProto(int64_val=driver_id)]
+    )
+
+
+def _create_driver_stats_row(driver_id: int, trips: int):
+    return (
+        _create_driver_entity_key(driver_id),
+        {
+            "rating": ValueProto(double_val=driver_id / 2),
+            "trips": ValueProto(int64_val=trips),
+        },
+        datetime(2021, 1, driver_id),
+        None,
+    )
+
+
+def _read_driver_stats(
+    store: OnlineStore,
+    config: RepoConfig,
+    requested_features: Optional[List[str]] = None,
+):
+    """Reads the driver stats of the drivers 2, 3 and 1, in this order."""
+    return store.online_read(
+        config,
+        DRIVER_STATS_FEATURE_VIEW,
+        [_create_driver_entity_key(driver_id) for driver_id in (2, 3, 1)],
+        requested_features,
+    )